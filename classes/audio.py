@@ -0,0 +1,148 @@
+# audio.py
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+import numpy as np
+import sounddevice as sd
+
+SAMPLE_RATE = 44100
+BEEP_FREQUENCY = 440
+
+# Beep-urile programate care au întârziat mai mult de atât nu se mai redau
+STALE_BEEP_SECONDS = 0.25
+
+class AudioEngine:
+    """
+    Redă beep-urile cronometrului printr-un singur stream de ieșire deschis pe toată durata aplicației.
+    Formele de undă se sintetizează o singură dată; redarea doar pune un buffer gata făcut în coadă.
+    """
+
+    def __init__(self, durations, sample_rate=SAMPLE_RATE, frequency=BEEP_FREQUENCY):
+        self.sample_rate = sample_rate
+        self.stream = None
+
+        # Cache cu sinusoidele pentru fiecare durată folosită de cronometru
+        self.buffers = {duration: self._synthesize(duration, frequency) for duration in durations}
+
+        # Buffere noi puse de thread-ul Tk; callback-ul audio le preia
+        self._pending = deque()
+
+        # Beep-uri programate pe ceasul dispozitivului: heap de (timp DAC, ordine, buffer, proprietar)
+        self._scheduled = []
+        self._schedule_lock = threading.Lock()
+        self._order = itertools.count()
+
+        # Voci active în callback: [buffer, poziție curentă]; o poziție negativă
+        # înseamnă că beep-ul începe la acel offset în interiorul blocului curent
+        self._voices = []
+
+    def _synthesize(self, duration, frequency):
+        t = np.arange(int(self.sample_rate * duration)) / self.sample_rate
+        return np.sin(2 * np.pi * frequency * t).astype(np.float32)
+
+    def start(self):
+        """Deschide stream-ul de ieșire; se apelează o dată, la pornirea aplicației."""
+        if self.stream is not None:
+            return
+
+        try:
+            self.stream = sd.OutputStream(
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype="float32",
+                latency="low",
+                callback=self._callback
+            )
+            self.stream.start()
+            logging.debug(f"Stream audio pornit (latență {self.stream.latency:.3f} s).")
+        except Exception as e:
+            logging.error(f"Nu s-a putut deschide stream-ul audio: {e}")
+            self.stream = None
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def play(self, duration):
+        """Pune în coadă beep-ul pre-sintetizat pentru `duration` secunde."""
+        buffer = self.buffers.get(duration)
+        if buffer is None:
+            logging.warning(f"Nu există beep pre-sintetizat pentru {duration} s.")
+            return
+
+        if self.stream is None:
+            # Fără stream deschis (ex. dispozitiv lipsă la pornire) redăm direct
+            sd.play(buffer, self.sample_rate)
+            return
+
+        self._pending.append(buffer)
+
+    def schedule(self, duration, at, owner=None):
+        """
+        Programează beep-ul de `duration` secunde la momentul monoton `at`.
+        Momentul e convertit pe ceasul dispozitivului, iar callback-ul audio îl mixează
+        la offset-ul exact de eșantion, indiferent de ce face thread-ul Tk.
+        `owner` (motorul care l-a programat) permite anularea doar a beep-urilor lui, când
+        mai multe concursuri împart stream-ul.
+        Returnează False dacă nu există stream deschis (apelantul redă beep-ul la tick).
+        """
+        buffer = self.buffers.get(duration)
+        if buffer is None or self.stream is None:
+            return False
+
+        device_time = self.stream.time + (at - time.monotonic())
+        with self._schedule_lock:
+            heapq.heappush(self._scheduled, (device_time, next(self._order), buffer, owner))
+        return True
+
+    def cancel_scheduled(self, owner=None):
+        """Anulează beep-urile programate care nu au început încă: ale lui `owner` sau, fără el, toate."""
+        with self._schedule_lock:
+            if owner is None:
+                self._scheduled.clear()
+                return
+            self._scheduled = [entry for entry in self._scheduled if entry[3] is not owner]
+            heapq.heapify(self._scheduled)
+
+    def _take_due(self, block_start, block_end):
+        """Mută în voci beep-urile programate care încep în blocul [block_start, block_end)."""
+        with self._schedule_lock:
+            while self._scheduled and self._scheduled[0][0] < block_end:
+                device_time, _, buffer, _ = heapq.heappop(self._scheduled)
+                if device_time < block_start - STALE_BEEP_SECONDS:
+                    continue
+                offset = max(0, round((device_time - block_start) * self.sample_rate))
+                self._voices.append([buffer, -offset])
+
+    def _callback(self, outdata, frames, time_info, status):
+        if status:
+            logging.debug(f"Audio callback status: {status}")
+
+        outdata.fill(0)
+        while self._pending:
+            self._voices.append([self._pending.popleft(), 0])
+
+        if self._scheduled:
+            block_start = time_info.outputBufferDacTime
+            self._take_due(block_start, block_start + frames / self.sample_rate)
+
+        out = outdata[:, 0]
+        # Parcurgem invers ca să putem scoate vocile terminate pe loc
+        for index in range(len(self._voices) - 1, -1, -1):
+            voice = self._voices[index]
+            buffer, position = voice
+            start = max(0, -position)
+            source = max(0, position)
+            count = min(frames - start, len(buffer) - source)
+            if count > 0:
+                out[start:start + count] += buffer[source:source + count]
+            voice[1] = position + frames
+            if voice[1] >= len(buffer):
+                del self._voices[index]
+
+        np.clip(outdata, -1.0, 1.0, out=outdata)
@@ -0,0 +1,98 @@
+# auto_scroller.py
+
+from app.config import Config
+from app.classes.contest_engine import MonotonicClock
+
+class AutoScroller:
+    """
+    Derularea automată sus-jos a clasamentului de pe proiector.
+    Viteza e în pixeli pe secundă după ceasul monoton, deci nu depinde de lungimea listei
+    sau de cât de des ajunge Tk să ruleze pasul; pasul se rărește când bucla e în urmă.
+    Când totul încape pe ecran, derularea stă (o verificare rară sau `wake()` o repornește),
+    iar sus și jos se oprește câteva secunde.
+    """
+
+    FRAME_SECONDS = 1 / 30       # pasul normal
+    MAX_FRAME_SECONDS = 0.25     # pasul cel mai rar, când bucla Tk e mult în urmă
+    IDLE_SECONDS = 1.0           # cât de des se verifică o listă care încape pe ecran
+    MAX_ELAPSED = 0.5            # după o blocare lungă nu se sare peste o bucată de listă
+
+    def __init__(self, widget, table, speed=None, dwell_top=None, dwell_bottom=None, clock=None):
+        self.widget = widget
+        self.table = table
+        self.speed = speed if speed is not None else Config.RANKINGS["scroll_speed"]
+        self.dwell_top = dwell_top if dwell_top is not None else Config.RANKINGS["scroll_dwell_top"]
+        self.dwell_bottom = dwell_bottom if dwell_bottom is not None else Config.RANKINGS["scroll_dwell_bottom"]
+        self.clock = clock or MonotonicClock()
+        self.direction = 1           # 1 = în jos, -1 = în sus
+        self.frame_seconds = self.FRAME_SECONDS
+        self.dwell_until = None
+        self.last = None             # momentul pasului anterior
+        self.expected = None         # când ar fi trebuit să ruleze pasul curent
+        self.after_id = None
+
+    def start(self):
+        self.stop()
+        self.last = None
+        self.dwell_until = self.clock.now() + self.dwell_top if self.table.at_top else None
+        self._schedule(self.dwell_top if self.dwell_until is not None else 0)
+
+    def stop(self):
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+    def wake(self):
+        """Lista s-a schimbat: dacă derularea stătea pentru că totul încăpea, pornește acum."""
+        if self.after_id is not None and self.last is None and self.dwell_until is None:
+            self.stop()
+            self._schedule(0)
+
+    def _schedule(self, seconds):
+        self.expected = self.clock.now() + seconds
+        self.after_id = self.widget.after(int(seconds * 1000), self._step)
+
+    def _step(self):
+        self.after_id = None
+        now = self.clock.now()
+        table = self.table
+
+        # Totul încape: nimic de derulat, doar o verificare rară
+        if table.max_top <= 0:
+            self.last = None
+            self.dwell_until = None
+            self._schedule(self.IDLE_SECONDS)
+            return
+
+        # Oprire sus/jos
+        if self.dwell_until is not None:
+            if now < self.dwell_until:
+                self._schedule(self.dwell_until - now)
+                return
+            self.dwell_until = None
+            self.last = None
+
+        # Bucla Tk în urmă față de pasul cerut: pași mai rari; altfel revine treptat la normal
+        lag = now - self.expected
+        if lag > self.frame_seconds:
+            self.frame_seconds = min(self.frame_seconds * 2, self.MAX_FRAME_SECONDS)
+        elif lag < self.frame_seconds / 4:
+            self.frame_seconds = max(self.frame_seconds * 0.9, self.FRAME_SECONDS)
+
+        if self.last is not None:
+            elapsed = min(now - self.last, self.MAX_ELAPSED)
+            table.scroll_by(self.direction * elapsed * self.speed / table.row_height)
+        self.last = now
+
+        if self.direction > 0 and table.at_bottom:
+            self.direction = -1
+            self._dwell(now, self.dwell_bottom)
+        elif self.direction < 0 and table.at_top:
+            self.direction = 1
+            self._dwell(now, self.dwell_top)
+        else:
+            self._schedule(self.frame_seconds)
+
+    def _dwell(self, now, seconds):
+        self.dwell_until = now + seconds
+        self._schedule(seconds)
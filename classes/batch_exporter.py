@@ -0,0 +1,82 @@
+# batch_exporter.py
+
+import os
+import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from app.classes.pdf_exporter import PdfExporter
+from app.classes.excel_exporter import ExcelExporter
+from app.classes.export_cache import ExportCache
+
+EXPORTERS = {".pdf": PdfExporter, ".xlsx": ExcelExporter}
+
+
+def render(snapshot, filepath, cache_folder=None):
+    """
+    Un fișier din lot; la nivel de modul ca să poată fi trimis unui proces din pool.
+    `snapshot` poate fi și o listă (caietul Excel cu câte o foaie pe categorie).
+    Categoriile neschimbate de la lotul anterior vin din ExportCache.
+    """
+    extension = os.path.splitext(filepath)[1]
+    return ExportCache(cache_folder).write(EXPORTERS[extension](), snapshot, filepath)
+
+
+class BatchExporter:
+    """
+    Pachetul de rezultate de la finalul zilei: pentru fiecare categorie, PDF și Excel scrise în
+    paralel într-un pool de procese, în același dosar, cu nume stabile (`<categorie>-<tip>.pdf`),
+    plus `Rezultate.xlsx` cu toate categoriile, câte o foaie.
+    Procesele pornesc cu „spawn”, fără să moștenească starea Tk a aplicației.
+    Sub `serial_rows` rânduri în total, pornirea pool-ului (importul reportlab / openpyxl în
+    fiecare proces) costă mai mult decât exportul, așa că fișierele se scriu pe firul curent.
+    """
+
+    SUMMARY_NAME = "Rezultate.xlsx"
+    SERIAL_ROWS = 1000
+
+    def __init__(self, max_workers=None, extensions=(".pdf", ".xlsx"), summary=True, cache_folder=None,
+                 serial_rows=SERIAL_ROWS):
+        self.max_workers = max_workers
+        self.serial_rows = serial_rows
+        self.extensions = extensions
+        self.summary = summary
+        self.cache_folder = cache_folder   # implicit Config.PATHS["export_cache"]
+
+    @staticmethod
+    def file_name(category, contest_type):
+        return re.sub(r"[^\w-]+", "_", f"{category}-{contest_type}")
+
+    def jobs(self, snapshots, folder):
+        """[(snapshot, cale)] pentru {nume de fișier: snapshot}, în ordinea numelor."""
+        jobs = [
+            (snapshots[name], os.path.join(folder, name + extension))
+            for name in sorted(snapshots)
+            for extension in self.extensions
+        ]
+        if self.summary and snapshots:
+            jobs.append(([snapshots[name] for name in sorted(snapshots)], os.path.join(folder, self.SUMMARY_NAME)))
+        return jobs
+
+    def write(self, snapshots, folder, progress=None):
+        """Scrie toate fișierele și întoarce căile lor, sortate; `progress(scrise, total)` după fiecare."""
+        os.makedirs(folder, exist_ok=True)
+        jobs = self.jobs(snapshots, folder)
+        if not jobs:
+            return []
+
+        written = []
+        if sum(len(snapshot) for snapshot in snapshots.values()) < self.serial_rows:
+            for snapshot, filepath in jobs:
+                written.append(render(snapshot, filepath, self.cache_folder))
+                if progress:
+                    progress(len(written), len(jobs))
+            return sorted(written)
+
+        workers = min(self.max_workers or os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(render, snapshot, filepath, self.cache_folder) for snapshot, filepath in jobs]
+            for future in as_completed(futures):
+                written.append(future.result())
+                if progress:
+                    progress(len(written), len(jobs))
+        return sorted(written)
@@ -0,0 +1,222 @@
+# canvas_rankings_table.py
+
+import tkinter as tk
+from tkinter import font as tkfont
+from app.classes.virtual_rankings_table import VirtualRankingsTable
+from app.classes.rankings_table import CELL_WIDTH, CELL_HEIGHT
+
+PADDING_X = 20
+PADDING_Y = 5
+
+class CanvasRow:
+    """Item-urile de pe canvas ale unui rând și ce s-a desenat ultima dată în ele."""
+
+    def __init__(self, tag):
+        self.tag = tag
+        self.items = {}    # "rank"/"name"/"club"/"total" -> id-ul textului
+        self.cells = []    # (chenar, fundal, text) pentru fiecare traseu
+        self.visible = True
+        self.painted = {}
+
+
+class CanvasRankingsTable(VirtualRankingsTable):
+    """
+    Alternativa pe un singur widget pentru clasamentul live: antetul și rândurile sunt item-uri
+    (text și dreptunghiuri) etichetate pe un tk.Canvas. Item-urile se creează o dată pe rând
+    vizibil și se refolosesc la actualizări și la derulare; lățimile textelor măsurate se țin
+    în cache, iar coloanele se re-așază doar când un text nou nu mai încape.
+    Paginarea și derularea sunt cele din VirtualRankingsTable; în plus, rândurile se mută în sus
+    cu fracțiunea de rând din `top` (canvas.move), așa că derularea automată e lină, nu rând cu rând.
+    Antetul are fundal propriu și stă deasupra rândurilor care trec pe sub el.
+    """
+
+    def __init__(self, parent, fonts, blue_color, overscan=2, yscrollcommand=None):
+        canvas = tk.Canvas(parent, bg="black", highlightthickness=0)
+        canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas = canvas
+        self._fonts = {}          # font -> tkfont.Font, pentru măsurători
+        self._text_widths = {}    # (font, text) -> lățime în pixeli
+        self.widths = {}          # coloană -> lățimea ei
+        self.header_items = {}
+        self.header_background = None
+        self.pixel_offset = 0     # cu cât sunt mutate acum rândurile în sus, în pixeli
+        super().__init__(canvas, fonts, blue_color, overscan=overscan, yscrollcommand=yscrollcommand)
+
+        cell_font = self._font(self.fonts["cell"])
+        self.row_height = max(cell_font.metrics("linespace"), CELL_HEIGHT) + 2 * PADDING_Y
+        self.header_height = self._font(self.fonts["header"]).metrics("linespace") + 2 * PADDING_Y
+
+    #------------------------------
+    # Măsurători
+
+    def _font(self, spec):
+        if spec not in self._fonts:
+            self._fonts[spec] = tkfont.Font(root=self.canvas, font=spec)
+        return self._fonts[spec]
+
+    def measure(self, text, spec):
+        key = (spec, text)
+        width = self._text_widths.get(key)
+        if width is None:
+            width = self._text_widths[key] = self._font(spec).measure(text)
+        return width
+
+    def columns(self):
+        return ["rank", "name", "club"] + list(range(len(self.routes))) + ["total"]
+
+    #------------------------------
+    # Desen
+
+    def _reset(self, routes):
+        """Traseele s-au schimbat: se redesenează antetul, iar rândurile se recreează la nevoie."""
+        self.canvas.delete("all")
+        self.routes = routes
+        self.slots = []
+
+        header_font = self.fonts["header"]
+        titles = {"rank": "Rank", "name": "Competitor", "club": "Club", "total": "Total Points"}
+        titles.update({j: route for j, route in enumerate(routes)})
+        self.header_items = {}
+        self.widths = {}
+        self.pixel_offset = 0
+        self.header_background = self.canvas.create_rectangle(0, 0, 0, 0, fill="black", outline="", tags=("header",))
+        for column in self.columns():
+            self.header_items[column] = self.canvas.create_text(
+                0, 0, text=titles[column], font=header_font, fill="white", tags=("header",)
+            )
+            minimum = CELL_WIDTH if isinstance(column, int) else 0
+            self.widths[column] = max(minimum, self.measure(titles[column], header_font))
+        self._layout()
+
+    def _create_slot(self, k):
+        row = CanvasRow(f"slot{k}")
+        text_font = self.fonts["cell"]
+        for key in ("rank", "name", "club", "total"):
+            row.items[key] = self.canvas.create_text(0, 0, text="", font=text_font, fill="white", tags=("row", row.tag))
+        for _ in self.routes:
+            box = self.canvas.create_rectangle(0, 0, 0, 0, outline="gray", tags=("row", row.tag))
+            fill = self.canvas.create_rectangle(0, 0, 0, 0, outline="", state="hidden", tags=("row", row.tag, "fill"))
+            text = self.canvas.create_text(0, 0, text="", font=text_font, fill="black", tags=("row", row.tag))
+            row.cells.append((box, fill, text))
+        self._place_slot(k, row)
+        self.canvas.tag_raise("header")
+        return row
+
+    def _layout(self):
+        """Poziția fiecărei coloane din lățimile curente; mută antetul și toate rândurile existente."""
+        x = PADDING_X
+        self.x = {}
+        for column in self.columns():
+            self.x[column] = x
+            x += self.widths[column] + PADDING_X
+
+        y = self.header_height / 2
+        self.canvas.coords(self.header_background, 0, 0, x, self.header_height)
+        for column, item in self.header_items.items():
+            self.canvas.coords(item, *self._text_anchor(column, y))
+            self.canvas.itemconfig(item, anchor="w" if column in ("name", "club") else "center")
+        for k, row in enumerate(self.slots):
+            self._place_slot(k, row)
+
+    def _text_anchor(self, column, y):
+        if column in ("name", "club"):
+            return self.x[column], y
+        return self.x[column] + self.widths[column] / 2, y
+
+    def _place_slot(self, k, row):
+        top = self.header_height + k * self.row_height - self.pixel_offset
+        y = top + self.row_height / 2
+        for key, item in row.items.items():
+            self.canvas.coords(item, *self._text_anchor(key, y))
+            self.canvas.itemconfig(item, anchor="w" if key in ("name", "club") else "center")
+        for j, (box, fill, text) in enumerate(row.cells):
+            left = self.x[j] + (self.widths[j] - CELL_WIDTH) / 2
+            self.canvas.coords(box, left, y - CELL_HEIGHT / 2, left + CELL_WIDTH, y + CELL_HEIGHT / 2)
+            self.canvas.coords(text, left + CELL_WIDTH / 2, y)
+        # Fundalurile depind de scor: se redesenează la următorul _fill
+        row.painted = {}
+
+    def _paint(self):
+        self.first = first = int(self.top)
+        rows = self.ranking[first:first + self.visible_rows + self.overscan]
+        while len(self.slots) < len(rows):
+            self.slots.append(self._create_slot(len(self.slots)))
+
+        grown = False
+        for k, row in enumerate(self.slots):
+            if k >= len(rows):
+                if row.visible:
+                    self.canvas.itemconfig(row.tag, state="hidden")
+                    row.visible = False
+                    row.painted = {}
+                continue
+            if not row.visible:
+                self.canvas.itemconfig(row.tag, state="normal")
+                row.visible = True
+            rank, competitor, total = rows[k]
+            grown |= self._fill(row, rank, competitor, total, self.details)
+
+        if grown:
+            self._layout()
+            self._paint()
+            return
+
+        self._offset(self.top - first)
+        if self.yscrollcommand:
+            self.yscrollcommand(*self._fractions())
+
+    def _offset(self, rows):
+        """Mută toate rândurile în sus cu `rows` (fracțiune de rând), relativ la poziția curentă."""
+        pixels = round(rows * self.row_height)
+        if pixels != self.pixel_offset:
+            self.canvas.move("row", 0, self.pixel_offset - pixels)
+            self.pixel_offset = pixels
+
+    def _fill(self, row, rank, competitor, total, details):
+        """Actualizează textele și celulele schimbate; întoarce True dacă o coloană trebuie lărgită."""
+        club, scores = details(competitor)
+        grown = False
+        for key, text in (("rank", str(rank)), ("name", competitor), ("club", club), ("total", f"{total:.1f}")):
+            if row.painted.get(key) != text:
+                self.canvas.itemconfig(row.items[key], text=text)
+                row.painted[key] = text
+                grown |= self._fit(key, text)
+        for j, score in enumerate(scores):
+            self._set_score(row, j, score)
+        return grown
+
+    def _fit(self, column, text):
+        width = self.measure(text, self.fonts["cell"])
+        if width > self.widths[column]:
+            self.widths[column] = width
+            return True
+        return False
+
+    def _set_score(self, row, column, score):
+        if column in row.painted and row.painted[column] == score:
+            return
+        box, fill, text = row.cells[column]
+        left, top, right, bottom = self.canvas.coords(box)
+        if score is None:
+            # Casetă complet goală
+            self.canvas.itemconfig(fill, state="hidden")
+            self.canvas.itemconfig(text, text="")
+        elif score == 0:
+            # Fundal alb, text 0
+            self.canvas.coords(fill, left, top, right, bottom)
+            self.canvas.itemconfig(fill, state="normal", fill="white")
+            self.canvas.itemconfig(text, text="0.0")
+        else:
+            # Top: fundal complet albastru; zonă: fundal pe jumătate albastru
+            width = CELL_WIDTH if score >= 24 else CELL_WIDTH / 2
+            self.canvas.coords(fill, left, top, left + width, bottom)
+            self.canvas.itemconfig(fill, state="normal", fill=self.blue_color)
+            self.canvas.itemconfig(text, text=f"{score:.1f}")
+        row.painted[column] = score
+
+    def _on_resize(self, event):
+        visible_rows = max(1, int((event.height - self.header_height) // self.row_height))
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.top = min(self.top, self.max_top)
+            self._paint()
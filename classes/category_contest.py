@@ -0,0 +1,170 @@
+# category_contest.py
+
+import tkinter as tk
+import logging
+from app.config import Config
+from app.classes.contest_engine import ContestEngine
+from app.classes.ranking_manager import RankingManager
+from app.classes.score_matrix import ScoreMatrix
+from app.classes.competitor_index import CompetitorIndex
+from helpers.utils import delegate_to
+
+class CategoryContest:
+    """
+    Un concurs suplimentar (altă categorie, alt perete) găzduit de aceeași aplicație.
+    Are motorul, concurenții, scorurile și fereastra lui; cronometrul rulează în
+    planificatorul comun al aplicației, nu într-o buclă `after` proprie.
+    """
+
+    dynamic_routes = delegate_to("engine", "dynamic_routes")
+
+    def __init__(self, app, category, contest_type, routes_number, competitor_data, pause_duration=None):
+        self.app = app
+        self.master = app.master
+        self.ui = app.ui
+        self.category = category
+        self.scheduler = app.scheduler
+
+        # Ce așteaptă RankingManager de la „aplicație”
+        self.index = CompetitorIndex(competitor_data)
+        self.competitor_data = self.index.records
+        self.cm = self
+        self.route_scores = ScoreMatrix()
+        self.blue_light_color = app.blue_light_color
+        self.input_font = app.input_font
+
+        self.engine = ContestEngine(listener=self, audio=app.timer.audio)
+        self.engine.setup(contest_type, self.get_competitors(), routes_number, pause_duration)
+        self.ranking_manager = RankingManager(self)
+
+        self.render_window()
+        self.update_display()
+
+    def get_competitors(self):
+        return self.index.names()
+
+    #------------------------------
+    # Fereastra categoriei
+
+    def render_window(self):
+        title = {v: k for k, v in self.app.contest_types.items()}.get(self.engine.contest_type, self.engine.contest_type)
+        self.window = self.ui.create_window(
+            title=f"{self.category} - {title}",
+            is_toplevel=True,
+            width=900,
+            height=900,
+            resizable=(True, True)
+        )
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.window.grid_columnconfigure(0, weight=1)
+        self.window.grid_rowconfigure(1, weight=1)
+
+        # Cronometrul: bară de progres și timpul rămas
+        self.canvas = tk.Canvas(self.window, height=160, highlightthickness=0)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.bar_background = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.app.red_color, outline="")
+        self.bar = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.app.blue_light_color, outline="")
+        self.time_text = self.canvas.create_text(0, 0, text=self.format_time(self.engine.remaining_time),
+                                                 font=(self.app.font_face, 90, "bold"))
+        self.canvas.bind("<Configure>", lambda event: self.update_timer())
+
+        # Starea concursului: Call Zone / Trasee / Izolare 2
+        self.state_frame = tk.Frame(self.window, bg=Config.COLORS["gray"])
+        self.state_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.ui.configure_grid(self.state_frame, 'row', positions=[0], weights=[1])
+        self.ui.configure_grid(self.state_frame, 'col', positions=[0, 1, 2], weights=[1, 1, 1])
+
+        # Comenzi și clasament (RankingManager desenează în competitors_frame)
+        self.competitors_frame = tk.Frame(self.window, bg=self.app.dark_blue_color)
+        self.competitors_frame.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
+        self.start_button = tk.Button(self.competitors_frame, text="Start time", command=self.start, font=self.input_font)
+        self.start_button.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        tk.Button(self.competitors_frame, text="Rankings", command=self.ranking_manager.show_rankings,
+                  font=self.input_font).grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        tk.Button(self.competitors_frame, text="Close", command=self.close,
+                  font=self.input_font).grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+
+    def format_time(self, seconds):
+        return f"{int(seconds) // 60:02d}:{int(seconds) % 60:02d}"
+
+    def update_timer(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        total = self.engine.get_total_time()
+        ratio = self.engine.remaining_time / total if total > 0 else 0
+
+        self.canvas.coords(self.bar_background, 0, 0, width, height)
+        self.canvas.coords(self.bar, 0, 0, int(width * ratio), height)
+        self.canvas.coords(self.time_text, width // 2, height // 2)
+        self.canvas.itemconfig(self.time_text, text=self.format_time(self.engine.remaining_time))
+
+    def update_display(self):
+        txt_iz1, trasee_text, txt_iz2 = self.engine.state_texts(self.engine.round_label())
+        self.ui.create_section(self.state_frame, 0, 0, "Call Zone", txt_iz1, self.app.izolare_font)
+        self.ui.create_section(self.state_frame, 0, 1, "Trasee", trasee_text, self.app.trasee_font, bg_color=Config.COLORS["blue_light"])
+        self.ui.create_section(self.state_frame, 0, 2, "Izolare 2", txt_iz2, self.app.izolare_font)
+
+    #------------------------------
+    # Cronometrul
+
+    def start(self):
+        if self.engine.running:
+            self.pause()
+            return
+
+        # Doar o fază pusă pe pauză se reia; un concurs oprit sau terminat pornește de la capăt
+        started = self.engine.resume() if self.engine.paused else self.engine.start()
+        if started:
+            self.start_button.config(text="Pause")
+            self.scheduler.tick_now(self.engine)
+
+    def pause(self):
+        if self.engine.pause():
+            self.scheduler.cancel(self.engine)
+            self.start_button.config(text="Resume")
+
+    def close(self):
+        self.scheduler.cancel(self.engine)
+        self.engine.stop(notify=False)
+        self.ranking_manager.close_rankings_window()
+        if self in self.app.categories:
+            self.app.categories.remove(self)
+        self.window.destroy()
+        logging.debug(f"Categoria {self.category} a fost închisă.")
+
+    #------------------------------
+    # Evenimentele motorului
+
+    def on_tick(self, countdown_type, remaining, crossed):
+        self.update_timer()
+
+        if countdown_type == "4min":
+            self.canvas.itemconfig(self.bar, fill=self.app.green_color)
+            self.canvas.itemconfig(self.time_text, fill=self.app.white_color)
+        elif countdown_type == "transit":
+            self.canvas.itemconfig(self.bar, fill=self.app.blue_light_color)
+            self.canvas.itemconfig(self.time_text, fill=self.app.black_color)
+
+    def on_beep(self, duration):
+        self.app.timer.beep(duration)
+
+    def on_transit(self):
+        self.update_display()
+
+    def on_rotation(self):
+        self.update_display()
+
+    def on_pause_started(self):
+        self.canvas.itemconfig(self.time_text, text="Pauză între trasee")
+        self.update_display()
+
+    def on_round_started(self, number):
+        self.update_display()
+
+    def on_stopped(self):
+        self.scheduler.cancel(self.engine)
+        if self.engine.is_contest_finished():
+            self.ranking_manager.close_round()
+        self.canvas.itemconfig(self.time_text, text="STOP!")
+        self.start_button.config(text="Start time")
+        self.update_display()
@@ -0,0 +1,94 @@
+# competitor_index.py
+
+from itertools import count
+
+class CompetitorIndex:
+    """
+    Înregistrările concurenților ({"id", "name", "club"}) cu acces direct după nume și după id.
+    Id-ul e stabil: rămâne același la redenumire și la reîncărcarea listei, cât timp numele
+    există deja în index, așa că poate lega un concurent între ferestre, exporturi și concursuri.
+    """
+
+    def __init__(self, records=()):
+        self.records = []    # în ordinea listei de concurenți
+        self._by_name = {}
+        self._by_id = {}
+        self._ids = count(1)
+        self.load(records)
+
+    @staticmethod
+    def _record(data):
+        name = data.get("name", "").strip()
+        return {"name": name, "club": (data.get("club") or "").strip()}
+
+    def load(self, records):
+        """Înlocuiește lista; concurenții deja cunoscuți (după nume) își păstrează id-ul."""
+        old_by_name = self._by_name
+        self.records, self._by_name, self._by_id = [], {}, {}
+        for data in records:
+            record = self._record(data)
+            if not record["name"] or record["name"] in self._by_name:
+                continue
+            previous = old_by_name.get(record["name"])
+            record["id"] = previous["id"] if previous is not None else next(self._ids)
+            self._insert(record)
+
+    def _insert(self, record):
+        self.records.append(record)
+        self._by_name[record["name"]] = record
+        self._by_id[record["id"]] = record
+
+    def add(self, name, club=""):
+        """Adaugă un concurent nou (sau îl întoarce pe cel existent cu același nume)."""
+        record = self._by_name.get(name)
+        if record is None:
+            record = self._record({"name": name, "club": club})
+            record["id"] = next(self._ids)
+            self._insert(record)
+        return record
+
+    def remove(self, name):
+        record = self._by_name.pop(name, None)
+        if record is None:
+            return None
+        del self._by_id[record["id"]]
+        self.records.remove(record)
+        return record
+
+    def rename(self, old_name, new_name, club=None):
+        """Schimbă numele (și opțional clubul) fără să schimbe id-ul sau poziția în listă."""
+        record = self._by_name.get(old_name)
+        if record is None or (new_name != old_name and new_name in self._by_name):
+            return None
+        del self._by_name[old_name]
+        record["name"] = new_name
+        if club is not None:
+            record["club"] = club
+        self._by_name[new_name] = record
+        return record
+
+    def get(self, name):
+        return self._by_name.get(name)
+
+    def by_id(self, competitor_id):
+        return self._by_id.get(competitor_id)
+
+    def id_of(self, name):
+        record = self._by_name.get(name)
+        return record["id"] if record is not None else None
+
+    def club(self, name):
+        record = self._by_name.get(name)
+        return record["club"] if record is not None else ""
+
+    def names(self):
+        return [record["name"] for record in self.records]
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __iter__(self):
+        return iter(self.records)
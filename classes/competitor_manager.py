@@ -1,11 +1,13 @@
 # competitor_manager.py
 
 import tkinter as tk
+from tkinter import messagebox
 import logging
 import math
 from helpers.utils import *
 import tkinter.simpledialog as simpledialog
 from helpers.decorators import log_method_call
+from app.classes.competitor_index import CompetitorIndex
 
 # Configurare logging: nivelul poate fi schimbat (ex. DEBUG, INFO, WARNING, etc.)
 logging.basicConfig(
@@ -26,6 +28,8 @@ class CompetitorManager:
         self.highlight_label = None
         self.highlighted_index = None
         self.new_competitor_names = []
+        self.competitor_data = []
+        self.index = CompetitorIndex()  # nume/id -> înregistrarea concurentului
         self.competitor_count = 0
 
         self.toggle_button = self.button_manager.toggle_button
@@ -47,14 +51,9 @@ class CompetitorManager:
         name = f"C{current_index}"
 
         # Add competitor to list
-        competitors.append(name)
-        parsed = []
-        for c in competitors:
-            parts = c.split("|")
-            name = parts[0].strip()
-            club = parts[1].strip() if len(parts) > 1 else ""
-            parsed.append({"name": name, "club": club})
-        self.set_competitors(parsed)
+        self.index.add(name)
+        self._sync_from_index()
+        competitors = self.get_competitors()
 
         # Increment competitor count
         self.competitor_count += 1  # Track added competitor
@@ -97,17 +96,21 @@ class CompetitorManager:
 
         # Function to save the edited name
         def save_edit(event=None):
+            entry_editor.unbind("<FocusOut>")  # messagebox-ul de mai jos nu trebuie să salveze din nou
             new_name = entry_editor.get().strip()  # Get the new name
 
             if new_name:
+                # Update the backend competitors list (same id, same position)
+                if not self.rename_competitor(current_name, new_name):
+                    # Numele există deja: lista și indexul rămân cum erau
+                    entry_editor.destroy()
+                    name, _ = self.parse_competitor(new_name)
+                    messagebox.showerror("Eroare", f"Concurentul {name} există deja în listă!")
+                    return
+
                 listbox.delete(index)  # Delete the old name
                 listbox.insert(index, new_name)  # Insert the new name
 
-                # Update the backend competitors list
-                competitors = self.get_competitors()
-                competitors[index] = new_name  # Update in backend list
-                self.set_competitors(competitors)  # Update the backend list
-
                 # Call the update callback to sync with backend
                 if update_callback:
                     updated_list = list(listbox.get(0, tk.END))  # Get updated list from Listbox
@@ -135,6 +138,16 @@ class CompetitorManager:
 
         entry_editor.focus_set()  # Focus on input field
 
+    def rename_competitor(self, current_text, new_text):
+        """Redenumește concurentul din rândul `current_text` ("nume | club"); False dacă numele e luat."""
+        old_name, _ = self.parse_competitor(current_text)
+        name, club = self.parse_competitor(new_text)
+        if self.index.rename(old_name, name, club or None) is None:
+            logging.warning(f"Competitor {name} already exists; {old_name} was not renamed.")
+            return False
+        self._sync_from_index()
+        return True
+
     def delete_competitor(self, event):
         # Get the competitors list from the backend
         competitors = self.get_competitors()
@@ -145,15 +158,15 @@ class CompetitorManager:
         if selected_indices:
             # Loop through selected indices and remove corresponding competitors
             for idx in selected_indices:
-                competitor_to_delete = self.competitors_listbox.get(idx)
+                competitor_to_delete, _ = self.parse_competitor(self.competitors_listbox.get(idx))
 
                 # Delete from Listbox
                 self.competitors_listbox.delete(idx)
 
                 # Remove competitor from the backend list
-                if competitor_to_delete in competitors:
-                    competitors.remove(competitor_to_delete)
-                    self.set_competitors(competitors)  # Update the backend list
+                if self.index.remove(competitor_to_delete) is not None:
+                    self._sync_from_index()  # Update the backend list
+                    competitors = self.get_competitors()
 
                     # Also remove the competitor from the CSV
                     self.write_competitors_to_csv(competitors)  # Call this method after the deletion
@@ -247,20 +260,35 @@ class CompetitorManager:
     def get_competitors(self):
         return self.new_competitor_names
 
+    @staticmethod
+    def parse_competitor(text):
+        """(nume, club) dintr-un rând de listă ("nume | club") sau de CSV ("nume, club")."""
+        parts = text.split("|") if "|" in text else text.split(",")
+        name = parts[0].strip()
+        club = parts[1].strip() if len(parts) > 1 else ""
+        return name, club
+
     def set_competitors(self, competitors):
         parsed_data = []
         for c in competitors:
             if isinstance(c, dict):
                 parsed_data.append(c)
             elif isinstance(c, str):
-                parts = c.split(",")
-                name = parts[0].strip()
-                club = parts[1].strip() if len(parts) > 1 else ""
+                name, club = self.parse_competitor(c)
                 parsed_data.append({"name": name, "club": club})
             else:
                 logging.warning(f"Format necunoscut pentru competitor: {c}")
-        self.competitor_data = parsed_data
-        self.new_competitor_names = [c["name"] for c in parsed_data]
+        self.index.load(parsed_data)
+        self._sync_from_index()
+
+    def _sync_from_index(self):
+        # competitor_data sunt chiar înregistrările din index, ca editările să se vadă peste tot
+        self.competitor_data = self.index.records
+        self.new_competitor_names = self.index.names()
+        # Concurent adăugat, șters, redenumit sau listă nouă: clasamentele se redesenează
+        ranking_manager = getattr(self.parent, 'ranking_manager', None)
+        if ranking_manager is not None:
+            ranking_manager.refresh_rankings()
 
     def delete_competitors(self, element):
 
@@ -285,10 +313,10 @@ class CompetitorManager:
                 element.insert(tk.END, "No competitors available")
             return False
 
-        current_competitors = self.get_competitors()
+        current_competitors = list(self.competitor_data)
 
         if current_competitors:
-            new_competitors = [comp for comp in competitors if comp not in current_competitors]
+            new_competitors = [comp for comp in competitors if comp["name"] not in self.index]
 
             if not new_competitors:
                 logging.info("All competitors are already loaded in the Listbox.")
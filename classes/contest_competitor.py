@@ -0,0 +1,36 @@
+# contest_competitor.py
+
+class ContestCompetitor:
+    """
+    Concurentul din concursul curent: înregistrare compactă (__slots__), comparată și
+    hash-uită după identitate, deci poate fi cheie în dicționare și seturi.
+    Acceptă și accesul vechi de tip dicționar (comp["state"], comp.get("start")).
+    """
+
+    __slots__ = ("id", "name", "start", "state", "transit_status", "group")
+
+    def __init__(self, id, name, state='Call_zone', group=None):
+        self.id = id                  # poziția în lista de start a concursului
+        self.name = name
+        self.start = None             # rotația la care a pornit pe trasee
+        self.state = state            # 'Call_zone', 'T1'..'Tn', 'izolare2' sau 'Concurs'
+        self.transit_status = False
+        self.group = group            # "A" / "B" la calificări, None altfel
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __repr__(self):
+        return f"ContestCompetitor({self.name!r}, state={self.state!r}, start={self.start!r}, group={self.group!r})"
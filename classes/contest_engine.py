@@ -0,0 +1,766 @@
+# contest_engine.py
+
+import logging
+import math
+import string
+import time
+from itertools import islice
+from app.config import Config
+from app.classes.contest_competitor import ContestCompetitor
+from app.classes.rotation_timetable import RotationTimetable
+
+# Dicționar pentru configurarea timpilor de beep
+BEEP_TIMINGS = {
+    60: 1.0,    # La 60 secunde rămase, beep de 1 sec
+    3: 0.5,     # La 3 secunde rămase, beep de 0.5 sec
+    2: 0.5,     # La 2 secunde rămase, beep de 0.5 sec
+    1: 0.5      # La 1 secundă rămasă, beep de 0.5 sec
+}
+
+# Beep-ul de final al fiecărei faze
+END_BEEP_DURATION = 1.0
+
+
+def _group_view(mapping, label):
+    """Property pentru grupa `label` din dicționarul `mapping` al motorului (ex. group_A)."""
+    return property(
+        lambda self: getattr(self, mapping).get(label, []),
+        lambda self, value: getattr(self, mapping).__setitem__(label, value)
+    )
+
+
+class MonotonicClock:
+    """Ceasul real al sălii."""
+
+    def now(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """Ceas simulat: timpul avansează doar la `sleep`, deci un concurs întreg rulează instant."""
+
+    def __init__(self, start=0.0):
+        self.current = start
+
+    def now(self):
+        return self.current
+
+    def sleep(self, seconds):
+        self.current += seconds
+
+
+class ContestEngine:
+    """
+    Logica concursului fără Tk: fazele cronometrului (preview, 4 min, tranzit, pauză)
+    pe un deadline al ceasului injectat și rotația concurenților pe trasee.
+    Interfața Tk se abonează prin `listener` și doar afișează starea.
+
+    Metode opționale ale listener-ului:
+    - on_tick(phase, remaining, crossed): la fiecare secundă, cu pragurile de beep trecute
+    - on_beep(duration): beep care nu a putut fi programat pe ceasul audio
+    - on_transit(): concurenții au intrat în tranzit
+    - on_rotation(): concurenții s-au mutat pe traseele următoare
+    - on_pause_started(): a început pauza între runde
+    - on_round_started(number): a început o rundă nouă
+    - on_stopped(): cronometrul s-a oprit
+    """
+
+    def __init__(self, clock=None, listener=None, audio=None):
+        self.clock = clock or MonotonicClock()
+        self.listener = listener
+        self.audio = audio  # obiect cu schedule(duration, at, owner) / cancel_scheduled(owner), poate fi comun
+
+        # Configurarea concursului
+        self.contest_type = None
+        self.dynamic_routes_number = 0
+        self.dynamic_routes = []
+        self.pause_duration = None
+        self.rounds = 1
+        self.round = 1
+
+        # Init the contest boxes
+        self.contest_competitors = []
+        self.isolation1_contest = []
+        self.isolation2_contest = []
+        self.contest_finished = []
+        self.all_routes = []
+        self.qualifier_groups = Config.QUALIFIERS["groups"]
+        self.qualifier_rounds = Config.QUALIFIERS["rounds"]
+        self.groups = {}         # grupă ("A", "B", "C", ...) -> concurenți
+        self.group_routes = {}   # grupă -> blocul ei de trasee
+        self.rotation_contest = 0
+
+        # Indexuri actualizate la fiecare mutare, ca afișajul să nu scaneze tot concursul
+        self.route_occupants = {}   # traseu -> concurentul de pe el
+        self.state_members = {}     # (grupă, stare) -> {concurent: None}, în ordinea intrării
+
+        # Orarul rotațiilor rundei curente, calculat la start
+        self.timetable = None
+
+        # Setări pentru cronometru
+        self.running = False
+        self.paused = False                 # oprit cu pause(), deci resume() continuă faza
+        self.transit = False
+        self.manual_adjustment = False
+
+        # Setări temporale
+        self.initial_time = 4 * 60          # 4 minute = 240 secunde
+        self.transit_time = 15              # 15 secunde
+        self.preview_time = 8 * 60
+        self.remaining_time = self.initial_time
+        self.paused_time = 0
+        self.preview_completed = False
+
+        # Deadline pe ceasul injectat pentru faza curentă
+        self.countdown_type = None
+        self.deadline = None
+        self._last_second = None
+        self._scheduled_seconds = set()  # pragurile fazei programate deja pe ceasul audio
+
+    def _notify(self, event, *args):
+        handler = getattr(self.listener, event, None)
+        if handler is not None:
+            handler(*args)
+
+    #------------------------------
+    # Pregătirea concursului
+
+    def setup(self, contest_type, competitor_names, routes_number, pause_duration=None, groups=None, rounds=None):
+        """Pregătește concurenții, traseele și grupele pentru tipul de concurs ales."""
+        self.contest_type = contest_type
+        self.dynamic_routes_number = routes_number
+        if pause_duration is not None:
+            self.pause_duration = pause_duration
+        if groups is not None:
+            self.qualifier_groups = groups
+        if rounds is not None:
+            self.qualifier_rounds = rounds
+
+        # Calificările au runde cu pauză între ele și nu au preview de 8 minute
+        self.rounds = self.qualifier_rounds if contest_type == "qualifiers" else 1
+        self.round = 1
+        if contest_type == "qualifiers":
+            self.preview_completed = True
+
+        self.contest_competitors = [
+            ContestCompetitor(index, name)
+            for index, name in enumerate(competitor_names)
+        ]
+        self.isolation1_contest = [comp.name for comp in self.contest_competitors if comp.state == 'Call_zone']
+        self.isolation2_contest = []
+        self.rotation_contest = 0
+
+        self.generate_dynamic_routes()
+
+        if contest_type == "qualifiers":
+            self.generate_qualifiers_groups()
+        elif contest_type in ["semifinals", "finals"]:
+            self.generate_semifinals_finals_contest_competitors()
+
+        self.rebuild_indexes()
+        self.build_timetable()
+
+    def generate_dynamic_routes(self):
+        if self.dynamic_routes_number == 0:
+            return
+
+        self.dynamic_routes = [f"T{i+1}" for i in range(self.dynamic_routes_number)]
+
+    def generate_qualifiers_groups(self):
+        """
+        Împarte concurenții și traseele în `qualifier_groups` grupe care urcă în paralel,
+        fiecare pe blocul ei de trasee. Primele grupe primesc concurentul / traseul în plus.
+        """
+        # Fiecare grupă are nevoie de cel puțin un traseu
+        group_count = max(1, min(self.qualifier_groups, self.dynamic_routes_number))
+        if group_count != self.qualifier_groups:
+            logging.warning(f"{self.qualifier_groups} grupe pe {self.dynamic_routes_number} trasee: folosim {group_count} grupe.")
+
+        labels = string.ascii_uppercase[:group_count]
+        competitor_blocks = self._split(self.contest_competitors, group_count)
+        route_blocks = self._split(self.dynamic_routes, group_count)
+
+        self.groups = dict(zip(labels, competitor_blocks))
+        self.group_routes = dict(zip(labels, route_blocks))
+
+        self.rebuild_indexes()
+
+    @staticmethod
+    def _split(items, parts):
+        """Împarte `items` în `parts` bucăți consecutive cu lungimi care diferă cu cel mult 1."""
+        size, extra = divmod(len(items), parts)
+        blocks = []
+        start = 0
+        for index in range(parts):
+            end = start + size + (1 if index < extra else 0)
+            blocks.append(items[start:end])
+            start = end
+        return blocks
+
+    def rotate_groups(self):
+        """Trece fiecare grupă pe blocul de trasee următor (la două grupe: A și B se inversează)."""
+        labels = list(self.groups)
+        competitors = [self.groups[label] for label in labels]
+        self.groups = dict(zip(labels, competitors[-1:] + competitors[:-1]))
+
+    # Compatibilitate cu codul scris pentru două grupe
+    group_A = _group_view("groups", "A")
+    group_B = _group_view("groups", "B")
+    routes_A = _group_view("group_routes", "A")
+    routes_B = _group_view("group_routes", "B")
+
+    def generate_semifinals_finals_contest_competitors(self):
+        self.all_routes = self.contest_competitors[:]
+
+    def contest_groups(self):
+        """{grupă: (trasee, concurenți)} pentru runda curentă."""
+        if self.contest_type == "qualifiers":
+            return {group: (self.group_routes[group], competitors) for group, competitors in self.groups.items()}
+        return {None: (self.dynamic_routes, self.contest_competitors)}
+
+    def build_timetable(self):
+        """Calculează o dată orarul rotațiilor pentru ordinea, traseele și tipul concursului."""
+        self.timetable = RotationTimetable(self.contest_type, self.contest_groups())
+
+    def rotation_for(self, name, route):
+        """Rotația (din runda curentă) la care concurentul `name` urcă pe traseul `route`."""
+        if self.timetable is None:
+            return None
+        return self.timetable.rotation_for(name, route)
+
+    #------------------------------
+    # Indexurile stărilor
+
+    def rebuild_indexes(self):
+        """Reconstruiește indexurile din stările curente (setup, reset, runda nouă)."""
+        for comp in self.contest_competitors:
+            comp.group = None
+        if self.contest_type == "qualifiers":
+            for group, competitors in self.groups.items():
+                for comp in competitors:
+                    comp.group = group
+
+        self.route_occupants = {}
+        self.state_members = {}
+        for comp in self.contest_competitors:
+            self._index_state(comp, comp.state)
+
+    def _index_state(self, comp, state):
+        self.state_members.setdefault((comp.group, state), {})[comp] = None
+        if state and state.startswith("T"):
+            self.route_occupants.setdefault(state, comp)
+
+    def _set_state(self, comp, state):
+        """Mută concurentul în `state` și actualizează indexurile în O(1)."""
+        old_state = comp.state
+        if old_state == state:
+            return
+
+        members = self.state_members.get((comp.group, old_state))
+        if members is not None:
+            members.pop(comp, None)
+        if self.route_occupants.get(old_state) is comp:
+            del self.route_occupants[old_state]
+            if members:
+                self.route_occupants[old_state] = next(iter(members))
+
+        comp.state = state
+        self._index_state(comp, state)
+
+    def route_occupant(self, route):
+        """Concurentul de pe traseul `route` sau None."""
+        return self.route_occupants.get(route)
+
+    def members(self, state, group=None):
+        """Concurenții (din grupa `group`, la calificări) aflați în starea `state`."""
+        return self.state_members.get((group, state), {}).keys()
+
+    def round_label(self):
+        """Runda afișată deasupra traseelor ('Runda x' cât timp rulează preview-ul)."""
+        if self.running and not self.preview_completed:
+            return 'Runda x'
+        return f'Runda {self.round}'
+
+    def state_texts(self, current_round):
+        """Textele panourilor Call Zone, Trasee și Izolare 2, construite din indexuri."""
+        if self.contest_type == "qualifiers":
+
+            call_zone_parts, trasee_parts, iz2_parts = [], [], []
+            for group, routes in self.group_routes.items():
+
+                # Display Call Zone with Groups (show only next 3 competitors)
+                visible = [comp.name for comp in islice(self.members('Call_zone', group), 3)]
+                call_zone_parts.append(f"Grupa {group}:\n" + ("\n".join(visible) if visible else " - "))
+
+                # Display Routes (Trasee) split by group
+                trasee_group = f"Grupa {group}:\n"
+                for route in routes:
+                    occupant = self.route_occupant(route)
+                    trasee_group += f"{route}: {occupant.name if occupant else 'Liber'}\n"
+                trasee_parts.append(trasee_group)
+
+                # Display Isolation 2 (Izolare 2) with Groups
+                iz2_parts.append(f"Grupa {group}:\n" + "\n".join([comp.name for comp in self.members('izolare2', group)]))
+
+            txt_iz1 = "\n\n".join(call_zone_parts)
+            trasee_text = f"{current_round}\n\n" + "\n".join(trasee_parts)
+            txt_iz2 = "\n\n".join(iz2_parts)
+
+        else:
+
+            # Display Call Zone for Semifinale (show only next 3 competitors)
+            visible_competitors = [comp.name for comp in islice(self.members('Call_zone'), 3)]
+            txt_iz1 = "\n".join(visible_competitors) if visible_competitors else "-"
+
+            # Display Routes (Trasee)
+            trasee_text = ""
+            for route in self.dynamic_routes:
+                occupant = self.route_occupant(route)
+                trasee_text += f"{route}: {occupant.name if occupant else 'Liber'}\n"
+
+            # Informații pentru Izolare 2
+            txt_iz2 = "\n".join(self.isolation2_contest)
+
+        # Contest ended change text
+        if self.is_contest_finished():
+            trasee_text = f"Pauzǎ între traseee!"
+
+        # Ensure empty sections still occupy space
+        txt_iz1 = txt_iz1 if txt_iz1.strip() else " "  # Single space to prevent collapse
+        trasee_text = trasee_text if trasee_text.strip() else " "
+        txt_iz2 = txt_iz2 if txt_iz2.strip() else " "  # Single space to hold width
+
+        return txt_iz1, trasee_text, txt_iz2
+
+    def state_snapshot(self):
+        """Call Zone, Trasee și Izolare 2 ca date simple, pe grupe (pentru rezultatele live)."""
+        groups = []
+        for group, (routes, _) in self.contest_groups().items():
+            groups.append({
+                "group": group,
+                "call_zone": [comp.name for comp in self.members('Call_zone', group)],
+                "routes": [
+                    {"route": route, "competitor": occupant.name if occupant else None}
+                    for route, occupant in ((route, self.route_occupant(route)) for route in routes)
+                ],
+                "izolare2": [comp.name for comp in self.members('izolare2', group)],
+            })
+        return {
+            "contest_type": self.contest_type,
+            "round": self.round_label(),
+            "finished": bool(self.contest_competitors) and self.is_contest_finished(),
+            "groups": groups,
+        }
+
+    def timer_state(self):
+        """
+        Faza și secundele rămase; doar citește starea, deci se poate apela și de pe alt fir.
+        Oprit (pauză, stop), deadline-ul vechi nu mai contează: rămâne timpul păstrat.
+        """
+        remaining = self.seconds_left() if self.running else self.remaining_time
+        return {"phase": self.countdown_type, "running": self.running, "remaining": remaining}
+
+    def _refresh_isolation_lists(self):
+        self.isolation1_contest = [comp.name for (_, state), members in self.state_members.items()
+                                   if state == 'Call_zone' for comp in members]
+        self.isolation2_contest = [comp.name for (_, state), members in self.state_members.items()
+                                   if state == 'izolare2' for comp in members]
+
+    def reset(self):
+        """Readuce concurenții în Call Zone și cronometrul în starea inițială."""
+        self.stop(notify=False)
+
+        # Reset all competitors' states
+        for comp in self.contest_competitors:
+            comp.state = 'Call_zone'  # Remove any assigned routes
+            comp.transit_status = False  # Reset transit status if needed
+            comp.start = None
+
+        self.deadline = None
+        self.countdown_type = None
+        self.transit = False
+        self.remaining_time = self.preview_time  # Set to 8 minutes for preview
+        self.preview_completed = True  # Reset preview completion flag
+        self.manual_adjustment = False
+        self.round = 1
+        self.rotation_contest = 0
+        self.isolation1_contest = [comp.name for comp in self.contest_competitors]
+        self.isolation2_contest = []
+        self.contest_finished = []
+        self.rebuild_indexes()
+
+    #------------------------------
+    # Cronometrul
+
+    def start(self):
+        """Pornește cronometrul concursului (echivalentul butonului Start time)."""
+        if self.contest_type is None:
+            return False
+
+        self.running = True
+        self.paused = False
+
+        if self.contest_type == "crb":
+            self.manual_adjustment = True  # utilizează timpul deja setat manual
+        elif self.manual_adjustment:
+            self.remaining_time = self.paused_time
+        elif self.contest_type == "qualifiers":
+            self.remaining_time = self.initial_time  # 4-minute countdown
+        else:
+            self.remaining_time = self.preview_time  # 8-minute preview
+
+        # If the contest is qualifiers, use 4min countdown directly
+        if self.contest_type in ["qualifiers", "crb"]:
+            self.start_phase("4min")
+        else:
+            self.start_phase("8min")
+        return True
+
+    def start_phase(self, countdown_type, seconds=None, anchor=None):
+        """
+        Fixează deadline-ul fazei `countdown_type` la `seconds` (implicit remaining_time) secunde.
+        Cu `anchor` (deadline-ul fazei precedente) fazele înlănțuite rămân pe ceasul sălii
+        chiar dacă tick-ul de final a întârziat.
+        """
+        if seconds is None:
+            seconds = self.remaining_time
+        if anchor is None:
+            # Faza repornită de la zero: beep-urile programate anterior nu mai sunt valabile
+            self.cancel_beeps()
+
+        start = self.clock.now() if anchor is None else anchor
+        self.countdown_type = countdown_type
+        self.remaining_time = seconds
+        self.deadline = start + seconds
+        self._last_second = seconds + 1
+        self._scheduled_seconds = set()
+        if self.running:
+            self._schedule_beeps(seconds)
+
+    def _schedule_beeps(self, seconds):
+        """
+        Programează în avans pe ceasul audio beep-urile fazei (60 s, 3-2-1 și finalul).
+        Pragurile deja trecute (fază recuperată după un tick întârziat) rămân în grija tick-ului.
+        """
+        if self.audio is None:
+            return
+
+        beeps = [(second, BEEP_TIMINGS[second]) for second in BEEP_TIMINGS if second <= seconds]
+        beeps.append((0, END_BEEP_DURATION))
+
+        now = self.clock.now()
+        for second, duration in beeps:
+            at = self.deadline - second
+            if at >= now and self.audio.schedule(duration, at, owner=self):
+                self._scheduled_seconds.add(second)
+
+    def cancel_beeps(self):
+        """Anulează beep-urile programate (pauză, reset, ajustare manuală sau stop)."""
+        if self.audio is not None:
+            self.audio.cancel_scheduled(owner=self)
+        self._scheduled_seconds = set()
+
+    def seconds_left(self):
+        """Secunde întregi rămase până la deadline (rotunjite în sus, ca afișajul)."""
+        if self.deadline is None:
+            return self.remaining_time
+        return max(0, math.ceil(self.deadline - self.clock.now()))
+
+    def tick(self):
+        """
+        Recalculează timpul rămas din deadline și rulează tranzițiile datorate, o singură dată
+        fiecare, inclusiv pe cele ratate de un tick întârziat.
+        Returnează în câte secunde trebuie apelat următorul tick sau None dacă s-a oprit.
+        """
+        while self.running:
+            countdown_type = self.countdown_type
+            remaining = self.seconds_left()
+
+            # Pragurile de beep trecute de la tick-ul anterior; un tick întârziat nu le pierde și nu le repetă
+            crossed = [second for second in sorted(BEEP_TIMINGS, reverse=True) if remaining <= second < self._last_second]
+            self._last_second = remaining
+            self.remaining_time = remaining
+
+            self._notify("on_tick", countdown_type, remaining, crossed)
+
+            # Beep-urile programate pe ceasul audio sună singure; restul le semnalăm de aici
+            for second in crossed:
+                if second not in self._scheduled_seconds:
+                    self._notify("on_beep", BEEP_TIMINGS[second])
+
+            if remaining > 0:
+                # Next tick lands right after the next whole-second boundary of the deadline
+                next_change = self.deadline - (remaining - 1)
+                return max(next_change - self.clock.now(), 0.001)
+
+            self._finish_phase(countdown_type)
+        return None
+
+    def _finish_phase(self, countdown_type):
+        """Tranziția de la finalul unei faze; rulează o singură dată pentru fiecare deadline."""
+        if 0 not in self._scheduled_seconds:
+            self._notify("on_beep", END_BEEP_DURATION)
+
+        # CRB: fără tranzit, fără altă logică
+        if self.contest_type == "crb":
+            logging.debug("CRB timer finished — Concurs încheiat.")
+            self.stop()
+            return
+
+        anchor = self.deadline
+
+        if countdown_type == "pause":
+            logging.debug("Pauza între runde terminată. Începe runda următoare.")
+            self.on_pause_finished()
+            return
+
+        # the countdown type is 4 minutes means we already run this
+        if countdown_type == "4min":
+            self.transit = True
+            self.start_phase("transit", self.transit_time, anchor)
+
+            # update in transit status
+            self.update_transit_status()
+            self._notify("on_transit")
+
+            # Everyone climbed their last route: go straight to the pause or stop
+            self.run_contest_finish()
+
+        else:
+            self.transit = False
+            self.preview_completed = True
+            self.start_phase("4min", self.initial_time, anchor)
+
+            # run finals logic before transit state is over
+            self.run_competitor_logic_general()
+            self._notify("on_rotation")
+
+    def pause(self):
+        """Oprește temporar cronometrul și păstrează timpul rămas."""
+        if not self.running:
+            return False
+
+        self.running = False
+        self.paused = True
+        self.cancel_beeps()
+        self.remaining_time = self.seconds_left()
+        self.paused_time = self.remaining_time
+        return True
+
+    def resume(self):
+        """Repornește cronometrul din timpul păstrat la pauză."""
+        if self.running:
+            return False
+
+        self.running = True
+        self.paused = False
+        self.remaining_time = self.paused_time
+
+        # If the preview has been completed, start the 4-minute countdown
+        if self.remaining_time <= self.transit_time and self.transit:
+            logging.debug("Resuming in transit timer")
+            self.start_phase("transit")
+        elif self.preview_completed:
+            logging.debug("Resuming in 4 minutes timer")
+            self.start_phase("4min")
+        else:
+            logging.debug("Resuming in 8 minutes timer")
+            self.start_phase("8min")
+        return True
+
+    def adjust(self, new_time):
+        """Setează manual timpul rămas; un cronometru pornit continuă de la noul timp."""
+        # During transition, ensure the time is not set to more than 15 seconds
+        if self.transit:
+            new_time = min(new_time, self.transit_time)
+
+        self.paused_time = new_time
+        self.remaining_time = new_time
+        self.manual_adjustment = True
+        self.cancel_beeps()
+
+        if self.running:
+            self.start_phase(self.countdown_type, new_time)
+        return new_time
+
+    def stop(self, notify=True):
+        self.running = False
+        self.paused = False
+        self.cancel_beeps()
+        if notify:
+            self._notify("on_stopped")
+
+    def start_pause_between_rounds(self):
+        """Pornește pauza dintre runde; fără durată setată (dialog anulat), runda următoare începe imediat."""
+        if not self.pause_duration:
+            logging.warning("Durata pauzei nu este setată: runda următoare începe fără pauză.")
+            self.on_pause_finished()
+            return
+
+        self.running = True
+        self.transit = False
+        logging.debug(f"Start pauză între runde: {self.pause_duration * 60} secunde.")
+        self.start_phase("pause", self.pause_duration * 60)
+        self._notify("on_pause_started")
+
+    def get_total_time(self):
+        """Durata totală a fazei curente, pentru bara de progres."""
+        if self.transit:
+            return self.transit_time
+        elif not self.preview_completed:
+            return self.preview_time  # Use 8-minute preview total
+        return self.initial_time  # Use 4-minute total after preview
+
+    def run(self, per_second=False):
+        """
+        Rulează concursul pe ceasul injectat până se oprește (simulări cu VirtualClock).
+        Fără `per_second` ceasul sare direct la deadline-ul fiecărei faze.
+        """
+        delay = self.tick()
+        while delay is not None:
+            if not per_second:
+                delay = max(self.deadline - self.clock.now(), delay)
+            self.clock.sleep(delay)
+            delay = self.tick()
+
+    #------------------------------
+    # Rotația concurenților
+
+    def is_contest_finished(self):
+        """True când toți concurenții sunt în starea 'Concurs'."""
+        finished = sum(len(members) for (_, state), members in self.state_members.items() if state == "Concurs")
+        return finished == len(self.contest_competitors)
+
+    def run_contest_finish(self):
+        """
+        This method checks if all competitors are in the 'Concurs' state, and if so, ends the round:
+        starts the pause before the next round or stops the timer after the last one.
+        """
+        if not self.is_contest_finished():
+            return False
+
+        # Tranziția s-a făcut deja (pauza rulează sau cronometrul e oprit)
+        if self.countdown_type == "pause" or not self.running:
+            return True
+
+        logging.debug("All competitors are in 'Concurs' state. Ending the round.")
+        if self.round < self.rounds:
+            self.start_pause_between_rounds()
+        else:
+            self.stop()
+        return True
+
+    # pornesc pe trasee concurentii check
+    def run_competitor_logic_general(self):
+
+        if self.run_contest_finish():
+            return
+
+        if self.timetable is None:
+            self.build_timetable()
+
+        # Doar concurenții activi în această rotație, citiți din orar
+        for comp, state in self.timetable.changes_at(self.rotation_contest):
+            if comp.start is None:
+                comp.start = self.rotation_contest
+            self._set_state(comp, state)
+
+        self._refresh_isolation_lists()
+
+        self.rotation_contest += 1
+
+    def on_pause_finished(self):
+        logging.debug(f"[Contest Logic] Pauza între runde terminată. Începe Runda {self.round + 1}.")
+
+        # Grupele trec automat pe blocul următor de trasee
+        self.rotate_groups()
+
+        # Resetăm stările concurenților pentru runda următoare
+        for comp in self.contest_competitors:
+            comp.state = 'Call_zone'
+            comp.transit_status = False
+            comp.start = None
+
+        self.round += 1
+        self.transit = False
+        self.preview_completed = True
+        self.running = True
+
+        # Reinițializare rotații
+        self.rotation_contest = 0
+        self.rebuild_indexes()
+        self.build_timetable()
+
+        # Pornește cronometrul rundei (4min)
+        self.start_phase("4min", self.initial_time)
+        self._notify("on_round_started", self.round)
+
+        # Rulează logica inițială pentru concurenți
+        self.run_competitor_logic_general()
+        self._notify("on_rotation")
+
+    # Updated method to update transit status for dynamic routes
+    def update_transit_status(self):
+
+        # Cei din Izolare 2 de la tranzitul trecut nu mai sunt în tranzit
+        for comp in self._members_where(lambda state: state == 'izolare2'):
+            comp.transit_status = False
+
+        # Doar concurenții de pe trasee se mută: ultimul traseu al grupei -> Concurs, altfel Izolare 2
+        last_routes = {group: routes[-1] for group, (routes, _) in self.contest_groups().items() if routes}
+        for comp in self._members_where(lambda state: state.startswith("T")):
+            if comp.state == last_routes.get(comp.group):
+                self._set_state(comp, "Concurs")
+                comp.transit_status = False
+            else:
+                self._set_state(comp, 'izolare2')
+                comp.transit_status = True if self.transit else False
+
+        self._refresh_isolation_lists()
+
+        logging.debug(f"Transit: izolare 2 {self.isolation2_contest}")
+
+    def _members_where(self, state_filter):
+        """Copie a concurenților din stările care trec filtrul (sigură la mutări)."""
+        return [comp for (_, state), members in list(self.state_members.items())
+                if state and state_filter(state) for comp in members]
+
+    # Calculul direct al stărilor, fără orar (referința după care e construit RotationTimetable)
+    def run_competitor_logic(self, routes = [], competitors = []):
+
+        # Assign START to the next competitor (one per rotation)
+        for comp in competitors:
+            if comp.start is None:
+                comp.start = self.rotation_contest
+                break  # Only one competitor per rotation
+
+        # Update competitor states
+        for comp in competitors:
+            if comp.start is None:
+                continue  # Skip competitors not started
+
+            delta = self.rotation_contest - comp.start  # Time since starting
+            # Use 4 for finals, 2 for semifinals (adjust based on contest type)
+            rounds_per_move = 4 if self.contest_type == "finals" else 2
+            route_index = delta // rounds_per_move  # Move to next route every 2 or 4 rounds
+
+            if route_index < len(routes):
+                self._set_state(comp, routes[route_index])  # Update state based on the route
+
+            # Check if competitor should move to Concurs
+            if route_index >= len(routes) - 1 and (delta % rounds_per_move >= 1):
+                self._set_state(comp, "Concurs")
+                continue  # If they've reached the final route, they go to Concurs
+
+            # Handle Izolare2 but don't override Concurs!
+            # For semifinals, competitors stay in Izolare2 for only the first round (round 1).
+            if self.contest_type in ["semifinals", "qualifiers"] and delta % rounds_per_move == 1 and comp.state not in ["Concurs"]:
+                self._set_state(comp, "izolare2")
+                continue  # Move on to the next competitor
+
+            # For finals, competitors stay in Izolare2 for rounds 1, 2, and 3
+            if self.contest_type == "finals" and 1 <= delta % rounds_per_move <= 3 and comp.state not in ["Concurs"]:
+                self._set_state(comp, "izolare2")
@@ -0,0 +1,63 @@
+# contest_scheduler.py
+
+import logging
+import math
+from app.classes.contest_engine import MonotonicClock
+
+class ContestScheduler:
+    """
+    O singură buclă `after` pentru toate concursurile din aplicație.
+    Fiecare ContestEngine înregistrat spune la tick când vrea următorul tick; planificatorul
+    ține un singur callback Tk, pentru cel mai apropiat termen, și rulează toate motoarele datorate.
+    """
+
+    # Motoarele datorate în această fereastră rulează împreună, la aceeași trezire
+    BATCH_SECONDS = 0.002
+
+    def __init__(self, master, clock=None):
+        self.master = master
+        self.clock = clock or MonotonicClock()
+        self.after_id = None
+        self._due = {}  # motor -> momentul următorului tick pe ceasul planificatorului
+
+    def tick_now(self, engine):
+        """Rulează imediat un tick al motorului și îl reprogramează (start, reluare, ajustare)."""
+        self._tick(engine)
+        self._reschedule()
+
+    def cancel(self, engine):
+        """Scoate motorul din buclă (pauză, stop, fereastră închisă)."""
+        if self._due.pop(engine, None) is not None:
+            self._reschedule()
+
+    def is_scheduled(self, engine):
+        return engine in self._due
+
+    def _tick(self, engine):
+        try:
+            delay = engine.tick()
+        except Exception as e:
+            # Un concurs cu probleme nu trebuie să oprească celelalte categorii
+            logging.exception(f"Exception in contest tick: {e}")
+            delay = None
+
+        if delay is None:
+            self._due.pop(engine, None)
+        else:
+            self._due[engine] = self.clock.now() + delay
+
+    def _run(self):
+        self.after_id = None
+        horizon = self.clock.now() + self.BATCH_SECONDS
+        for engine in [engine for engine, due in self._due.items() if due <= horizon]:
+            self._tick(engine)
+        self._reschedule()
+
+    def _reschedule(self):
+        if self.after_id is not None:
+            self.master.after_cancel(self.after_id)
+            self.after_id = None
+
+        if self._due:
+            delay = min(self._due.values()) - self.clock.now()
+            self.after_id = self.master.after(max(math.ceil(delay * 1000), 1), self._run)
@@ -0,0 +1,168 @@
+# countback_ranking.py
+
+import numpy as np
+
+# Scorul din popup: top = 25 - (încercări - 1) / 10, zonă = 10 - (încercări - 1) / 10, nimic = 0
+TOP_POINTS = 25
+ZONE_POINTS = 10
+# Peste aceste încercări un top ar ieși <= 10 (citit ca zonă), iar o zonă <= 0 (pierdută)
+MAX_TOP_ATTEMPTS = 150
+MAX_ZONE_ATTEMPTS = 100
+
+def route_score(top_attempts=None, zone_attempts=None):
+    """
+    (punctaj, e top) pentru un traseu, din încercările introduse în popup: topul, dacă e dat,
+    are prioritate; 0 sau nimic înseamnă fără punctaj. Încercările sunt întregi, cel mult
+    MAX_TOP_ATTEMPTS / MAX_ZONE_ATTEMPTS, ca CountbackRanking să poată reface din punctaj
+    topul, zona și încercările; altfel ValueError.
+    """
+    if top_attempts is not None:
+        attempts, limit, points, is_top = top_attempts, MAX_TOP_ATTEMPTS, TOP_POINTS, True
+    elif zone_attempts is not None:
+        attempts, limit, points, is_top = zone_attempts, MAX_ZONE_ATTEMPTS, ZONE_POINTS, False
+    else:
+        return 0, False
+
+    if attempts == 0:
+        return 0, False
+    if not 1 <= attempts <= limit or attempts != int(attempts):
+        raise ValueError(f"Încercări invalide: {attempts} (între 1 și {limit})")
+    return points - (int(attempts) - 1) / 10, is_top
+
+
+class CountbackRanking:
+    """
+    Clasament cu departajare: punctaj, apoi topuri, zone, încercări la top, încercări la zonă
+    și, la final, locul din runda anterioară (countback). Ordinea criteriilor vine din `rule`.
+
+    Topurile, zonele și încercările se citesc vectorizat din matricea de scoruri: formula din
+    popup le păstrează pe toate în punctajul unui traseu, atâta timp cât încercările rămân în
+    limitele din `route_score` (cel mult 150 la top, 100 la zonă), singurele acceptate de popup.
+    La un traseu cu top, încercările la zonă sunt cele de la top (popup-ul nu le cere separat).
+
+    Criteriile se împachetează, în ordinea din `rule`, în câmpuri de biți ale unei singure chei
+    int64, așa că tot clasamentul e o singură sortare; dacă nu încap în 63 de biți, se
+    folosește np.lexsort pe coloanele criteriilor.
+    """
+
+    CRITERIA = ("points", "tops", "zones", "top_attempts", "zone_attempts", "previous_round")
+
+    def __init__(self, rule=None, previous_round=None):
+        self.rule = list(rule or self.CRITERIA)
+        unknown = [criterion for criterion in self.rule if criterion not in self.CRITERIA]
+        if unknown:
+            raise ValueError(f"Criterii de departajare necunoscute: {unknown}")
+        self.previous_round = dict(previous_round or {})   # concurent -> locul din runda anterioară
+
+    @staticmethod
+    def decode(values, present):
+        """(topuri, zone, încercări la top, încercări la zonă) pe concurent, din valorile traseelor."""
+        scored = present & (values > 0)
+        top = scored & (values > ZONE_POINTS)
+        zone = scored  # un top înseamnă și zonă
+        top_attempts = np.where(top, np.rint((TOP_POINTS - values) * 10) + 1, 0)
+        zone_attempts = np.where(top, top_attempts, np.where(zone, np.rint((ZONE_POINTS - values) * 10) + 1, 0))
+        return top.sum(axis=1), zone.sum(axis=1), top_attempts.sum(axis=1), zone_attempts.sum(axis=1)
+
+    def columns(self, labels, values, present):
+        """Câte o coloană int64 pe criteriu, toate „mai mare e mai bine”, nenegative."""
+        tops, zones, top_attempts, zone_attempts = self.decode(values, present)
+        points = np.maximum(np.rint(values.sum(axis=1) * 10), 0)
+        last = max(self.previous_round.values(), default=0) + 1
+        previous = np.array([self.previous_round.get(label, last) for label in labels], dtype=np.int64)
+
+        raw = {
+            "points": points,
+            "tops": tops,
+            "zones": zones,
+            # mai puține încercări / loc mai mic e mai bine: se întorc față de maxim
+            "top_attempts": top_attempts.max(initial=0) - top_attempts,
+            "zone_attempts": zone_attempts.max(initial=0) - zone_attempts,
+            "previous_round": last - previous,
+        }
+        return [raw[criterion].astype(np.int64) for criterion in self.rule]
+
+    def sort_key(self, competitor, values):
+        """
+        Cheia unui singur concurent pentru RankingIndex (mai mic = mai bun), din punctajele
+        lui pe trasee; aceleași criterii și aceeași ordine ca `columns`, fără NumPy.
+        """
+        tops = zones = top_attempts = zone_attempts = 0
+        for value in values:
+            if value <= 0:
+                continue
+            zones += 1
+            if value > ZONE_POINTS:
+                attempts = round((TOP_POINTS - value) * 10) + 1
+                tops += 1
+                top_attempts += attempts
+                zone_attempts += attempts
+            else:
+                zone_attempts += round((ZONE_POINTS - value) * 10) + 1
+        last = max(self.previous_round.values(), default=0) + 1
+
+        raw = {
+            "points": -max(round(sum(values) * 10), 0),
+            "tops": -tops,
+            "zones": -zones,
+            "top_attempts": top_attempts,
+            "zone_attempts": zone_attempts,
+            "previous_round": self.previous_round.get(competitor, last),
+        }
+        return tuple(raw[criterion] for criterion in self.rule)
+
+    @staticmethod
+    def pack(columns):
+        """Cheia împachetată (primul criteriu în biții cei mai semnificativi) sau None dacă nu încape."""
+        widths = [int(column.max(initial=0)).bit_length() for column in columns]
+        if sum(widths) > 63:
+            return None
+        key = np.zeros(len(columns[0]) if columns else 0, dtype=np.int64)
+        for column, width in zip(columns, widths):
+            key = (key << width) | column
+        return key
+
+    def order(self, columns):
+        """(ordinea, începe-loc-nou) pentru rânduri: descrescător după criterii, stabil la egalitate."""
+        key = self.pack(columns)
+        if key is not None:
+            order = np.argsort(-key, kind="stable")
+            sorted_key = key[order]
+            new_rank = np.r_[True, sorted_key[1:] != sorted_key[:-1]]
+        else:
+            order = np.lexsort([np.arange(len(columns[0]))] + [-column for column in reversed(columns)])
+            stacked = np.stack([column[order] for column in columns])
+            new_rank = np.r_[True, (stacked[:, 1:] != stacked[:, :-1]).any(axis=0)]
+        return order, new_rank
+
+    def ranking(self, matrix, names=None, routes=None):
+        """
+        Ca ScoreMatrix.ranking: listă de (loc, nume, total, rând), cu locuri egale doar
+        când toate criteriile sunt egale. `rând` indexează `matrix.view(routes)` (None fără scoruri).
+        """
+        all_values, all_present = matrix.view(routes)
+        if names is None:
+            labels = list(matrix)
+            rows = np.arange(len(labels))
+        else:
+            labels = list(names)
+            rows = np.array([-1 if matrix.row_of(name) is None else matrix.row_of(name) for name in labels], dtype=int)
+        if not labels:
+            return []
+
+        known = rows >= 0
+        safe_rows = np.maximum(rows, 0)
+        if len(all_values):
+            values = np.where(known[:, None], all_values[safe_rows], 0)
+            present = known[:, None] & all_present[safe_rows]
+        else:
+            values = np.zeros((len(labels), all_values.shape[1]))
+            present = np.zeros(values.shape, dtype=bool)
+
+        order, new_rank = self.order(self.columns(labels, values, present))
+        ranks = np.maximum.accumulate(np.where(new_rank, np.arange(1, len(order) + 1), 0))
+        totals = np.round(values.sum(axis=1), 6)
+        return [
+            (int(rank), labels[k], float(totals[k]), int(rows[k]) if rows[k] >= 0 else None)
+            for rank, k in zip(ranks, order)
+        ]
@@ -0,0 +1,50 @@
+# excel_exporter.py
+
+import re
+import openpyxl
+
+class ExcelExporter:
+    """
+    Clasamentul în Excel din unul sau mai multe RankingSnapshot, câte o foaie pentru fiecare
+    (categorie, rundă): Loc, Concurent, scorurile pe trasee, Total.
+    Caietul e în modul write-only al openpyxl: rândurile se scriu direct în fișier, deci memoria
+    nu crește cu numărul de concurenți. Nu atinge Tk, așa că rulează pe firul de export.
+    """
+
+    PROGRESS_ROWS = 500   # la câte rânduri se raportează progresul
+    TEMPLATE_VERSION = 1  # se mărește când se schimbă aspectul caietului (invalidează ExportCache)
+
+    def template_key(self):
+        return ("xlsx", self.TEMPLATE_VERSION)
+
+    def write(self, snapshots, filepath, progress=None):
+        if not isinstance(snapshots, (list, tuple)):
+            snapshots = [snapshots]
+        total_rows = sum(len(snapshot.rows) for snapshot in snapshots)
+        written = 0
+
+        wb = openpyxl.Workbook(write_only=True)
+        titles = set()
+        for snapshot in snapshots:
+            ws = wb.create_sheet(self.sheet_title(snapshot.sheet_name, titles))
+            ws.append(['Loc', 'Concurent'] + snapshot.routes + ['Total'])
+            for rank, competitor, _, scores, total in snapshot.rows:
+                ws.append([rank, competitor] + list(scores) + [total])
+                written += 1
+                if progress and written % self.PROGRESS_ROWS == 0:
+                    progress(written, total_rows)
+        wb.save(filepath)
+        if progress:
+            progress(total_rows, total_rows)
+        return filepath
+
+    @staticmethod
+    def sheet_title(name, used):
+        """Numele foii: fără caracterele interzise de Excel, maxim 31 de caractere, unic în caiet."""
+        base = re.sub(r"[\[\]:*?/\\]", "_", str(name) or "Clasament")[:31]
+        title, n = base, 2
+        while title.lower() in used:
+            suffix = f" ({n})"
+            title, n = base[:31 - len(suffix)] + suffix, n + 1
+        used.add(title.lower())
+        return title
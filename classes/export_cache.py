@@ -0,0 +1,80 @@
+# export_cache.py
+
+import os
+import hashlib
+import shutil
+import tempfile
+from app.config import Config
+
+class ExportCache:
+    """
+    Fișierele exportate (PDF, Excel) păstrate pe disc după amprenta conținutului: clasamentul
+    (RankingSnapshot.digest, deci și titlul) plus șablonul exportatorului (`template_key`).
+    Un clasament neschimbat, exportat din nou (pentru panou, federație, crainic), se copiază
+    din cache în loc să fie randat din nou; orice scor sau titlu nou dă altă cheie.
+    Cache-ul e doar un dosar, deci îl împart și firul de export și procesele din BatchExporter.
+    """
+
+    MAX_ENTRIES = 64
+
+    def __init__(self, folder=None, max_entries=None):
+        self.folder = folder or Config.PATHS["export_cache"]
+        self.max_entries = max_entries or self.MAX_ENTRIES
+
+    @staticmethod
+    def key(exporter, snapshots):
+        if not isinstance(snapshots, (list, tuple)):
+            snapshots = [snapshots]
+        digest = hashlib.sha256(repr(exporter.template_key()).encode("utf-8"))
+        for snapshot in snapshots:
+            digest.update(snapshot.digest().encode("ascii"))
+        return digest.hexdigest()
+
+    def path(self, exporter, snapshots, extension):
+        return os.path.join(self.folder, self.key(exporter, snapshots) + extension)
+
+    def write(self, exporter, snapshots, filepath, progress=None):
+        """Ca `exporter.write(snapshots, filepath, progress)`, dar din cache când se poate."""
+        cached = self.path(exporter, snapshots, os.path.splitext(filepath)[1].lower())
+        if os.path.exists(cached):
+            shutil.copyfile(cached, filepath)
+            os.utime(cached)   # folosit recent: ultimul șters la curățare
+            if progress:
+                total = sum(len(s) for s in snapshots) if isinstance(snapshots, (list, tuple)) else len(snapshots)
+                progress(total, total)
+            return filepath
+
+        exporter.write(snapshots, filepath, progress)
+        self.store(filepath, cached)
+        return filepath
+
+    def store(self, filepath, cached):
+        """Copiază fișierul scris în cache; o copie nereușită nu strică exportul."""
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            # scris alături și redenumit, ca un alt proces să nu vadă un fișier pe jumătate
+            fd, temporary = tempfile.mkstemp(dir=self.folder, suffix=".part")
+            os.close(fd)
+            shutil.copyfile(filepath, temporary)
+            os.replace(temporary, cached)
+            self.prune()
+        except OSError:
+            pass
+
+    def prune(self):
+        """Păstrează doar ultimele `max_entries` fișiere folosite."""
+        entries = [
+            os.path.join(self.folder, name) for name in os.listdir(self.folder)
+            if not name.endswith(".part")
+        ]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for stale in entries[self.max_entries:]:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+    def clear(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
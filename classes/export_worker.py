@@ -0,0 +1,54 @@
+# export_worker.py
+
+import logging
+import queue
+import threading
+
+class ExportWorker:
+    """
+    Rulează exporturile (PDF, Excel) pe un fir separat, ca fereastra și cronometrul să nu se
+    blocheze. Progresul și rezultatul trec printr-o coadă pe care firul Tk o golește cu `after`,
+    așa că toate callback-urile (`on_progress`, `on_done`, `on_error`) rulează pe firul Tk.
+    """
+
+    POLL_MS = 100
+
+    def __init__(self, master):
+        self.master = master
+        self.events = queue.Queue()
+        self.running = 0
+        self.after_id = None
+
+    def submit(self, job, *args, on_progress=None, on_done=None, on_error=None):
+        """Pornește `job(*args, progress=...)`; `progress(făcute, total)` se poate apela din fir."""
+        def report(done, total):
+            self.events.put((on_progress, (done, total)))
+
+        def run():
+            try:
+                result = job(*args, progress=report)
+            except Exception as e:
+                logging.exception(f"Export failed: {job}")
+                self.events.put((on_error, (e,)))
+            else:
+                self.events.put((on_done, (result,)))
+            self.events.put((None, None))  # firul s-a terminat
+
+        self.running += 1
+        threading.Thread(target=run, daemon=True).start()
+        if self.after_id is None:
+            self.after_id = self.master.after(self.POLL_MS, self._poll)
+
+    def _poll(self):
+        self.after_id = None
+        while True:
+            try:
+                callback, args = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if args is None:
+                self.running -= 1
+            elif callback:
+                callback(*args)
+        if self.running:
+            self.after_id = self.master.after(self.POLL_MS, self._poll)
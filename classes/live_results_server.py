@@ -0,0 +1,130 @@
+# live_results_server.py
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+PAGE_PATH = "resources/web/live.html"
+
+
+class CachedResponse:
+    """Un răspuns gata serializat: corpul (și varianta gzip), ETag-ul și tipul conținutului."""
+
+    def __init__(self, body, content_type):
+        self.body = body
+        self.content_type = content_type
+        # slab: varianta gzip și cea simplă au același conținut, deci același ETag
+        self.etag = 'W/"' + hashlib.sha1(body).hexdigest() + '"'
+        self.gzipped = gzip.compress(body, mtime=0) if len(body) > 1024 else None
+
+
+class LiveResults:
+    """
+    Răspunsurile serverului de rezultate live, pe cale (`/ranking.json`, `/state.json`, ...).
+    Firul Tk le publică doar când se schimbă ceva (scor, rotație); serializarea, ETag-ul și
+    gzip-ul se fac atunci, o singură dată, iar cererile doar citesc dicționarul.
+    Căile din `provide` (cronometrul) se calculează la cerere, pe firul HTTP.
+    """
+
+    def __init__(self):
+        self._responses = {}    # cale -> CachedResponse
+        self._providers = {}    # cale -> funcție fără argumente care dă payload-ul JSON
+
+    def publish(self, path, payload):
+        """Înlocuiește răspunsul JSON de la `path`; același conținut păstrează același ETag."""
+        self._responses[path] = self.json_response(payload)
+
+    def publish_page(self, path, html):
+        self._responses[path] = CachedResponse(html.encode("utf-8"), "text/html; charset=utf-8")
+
+    def provide(self, path, function):
+        self._providers[path] = function
+
+    def get(self, path):
+        provider = self._providers.get(path)
+        if provider is not None:
+            return self.json_response(provider())
+        return self._responses.get(path)
+
+    @staticmethod
+    def json_response(payload):
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return CachedResponse(body, "application/json; charset=utf-8")
+
+
+class LiveResultsHandler(BaseHTTPRequestHandler):
+    """GET pe răspunsurile din LiveResults, cu 304 când ETag-ul din If-None-Match e același."""
+
+    server_version = "BoulderLive"
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        response = self.server.results.get("/" if path == "/index.html" else path)
+        if response is None:
+            self.send_error(404)
+            return
+
+        if response.etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", response.etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+
+        body = response.body
+        gzipped = response.gzipped is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = response.gzipped
+        self.send_response(200)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", response.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug("Live results: " + format, *args)
+
+
+class LiveResultsServer:
+    """
+    Serverul HTTP local pentru rezultatele de pe telefoane (spectatori, antrenori): pagina HTML,
+    clasamentul, starea concursului și cronometrul ca JSON. Rulează pe fire proprii
+    (ThreadingHTTPServer), iar cererile nu ating Tk; firul Tk doar publică în `results`.
+    """
+
+    def __init__(self, host="0.0.0.0", port=8080, page_path=PAGE_PATH):
+        self.host = host
+        self.port = port
+        self.page_path = page_path
+        self.results = LiveResults()
+        self.httpd = None
+        self.thread = None
+
+    def start(self):
+        with open(self.page_path, encoding="utf-8") as page:
+            self.results.publish_page("/", page.read())
+        self.httpd = ThreadingHTTPServer((self.host, self.port), LiveResultsHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.results = self.results
+        self.port = self.httpd.server_address[1]   # portul real când s-a cerut 0
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logging.info(f"Live results: {self.url}")
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
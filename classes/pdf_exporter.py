@@ -0,0 +1,195 @@
+# pdf_exporter.py
+
+import os
+import threading
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Flowable
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import landscape, A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import cm
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+FONT_NAME = "FreeSans"
+FONT_PATH = "resources/fonts/FreeSans.ttf"
+LOGO_PATH = "resources/images/frae-logo.png"
+
+# Stilul tabelului din varianta veche a exportului
+TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
+    ('GRID', (0, 0), (-1, -1), 0.25, colors.black),
+])
+
+
+class StreamingDocTemplate(SimpleDocTemplate):
+    """
+    SimpleDocTemplate care primește flowables dintr-un generator și ține în lista de lucru
+    doar `lookahead` odată: lista se completează în `handle_flowable`, punctul de extensie
+    prin care reportlab trece pentru fiecare flowable, deci în memorie stau doar câteva
+    tabele, nu tot clasamentul. (`handle_flowable` primește și lista internă de acțiuni
+    de pagină, care nu se completează.)
+    """
+
+    def __init__(self, filename, lookahead=2, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.lookahead = lookahead
+        self._source = None
+        self._story = None
+
+    def build(self, flowables, **kwargs):
+        self._source = iter(flowables)
+        self._story = []
+        self._fill(self._story)
+        try:
+            super().build(self._story, **kwargs)
+        finally:
+            self._source = self._story = None
+
+    def handle_flowable(self, flowables):
+        if flowables is self._story:
+            self._fill(flowables)
+        super().handle_flowable(flowables)
+
+    def _fill(self, flowables):
+        while self._source is not None and len(flowables) < self.lookahead:
+            try:
+                flowables.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+
+class Logo(Flowable):
+    """Logo-ul din antet, desenat dintr-un ImageReader deja decodat (refolosit între exporturi)."""
+
+    def __init__(self, image, width, height):
+        super().__init__()
+        self.image = image
+        self.width = width
+        self.height = height
+
+    def wrap(self, available_width, available_height):
+        return self.width, self.height
+
+    def draw(self):
+        # centrarea în cadru o face drawOn (hAlign implicit CENTER), ca la Image din platypus
+        self.canv.drawImage(self.image, 0, 0, self.width, self.height, mask='auto')
+
+
+class PdfExporter:
+    """
+    Clasamentul în PDF în stilul FRAE (FreeSans, logo, antet albastru), dintr-un RankingSnapshot.
+    Rândurile se scriu într-un tabel pe pagină, generat abia când reportlab ajunge la el, iar
+    `progress(scrise, total)` e apelat după fiecare pagină; nu atinge Tk, deci poate rula pe un
+    fir sau proces separat.
+    Stilurile și logo-ul decodat se păstrează la nivel de clasă, pentru toate exporturile din proces;
+    firul de export și cel Tk pot exporta în același timp, așa că cache-urile se citesc sub `_lock`.
+    """
+
+    ROW_HEIGHT = 14
+    TEMPLATE_VERSION = 1   # se mărește când se schimbă aspectul PDF-ului (invalidează ExportCache)
+
+    _styles = None
+    _logos = {}            # cale -> (mtime, ImageReader)
+    _lock = threading.Lock()
+
+    def __init__(self, font_path=FONT_PATH, logo_path=LOGO_PATH):
+        self.font_path = font_path
+        self.logo_path = logo_path
+
+    def register_fonts(self):
+        if FONT_NAME not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(TTFont(FONT_NAME, self.font_path))
+
+    def styles(self):
+        with PdfExporter._lock:
+            if PdfExporter._styles is None:
+                styles = getSampleStyleSheet()
+                styles.add(ParagraphStyle(name='DejaVuTitle', fontName=FONT_NAME, fontSize=24, leading=28))
+                styles.add(ParagraphStyle(name='DejaVuNormal', fontName=FONT_NAME, fontSize=10))
+                PdfExporter._styles = styles
+            return PdfExporter._styles
+
+    def logo(self):
+        """Logo-ul decodat o singură dată (din nou doar dacă fișierul se schimbă); None dacă lipsește."""
+        logo_path = os.path.join(os.getcwd(), self.logo_path)
+        try:
+            mtime = os.path.getmtime(logo_path)
+        except OSError:
+            return None
+        with PdfExporter._lock:
+            cached = PdfExporter._logos.get(logo_path)
+            if cached is None or cached[0] != mtime:
+                cached = PdfExporter._logos[logo_path] = (mtime, ImageReader(logo_path))
+            return cached[1]
+
+    def template_key(self):
+        """Ce influențează aspectul fișierului în afară de date, pentru cheia din ExportCache."""
+        logo_path = os.path.join(os.getcwd(), self.logo_path)
+        logo_mtime = os.path.getmtime(logo_path) if os.path.exists(logo_path) else None
+        return ("pdf", self.TEMPLATE_VERSION, self.ROW_HEIGHT, self.font_path, self.logo_path, logo_mtime)
+
+    def write(self, snapshot, filepath, progress=None):
+        self.register_fonts()
+        doc = StreamingDocTemplate(
+            filepath,
+            pagesize=landscape(A4),
+            rightMargin=1*cm,
+            leftMargin=1*cm,
+            topMargin=2*cm,
+            bottomMargin=1*cm
+        )
+        doc.build(self.flowables(snapshot, doc, progress))
+        return filepath
+
+    def flowables(self, snapshot, doc, progress=None):
+        styles = self.styles()
+        # Înălțimea utilă a cadrului (fără padding-ul de 6pt sus și jos)
+        available = doc.height - 12
+
+        logo = self.logo()
+        if logo is not None:
+            yield Logo(logo, width=3.5*cm, height=3.5*cm)
+            available -= 3.5*cm
+
+        title = Paragraph(snapshot.title, styles["DejaVuTitle"])
+        available -= title.wrap(doc.width, doc.height)[1] + 12
+        yield title
+        yield Spacer(1, 12)
+
+        # Câte un tabel pe pagină, cu antetul lui; rânduri de înălțime fixă, ca pagina să se umple exact
+        header = snapshot.header()
+        widths = self.column_widths(header, snapshot.rows)
+        total_rows = len(snapshot.rows)
+        start = 0
+        while True:
+            count = max(int(available // self.ROW_HEIGHT) - 1, 1)
+            data = [header] + [self.cells(row) for row in snapshot.rows[start:start + count]]
+            table = Table(data, colWidths=widths, rowHeights=self.ROW_HEIGHT, repeatRows=1)
+            table.setStyle(TABLE_STYLE)
+            yield table
+            start += count
+            if progress:
+                progress(min(start, total_rows), total_rows)
+            if start >= total_rows:
+                break
+            available = doc.height - 12
+
+    @staticmethod
+    def cells(row):
+        rank, competitor, club, scores, total = row
+        return [str(rank), competitor, club] + [f"{s:.1f}" for s in scores] + [f"{total:.1f}"]
+
+    def column_widths(self, header, rows, font_size=8, padding=12):
+        """Lățimea fiecărei coloane după cel mai lung text, măsurată fără a construi tabele."""
+        widths = [pdfmetrics.stringWidth(str(text), FONT_NAME, font_size) for text in header]
+        for row in rows:
+            for column, text in enumerate(self.cells(row)):
+                widths[column] = max(widths[column], pdfmetrics.stringWidth(text, FONT_NAME, font_size))
+        return [width + padding for width in widths]
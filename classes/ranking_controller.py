@@ -1,22 +1,21 @@
 # ranking_controller.py
 
+from app.classes.ranking_index import RankingIndex
+
 class RankingController:
     def __init__(self, route_scores, competitors, routes):
         self.route_scores = route_scores
         self.competitors = competitors
         self.routes = routes
+        self.index = RankingIndex(routes)
+        self.index.rebuild({comp: route_scores.get(comp, {}) for comp in competitors})
+
+    def set_score(self, competitor, route, score):
+        self.route_scores.setdefault(competitor, {})[route] = score
+        self.index.set_score(competitor, route, score)
 
     def calculate_total(self, competitor):
-        return sum(
-            self.route_scores[competitor].get(r, 0)
-            if isinstance(self.route_scores[competitor].get(r, 0), (int, float))
-            else 0
-            for r in self.routes
-        )
+        return self.index.total(competitor)
 
     def generate_ranked_list(self):
-        return sorted(
-            self.competitors,
-            key=lambda c: self.calculate_total(c),
-            reverse=True
-        )
\ No newline at end of file
+        return [comp for _, comp, _ in self.index.ranked()]
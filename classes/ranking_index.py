@@ -0,0 +1,150 @@
+# ranking_index.py
+
+from bisect import bisect_left, insort
+from itertools import count
+
+class RankingIndex:
+    """
+    Clasamentul live ținut mereu sortat. Scrierea unui scor recalculează doar cheia
+    concurentului respectiv și îl mută în lista sortată prin căutare binară, fără sortare completă.
+    Cheia vine din `sort_key(concurent, [scor pe traseu])` (mai mic = mai bun; implicit doar
+    punctajul, ex. CountbackRanking.sort_key pentru departajare). Locurile sunt cu egalități
+    (1, 1, 3…) când cheile sunt egale; atunci rămâne ordinea în care au fost adăugați.
+    """
+
+    def __init__(self, routes=(), sort_key=None):
+        self.routes = list(routes)
+        self.sort_key = sort_key or self.points_key
+        self._scores = {}    # concurent -> {traseu: scor}
+        self._totals = {}    # concurent -> total pe traseele concursului
+        self._keys = {}      # concurent -> cheia lui din _order
+        self._order = []     # (*sort_key, nr. adăugare, concurent), crescător = ordinea din clasament
+        self._counter = count()
+
+    @staticmethod
+    def points_key(competitor, values):
+        return (-sum(values),)
+
+    @staticmethod
+    def score_value(score):
+        """Valoarea numerică a unui scor; textul (ex. numele traseului din buton) contează 0."""
+        return score if isinstance(score, (int, float)) else 0
+
+    def values_of(self, scores):
+        return [self.score_value(scores.get(route, 0)) for route in self.routes]
+
+    def total_of(self, scores):
+        return sum(self.values_of(scores))
+
+    def _key(self, comp, number):
+        """(total, cheia din _order) pentru scorurile notate ale lui `comp`."""
+        values = self.values_of(self._scores[comp])
+        return sum(values), tuple(self.sort_key(comp, values)) + (number, comp)
+
+    def rebuild(self, route_scores, routes=None):
+        """Reconstruiește indexul din {concurent: {traseu: scor}} (start de concurs, trasee noi)."""
+        if routes is not None:
+            self.routes = list(routes)
+        self._scores, self._totals, self._keys = {}, {}, {}
+        self._counter = count()
+        for comp, scores in route_scores.items():
+            self._scores[comp] = dict(scores)
+            self._totals[comp], self._keys[comp] = self._key(comp, next(self._counter))
+        self._order = sorted(self._keys.values())
+
+    def add(self, comp, scores=None):
+        if comp in self._keys:
+            return
+        self._scores[comp] = dict(scores or {})
+        self._totals[comp], self._keys[comp] = self._key(comp, next(self._counter))
+        insort(self._order, self._keys[comp])
+
+    def remove(self, comp):
+        key = self._keys.pop(comp, None)
+        if key is None:
+            return
+        del self._order[bisect_left(self._order, key)]
+        del self._scores[comp]
+        del self._totals[comp]
+
+    def clear(self):
+        self.rebuild({})
+
+    def set_score(self, comp, route, score):
+        """Notează scorul și repoziționează doar concurentul `comp`."""
+        if comp not in self._keys:
+            self.add(comp)
+        self._scores[comp][route] = score
+
+        old_key = self._keys[comp]
+        total, key = self._key(comp, old_key[-2])
+        self._totals[comp] = total
+        if key == old_key:
+            return
+        del self._order[bisect_left(self._order, old_key)]
+        self._keys[comp] = key
+        insort(self._order, key)
+
+    def total(self, comp):
+        return self._totals.get(comp, 0)
+
+    def rank(self, comp):
+        """Locul lui `comp`: 1 + câți concurenți sunt strict înaintea lui."""
+        return bisect_left(self._order, self._keys[comp][:-2]) + 1
+
+    def top(self, k):
+        """Primii `k` din clasament, ca (loc, concurent, total)."""
+        return self._with_ranks(self._order[:k])
+
+    def ranked(self, competitors=None):
+        """
+        Tot clasamentul ca listă de (loc, concurent, total).
+        Cu `competitors`, doar concurenții aceia, cu locurile calculate între ei
+        (cei fără scoruri în index apar cu 0 puncte).
+        """
+        if competitors is None:
+            return self._with_ranks(self._order)
+
+        wanted = set(competitors)
+        keys = [key for key in self._order if key[-1] in wanted]
+        missing = [comp for comp in competitors if comp not in self._keys]
+        if missing:
+            keys = sorted(keys + [tuple(self.sort_key(comp, [0] * len(self.routes))) + (next(self._counter), comp)
+                                  for comp in missing])
+        return self._with_ranks(keys)
+
+    def __getitem__(self, key):
+        """
+        Clasamentul ca secvență: index[i] sau index[start:stop] dă (loc, concurent, total)
+        fără a construi tot clasamentul (folosit de tabelul virtualizat).
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._order))
+            if step != 1:
+                return self.ranked()[key]
+            keys = self._order[start:stop]
+            if not keys:
+                return []
+            return self._with_ranks(keys, start, bisect_left(self._order, keys[0][:-2]) + 1)
+
+        sort_key = self._order[key]
+        comp = sort_key[-1]
+        return (bisect_left(self._order, sort_key[:-2]) + 1, comp, self._totals.get(comp, 0))
+
+    def _with_ranks(self, keys, start=0, first_rank=1):
+        """(loc, concurent, total) pentru `keys` aflate pe pozițiile start, start+1, … ale clasamentului."""
+        result = []
+        previous = None
+        for position, key in enumerate(keys, start=start + 1):
+            group, comp = key[:-2], key[-1]
+            if group != previous:  # cheie nouă → loc nou
+                rank = position if previous is not None else first_rank
+                previous = group
+            result.append((rank, comp, self._totals.get(comp, 0)))
+        return result
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, comp):
+        return comp in self._keys
@@ -4,12 +4,22 @@ from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from app.config import Config
 from app.classes.ranking_controller import RankingController
+from app.classes.ranking_index import RankingIndex
+from app.classes.countback_ranking import CountbackRanking, route_score, MAX_TOP_ATTEMPTS, MAX_ZONE_ATTEMPTS
+from app.classes.competitor_index import CompetitorIndex
+from app.classes.score_events import ScoreEventBus, REFRESH
+from app.classes.auto_scroller import AutoScroller
+from app.classes.ranking_snapshot import RankingSnapshot
+from app.classes.pdf_exporter import PdfExporter
+from app.classes.excel_exporter import ExcelExporter
+from app.classes.export_worker import ExportWorker
+from app.classes.export_cache import ExportCache
+from app.classes.score_matrix import ScoreMatrix
+from app.classes.rankings_table import RankingsTable
+from app.classes.virtual_rankings_table import VirtualRankingsTable
+from app.classes.canvas_rankings_table import CanvasRankingsTable
 from helpers.decorators import validate_competitor_and_route, log_method_call
 from tkinter import simpledialog
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-pdfmetrics.registerFont(TTFont("FreeSans", "resources/fonts/FreeSans.ttf"))
-import openpyxl
 
 class RankingManager:
     def __init__(self, app):
@@ -18,6 +28,20 @@ class RankingManager:
         self.rankings_widgets = {}
         self.rankings_window = None
         self.rankings_inner_frame = None
+        self.rankings_table = None      # tabelul virtualizat al clasamentului live
+        self.auto_scroller = None
+        self.export_worker = None       # firul pe care rulează exporturile, creat la primul export
+        self.export_cache = ExportCache()  # un clasament neschimbat nu se mai randează din nou
+        self.secondary_rankings_window = None
+        # Clasamentul sortat incremental, sincronizat cu app.route_scores
+        self.index = RankingIndex()
+        self._indexed = None            # (matricea, generația ei, departajarea) din care s-a construit indexul
+        # Locurile din runda anterioară (concurent -> loc), ultimul criteriu de departajare;
+        # se completează la finalul concursului (close_round) sau prin set_previous_round
+        self.previous_round_ranks = {}
+        # Scorurile noi se anunță ferestrelor abonate, adunate până când Tk e liber
+        master = getattr(app, 'master', None)
+        self.score_events = ScoreEventBus(schedule=master.after_idle if master is not None else None)
         # Definește fonturi consistente
         self.fonts = {
             "header": Config.FONTS["ranking_header"],
@@ -25,34 +49,101 @@ class RankingManager:
             "button": Config.FONTS["ranking_button"]
         }
 
-    def _calculate_totals(self, competitors):
-        """Returnează dict {competitor: total_puncte}."""
-        return {
-            comp: sum(
-                self.app.route_scores[comp].get(r, 0)
-                if isinstance(self.app.route_scores[comp].get(r, 0), (int, float))
-                else 0
-                for r in self.app.dynamic_routes
-            )
-            for comp in competitors
-        }
+    def score_matrix(self):
+        """
+        app.route_scores ca ScoreMatrix; un dict simplu e convertit o singură dată.
+        Traseele concursului sunt mutate pe primele coloane doar când se schimbă, ca
+        view(dynamic_routes) să fie o vedere fără copii.
+        """
+        scores = getattr(self.app, 'route_scores', None)
+        if not isinstance(scores, ScoreMatrix):
+            self.app.route_scores = scores = ScoreMatrix.from_dict(scores or {})
+        scores.set_routes(getattr(self.app, 'dynamic_routes', None) or [])
+        return scores
 
-    def _rank_with_ties(self, competitors, totals):
+    def ranking_index(self):
+        """
+        Indexul de clasament pentru traseele și concurenții curenți.
+        Ordinea e cea din Config.RANKINGS["tie_break"] (cheia din CountbackRanking.sort_key).
+        Se reconstruiește când s-au schimbat traseele, departajarea, locurile din runda anterioară
+        sau matricea de scoruri a fost golită, înlocuită ori și-a schimbat rândurile (start de
+        concurs, reset, concurent nou); scorurile ajung în el prin record_score.
+        """
+        routes = list(getattr(self.app, 'dynamic_routes', []))
+        route_scores = self.score_matrix()
+        rule = list(Config.RANKINGS["tie_break"])
+        indexed = self._indexed
+        if (self.index.routes != routes or len(self.index) != len(route_scores) or indexed is None
+                or indexed[0] is not route_scores or indexed[1:] != (route_scores.generation, rule)):
+            self.index.sort_key = CountbackRanking(rule, self.previous_round_ranks).sort_key
+            self.index.rebuild(route_scores, routes)
+            self._indexed = (route_scores, route_scores.generation, rule)
+        return self.index
+
+    def competitor_index(self, competitor_data=None):
         """
-        Returnează (sorted_list, rank_map) unde
-        rank_map[competitor] = loc (cu egalități: 1,1,3…)
+        Concurenții după nume/id: indexul din app.cm sau, pentru o altă listă
+        (ex. clasamentul secundar), unul construit din `competitor_data`.
         """
-        # sortează descendent după puncte
-        sorted_comps = sorted(competitors, key=lambda c: totals[c], reverse=True)
-        rank_map = {}
-        prev_score = None
-        current_rank = 0
-        for position, comp in enumerate(sorted_comps, start=1):
-            if totals[comp] != prev_score:  # scor nou → loc nou
-                current_rank = position
-                prev_score = totals[comp]
-            rank_map[comp] = current_rank
-        return sorted_comps, rank_map
+        if competitor_data is not None:
+            return competitor_data if isinstance(competitor_data, CompetitorIndex) else CompetitorIndex(competitor_data)
+        cm = self.app.cm
+        if not isinstance(getattr(cm, 'index', None), CompetitorIndex):
+            cm.index = CompetitorIndex(getattr(cm, 'competitor_data', []))
+        return cm.index
+
+    def standings(self, competitors=None, routes=None):
+        """
+        Clasamentul cu departajarea din Config.RANKINGS["tie_break"], ca (loc, concurent, total, rând);
+        `rând` indexează score_matrix().view(routes).
+        """
+        routes = self.app.dynamic_routes if routes is None else routes
+        engine = CountbackRanking(Config.RANKINGS["tie_break"], self.previous_round_ranks)
+        return engine.ranking(self.score_matrix(), competitors, routes)
+
+    def live_ranking(self, competitors=None):
+        """
+        (loc, concurent, total) pentru ferestrele de clasament, din indexul incremental:
+        aceeași ordine ca standings(), dar un scor nou mută doar concurentul lui.
+        """
+        index = self.ranking_index()
+        return index if competitors is None else index.ranked(competitors)
+
+    def set_previous_round(self, ranks):
+        """Locurile din runda anterioară ({concurent: loc}) pentru departajare."""
+        self.previous_round_ranks = dict(ranks)
+        self._indexed = None
+        self.refresh_rankings()
+
+    def close_round(self):
+        """Concursul s-a încheiat: clasamentul lui devine runda anterioară pentru următorul."""
+        # Toată matricea: locurile sunt folosite doar ca ordine între concurenți la egalitate
+        ranks = {competitor: rank for rank, competitor, _, _ in self.standings()}
+        self.set_previous_round(ranks)
+
+    def record_score(self, competitor, route, score):
+        """Scrie scorul în route_scores, mută concurentul în clasament și anunță schimbarea."""
+        scores = self.score_matrix().setdefault(competitor, {})
+        if route in scores and scores[route] == score:
+            return
+        scores[route] = score
+        self.ranking_index().set_score(competitor, route, score)
+        self.score_events.publish(competitor, route, score)
+
+    def clear_scores(self):
+        """Golește toate scorurile (reset) și redesenează clasamentele abonate."""
+        self.score_matrix().clear()
+        self.refresh_rankings()
+
+    def refresh_rankings(self):
+        """Lista de concurenți sau scorurile s-au schimbat altfel decât prin record_score."""
+        self.score_events.refresh()
+
+    def record_scores(self, scores):
+        """Import în masă: [(concurent, traseu, scor)], anunțate abonaților o singură dată."""
+        with self.score_events.batch():
+            for competitor, route, score in scores:
+                self.record_score(competitor, route, score)
 
     def show_rankings(self):
         """
@@ -108,16 +199,14 @@ class RankingManager:
             tk.Label(inner_frame, text=self.app.dynamic_routes[j], bg="lightgray", font=header_font).grid(row=0, column=2+j, padx=5, pady=5)
         tk.Label(inner_frame, text="Total Points", bg="lightgray", font=header_font).grid(row=0, column=2+num_routes, padx=5, pady=5)
 
-        if not hasattr(self.app, 'route_scores'):
-            self.app.route_scores = {}
+        self.score_matrix()
         for competitor in competitors:
             if competitor not in self.app.route_scores:
                 self.app.route_scores[competitor] = {}
 
         self.rankings_widgets = {}
-        # 1) calculează punctajele totale
-        totals = self._calculate_totals(competitors)
-        # 3) afişează rând cu rând
+        index = self.ranking_index()
+        # afişează rând cu rând
         for row, competitor in enumerate(competitors, start=1):
             # coloana Rank
             tk.Label(inner_frame, text=str(row), bg="lightgray") \
@@ -134,7 +223,7 @@ class RankingManager:
                 btn.grid(row=row, column=2+col, padx=5, pady=5)
                 self.rankings_widgets.setdefault(competitor, {})[route] = btn
             # Coloana Total Points:
-            total_lbl = tk.Label(inner_frame, text=str(totals[competitor]), bg="lightgray")
+            total_lbl = tk.Label(inner_frame, text=str(index.total(competitor)), bg="lightgray")
             total_lbl.grid(row=row, column=2+len(self.app.dynamic_routes), padx=5, pady=5)
             # Stochezi referința
             self.rankings_widgets.setdefault(competitor, {})['total'] = total_lbl
@@ -162,7 +251,7 @@ class RankingManager:
         from helpers.utils import load_competitors_from_csv
 
         competitor_data = load_competitors_from_csv(filepath)
-        self.secondary_competitor_data = competitor_data
+        self.secondary_competitors = CompetitorIndex(competitor_data)
         competitors = [c["name"] for c in competitor_data]
         if not competitors:
             messagebox.showinfo("Rankings", "Nu există concurenți în fișierul selectat.")
@@ -205,23 +294,18 @@ class RankingManager:
             tk.Label(inner_frame, text=self.app.dynamic_routes[j], bg="lightgray", font=header_font).grid(row=0, column=2+j, padx=5, pady=5)
         tk.Label(inner_frame, text="Total Points", bg="lightgray", font=header_font).grid(row=0, column=2+num_routes, padx=5, pady=5)
 
-        totals = self._calculate_totals(competitors)
-        sorted_comps, rank_map = self._rank_with_ties(competitors, totals)
-
-        for competitor in sorted_comps:
-            rank = rank_map[competitor]
-            total = totals[competitor]
-            # folosește rank și total când scrii în PDF/Excel
-        
-        export_pdf_btn = tk.Button(inner_frame, text="Export PDF", command=lambda: self.export_rankings_to_pdf(self.secondary_competitor_data), font=self.fonts["button"])
+        export_pdf_btn = tk.Button(inner_frame, text="Export PDF", command=lambda: self.export_rankings_to_pdf(self.secondary_competitors), font=self.fonts["button"])
         export_pdf_btn.grid(row=len(sorted_competitors)+2, column=0, padx=10, pady=10, sticky="w")
 
-        export_excel_btn = tk.Button(inner_frame, text="Export Excel", command=self.export_rankings_to_excel, font=self.fonts["button"])
+        export_excel_btn = tk.Button(inner_frame, text="Export Excel", command=lambda: self.export_rankings_to_excel(self.secondary_competitors), font=self.fonts["button"])
         export_excel_btn.grid(row=len(sorted_competitors)+2, column=1, padx=10, pady=10, sticky="e")
         open_window_button = tk.Button(inner_frame, text="Deschide Clasament", command=self.show_rankings_window, font=self.fonts["button"])
         open_window_button = tk.Button(inner_frame, text="Deschide Clasament", command=self.show_secondary_rankings_window, font=self.fonts["button"])
         open_window_button.grid(row=len(competitors)+3, column=0, padx=10, pady=5, sticky="w")
 
+        # Fereastra secundară, dacă e deschisă, trece la categoria nou aleasă
+        self.update_secondary_rankings_display()
+
     def show_rankings_window(self):
         if self.rankings_window and self.rankings_window.winfo_exists():
             self.rankings_window.lift()
@@ -239,60 +323,29 @@ class RankingManager:
         # Setare eveniment închidere fereastră
         self.rankings_window.protocol("WM_DELETE_WINDOW", self.close_rankings_window)
 
-        # Crearea unui frame pentru a conține canvas și scrollbar
+        # Crearea unui frame pentru a conține tabelul și scrollbar-ul
         self.rankings_frame = tk.Frame(self.rankings_window, bg="black")
         self.rankings_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Crearea canvas-ului pentru conținutul scrollabil
-        canvas = tk.Canvas(self.rankings_frame, bg="black")
-        self._auto_scroll_dir = 1  # 1 = în jos, -1 = în sus
-        self._auto_scroll_canvas = canvas
-       
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        # Crearea scrollbar-ului și plasarea lui în același frame
-        scrollbar = tk.Scrollbar(self.rankings_frame, orient="vertical", command=canvas.yview)
+        # Tabelul virtualizat: doar rândurile care încap pe ecran, ca widget-uri sau pe un singur canvas
+        scrollbar = tk.Scrollbar(self.rankings_frame, orient="vertical")
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Crearea containerului interior
-        self.rankings_inner_frame = tk.Frame(canvas, bg="black")
-        canvas.create_window((0, 0), window=self.rankings_inner_frame, anchor="nw")
-
-        def on_frame_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-
-        self.rankings_inner_frame.bind("<Configure>", on_frame_configure)
+        self.rankings_inner_frame = tk.Frame(self.rankings_frame, bg="black")
+        self.rankings_inner_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        table_class = CanvasRankingsTable if Config.RANKINGS["renderer"] == "canvas" else VirtualRankingsTable
+        self.rankings_table = table_class(
+            self.rankings_inner_frame, self.fonts, self.app.blue_light_color, yscrollcommand=scrollbar.set
+        )
+        scrollbar.config(command=self.rankings_table.yview)
 
-        # Apelare metodă de update
+        # Desen inițial; apoi fereastra se actualizează doar când se schimbă un scor
         self.update_rankings_display()
-        self.rankings_window.after(100, self._fractional_auto_scroll)
-
-        # Setare actualizare automată a display-ului la fiecare 5 secunde
-        self.rankings_window.after(5000, self.update_rankings_display)
-
-    def _fractional_auto_scroll(self, delay=30, delta=0.001, top_delay=7000):
-        cvs = self._auto_scroll_canvas
-        top, bot = cvs.yview()
-        # 1) Dacă suntem în sus și veneam din jos, schimbă direcția și așteaptă top_delay
-        if top <= 0.0 and self._auto_scroll_dir < 0:
-            self._auto_scroll_dir = 1
-            self.rankings_window.after(top_delay, self._fractional_auto_scroll, delay, delta, top_delay)
-            return
-
-        # 2) Dacă suntem jos și venim din sus, inversează direcția
-        if bot >= 1.0 and self._auto_scroll_dir > 0:
-            self._auto_scroll_dir = -1
-
-        # 3) Derulează puțin (delta) în direcția curentă
-        new_top = min(max(top + self._auto_scroll_dir * delta, 0.0), 1.0)
-        cvs.yview_moveto(new_top)
-
-        # 4) Programează următorul pas rapid
-        self.rankings_window.after(delay, self._fractional_auto_scroll, delay, delta, top_delay)
+        self.score_events.subscribe(self._on_scores_changed)
+        self.auto_scroller = AutoScroller(self.rankings_window, self.rankings_table)
+        self.auto_scroller.start()
 
     def show_secondary_rankings_window(self):
-        if hasattr(self, 'secondary_rankings_window') and self.secondary_rankings_window and self.secondary_rankings_window.winfo_exists():
+        if self.secondary_rankings_window and self.secondary_rankings_window.winfo_exists():
             self.secondary_rankings_window.lift()
             return
 
@@ -317,132 +370,79 @@ class RankingManager:
         canvas.create_window((0, 0), window=inner_frame, anchor="nw")
         inner_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
 
-        header_font = self.fonts["header"]
-        text_font = self.fonts["cell"]
+        # Același tabel cu rânduri refolosite ca în clasamentul live, pentru concurenții din categorie
+        self.secondary_rankings_table = RankingsTable(inner_frame, self.fonts, self.app.blue_light_color)
+        self.secondary_rankings_window.protocol("WM_DELETE_WINDOW", self.close_secondary_rankings_window)
+        self.update_secondary_rankings_display()
+        self.score_events.subscribe(self._on_secondary_scores_changed)
 
-        tk.Label(inner_frame, text="Rank", font=header_font, bg="black", fg="white").grid(row=0, column=0)
-        tk.Label(inner_frame, text="Competitor", font=header_font, bg="black", fg="white").grid(row=0, column=1)
-        tk.Label(inner_frame, text="Club", font=header_font, bg="black", fg="white").grid(row=0, column=2)
+    def update_secondary_rankings_display(self):
+        if not (self.secondary_rankings_window and self.secondary_rankings_window.winfo_exists()):
+            return
+        if not hasattr(self, 'secondary_competitors'):
+            return
 
-        for j, route in enumerate(self.app.dynamic_routes):
-            tk.Label(inner_frame, text=route, font=header_font, bg="black", fg="white").grid(row=0, column=3+j)
-        tk.Label(inner_frame, text="Total", font=header_font, bg="black", fg="white").grid(row=0, column=3+len(self.app.dynamic_routes))
+        routes = self.app.dynamic_routes
+        competitors = self.secondary_competitors
+        matrix = self.score_matrix()
 
-        if not hasattr(self, 'secondary_competitor_data'):
-            return
+        def details(competitor):
+            scores = matrix.get(competitor, {})
+            return competitors.club(competitor), [scores.get(route) for route in routes]
 
-        competitors = [c["name"] for c in self.secondary_competitor_data]
-        sorted_competitors = sorted(
-            competitors,
-            key=lambda c: sum(self.app.route_scores.get(c, {}).get(r, 0) for r in self.app.dynamic_routes),
-            reverse=True
-        )
-        
-        print("Secondary data:", self.secondary_competitor_data)
-        for i, comp in enumerate(sorted_competitors, start=1):
-            club = next((c["club"] for c in self.secondary_competitor_data if c["name"] == comp), "")
-            tk.Label(inner_frame, text=str(i), font=text_font, bg="black", fg="white").grid(row=i, column=0)
-            tk.Label(inner_frame, text=comp, font=text_font, bg="black", fg="white").grid(row=i, column=1)
-            tk.Label(inner_frame, text=club, font=text_font, bg="black", fg="white").grid(row=i, column=2)
-
-            for j, route in enumerate(self.app.dynamic_routes):
-                score = self.app.route_scores.get(comp, {}).get(route)
-                canvas_box = tk.Canvas(inner_frame, width=50, height=40, highlightthickness=1, highlightbackground="gray")
-                canvas_box.grid(row=i, column=3+j, padx=5, pady=5)
-
-                if score is None:
-                    continue
-                elif score == 0:
-                    canvas_box.create_rectangle(0, 0, 50, 40, fill="white")
-                    canvas_box.create_text(25, 20, text="0.0", font=text_font)
-                elif score >= 24:
-                    canvas_box.create_rectangle(0, 0, 50, 40, fill=self.app.blue_light_color)
-                    canvas_box.create_text(25, 20, text=f"{score:.1f}", font=text_font)
-                else:
-                    canvas_box.create_rectangle(0, 0, 25, 40, fill=self.app.blue_light_color)
-                    canvas_box.create_text(25, 20, text=f"{score:.1f}", font=text_font)
-
-            total = sum(self.app.route_scores.get(comp, {}).get(r, 0) for r in self.app.dynamic_routes)
-            tk.Label(inner_frame, text=f"{total:.1f}", font=text_font, bg="black", fg="white").grid(row=i, column=3+len(self.app.dynamic_routes))
-            
+        ranking = self.live_ranking(competitors.names())
+        self.secondary_rankings_table.render(routes, ranking, details)
+
+    def _on_secondary_scores_changed(self, changes):
+        # Doar scorurile concurenților din categoria afișată (sau un refresh) cer redesenare
+        if REFRESH in changes or any(competitor in self.secondary_competitors for competitor, _ in changes):
+            self.update_secondary_rankings_display()
 
+    def close_secondary_rankings_window(self):
+        self.score_events.unsubscribe(self._on_secondary_scores_changed)
+        if self.secondary_rankings_window:
+            self.secondary_rankings_window.destroy()
+            self.secondary_rankings_window = None
+
+    def _on_scores_changed(self, changes):
+        self.update_rankings_display()
 
     def close_rankings_window(self):
+        self.score_events.unsubscribe(self._on_scores_changed)
+        if self.auto_scroller:
+            self.auto_scroller.stop()
+            self.auto_scroller = None
         if self.rankings_window:
             self.rankings_window.destroy()
             self.rankings_window = None
 
     def update_rankings_display(self):
-        for widget in self.rankings_inner_frame.winfo_children():
-            widget.destroy()
-
-        competitors = list(self.app.route_scores.keys())
-        # Calculează totaluri și ranguri cu egalități pentru live ranking
-        totals = self._calculate_totals(competitors)
-        sorted_comps, rank_map = self._rank_with_ties(competitors, totals)
-
-        header_font = self.fonts["header"]
-        text_font = self.fonts["cell"]
-
-        tk.Label(self.rankings_inner_frame, text="Rank", font=header_font, bg="black", fg="white").grid(row=0, column=0, padx=10, pady=5)
-        tk.Label(self.rankings_inner_frame, text="Competitor", font=header_font, bg="black", fg="white").grid(row=0, column=1, padx=10, pady=5)
-        tk.Label(self.rankings_inner_frame, text="Club", font=header_font, bg="black", fg="white").grid(row=0, column=2, padx=10, pady=5)
-        for j, route in enumerate(self.app.dynamic_routes):
-            route_label = tk.Label(self.rankings_inner_frame, text=route, bg="black", fg="white")
-            route_label.grid(row=0, column=3+j, sticky="nsew", padx=0, pady=0)
-            self.rankings_inner_frame.grid_columnconfigure(3+j, weight=1)
-
-            def adjust_font(event, label=route_label):
-                height = event.height
-                width = event.width
-                font_size = min(int(height * 0.5), int(width / max(len(route), 1)))
-                label.config(font=("Helvetica", font_size, "bold"))
-
-            route_label.bind("<Configure>", adjust_font)
-        tk.Label(self.rankings_inner_frame, text="Total Points", font=header_font, bg="black", fg="white").grid(row=0, column=3+len(self.app.dynamic_routes), padx=10, pady=5)
-
-        for row, competitor in enumerate(sorted_comps, start=1):
-            tk.Label(self.rankings_inner_frame, text=str(rank_map[competitor]), font=text_font, bg="black", fg="white").grid(row=row, column=0, padx=10, pady=5)
-            tk.Label(self.rankings_inner_frame, text=competitor, font=text_font, bg="black", fg="white").grid(row=row, column=1, padx=10, pady=5)
-            club = ""
-            for comp in self.app.cm.competitor_data:
-                if comp["name"] == competitor:
-                    club = comp.get("club", "")
-                    break
-            tk.Label(self.rankings_inner_frame, text=club, font=text_font, bg="black", fg="white").grid(row=row, column=2, padx=10, pady=5)
-            for j, route in enumerate(self.app.dynamic_routes):
-                score = self.app.route_scores[competitor].get(route, None)
-                canvas = tk.Canvas(self.rankings_inner_frame, width=50, height=40, highlightthickness=1, highlightbackground="gray")
-                canvas.grid(row=row, column=3+j, padx=10, pady=5)
-                
-                if score is None:
-                    continue  # Casetă complet goală
-                elif score == 0:
-                    # Fundal alb, text 0
-                    canvas.create_rectangle(0, 0, 50, 40, fill="white", outline="")
-                    canvas.create_text(25, 20, text="0.0", fill="black", font=text_font)
-                elif score >= 24:
-                    # Fundal complet albastru
-                    canvas.create_rectangle(0, 0, 50, 40, fill=self.app.blue_light_color, outline="")
-                    canvas.create_text(25, 20, text=f"{score:.1f}", fill="black", font=text_font)
-                else:
-                    # Fundal pe jumătate albastru
-                    canvas.create_rectangle(0, 0, 25, 40, fill=self.app.blue_light_color, outline="")
-                    canvas.create_text(25, 20, text=f"{score:.1f}", fill="black", font=text_font)
-            total = sum(self.app.route_scores[competitor].get(r, 0) for r in self.app.dynamic_routes)
-            tk.Label(self.rankings_inner_frame, text=f"{total:.1f}", font=text_font, bg="black", fg="white").grid(row=row, column=3+len(self.app.dynamic_routes), padx=10, pady=5)
+        if not (self.rankings_window and self.rankings_window.winfo_exists()):
+            return
 
-        if self.rankings_window and self.rankings_window.winfo_exists():
-            self.rankings_window.after(5000, self.update_rankings_display)
+        # Clasamentul live, deja sortat și departajat; tabelul citește doar rândurile
+        # vizibile, iar scorurile lor din matricea de scoruri
+        routes = self.app.dynamic_routes
+        matrix = self.score_matrix()
+        competitors = self.competitor_index()
+
+        # O singură vedere pe randare; scorurile noi aduc oricum o randare nouă
+        values, present = matrix.view(routes)
+
+        def details(competitor):
+            row_index = matrix.row_of(competitor)
+            if row_index is None or row_index >= len(values):
+                return competitors.club(competitor), [None] * len(routes)
+            return competitors.club(competitor), [values[row_index, j] if present[row_index, j] else None for j in range(len(routes))]
+
+        self.rankings_table.render(routes, self.live_ranking(), details)
+        if self.auto_scroller:
+            self.auto_scroller.wake()
 
     def update_ranking_order(self):
         num_routes = len(self.app.dynamic_routes) if hasattr(self.app, 'dynamic_routes') else 0
         if self.rankings_window and self.rankings_window.winfo_exists():
-            sorted_competitors = sorted(
-                self.rankings_widgets.keys(),
-                key=lambda comp: sum(self.app.route_scores[comp].get(r, 0) if isinstance(self.app.route_scores[comp].get(r, 0), (int, float)) else 0 for r in self.app.dynamic_routes),
-                reverse=True
-            )
+            sorted_competitors = [comp for _, comp, _ in self.ranking_index().ranked(self.rankings_widgets.keys())]
         else:
             sorted_competitors = list(self.rankings_widgets.keys())
         for new_index, competitor in enumerate(sorted_competitors, start=1):
@@ -458,7 +458,7 @@ class RankingManager:
                 self.rankings_widgets[competitor]["total"].grid_configure(row=new_index)
 
     def update_total_points_for_competitor(self, competitor):
-        total = sum(self.app.route_scores[competitor].get(r, 0) if isinstance(self.app.route_scores[competitor].get(r, 0), (int, float)) else 0 for r in self.app.dynamic_routes)
+        total = self.ranking_index().total(competitor)
         if competitor in self.rankings_widgets and "total" in self.rankings_widgets[competitor]:
             self.rankings_widgets[competitor]["total"].config(text=f"{total:.1f}")
 
@@ -489,37 +489,27 @@ class RankingManager:
         def confirm():
             top_val = entry_top.get().strip()
             zone_val = entry_zone.get().strip()
-            score = 0
-            use_top = False
             try:
-                if top_val != "":
-                    top_num = float(top_val)
-                    if top_num == 0:
-                        score = 0
-                    else:
-                        score = 25 - ((top_num - 1) / 10)
-                        use_top = True
-                elif zone_val != "":
-                    zone_num = float(zone_val)
-                    if zone_num == 0:
-                        score = 0
-                    else:
-                        score = 10 - ((zone_num - 1) / 10)
-                else:
-                    score = 0
+                # Încercările în limitele din route_score, ca departajarea să le poată reface din punctaj
+                score, use_top = route_score(
+                    float(top_val) if top_val != "" else None,
+                    float(zone_val) if zone_val != "" else None,
+                )
             except ValueError:
-                messagebox.showerror("Eroare", "Introduceți o valoare numerică validă.")
+                messagebox.showerror(
+                    "Eroare",
+                    f"Introduceți un număr întreg de încercări: top 1-{MAX_TOP_ATTEMPTS}, "
+                    f"zonă 1-{MAX_ZONE_ATTEMPTS} (0 = fără punctaj)."
+                )
                 return
             
-            score_dict[competitor][route] = score
+            if score_dict is self.app.route_scores:
+                self.record_score(competitor, route, score)
+            else:
+                score_dict[competitor][route] = score
             route_button.config(text=f"{score:.1f}")
-            # 1) recalculezi totalul pentru acest competitor
-            new_total = sum(
-                self.app.route_scores[competitor].get(r, 0)
-                if isinstance(self.app.route_scores[competitor].get(r, 0), (int, float))
-                else 0
-                for r in self.app.dynamic_routes
-            )
+            # 1) totalul actualizat al acestui competitor, din indexul de clasament
+            new_total = self.ranking_index().total(competitor)
             # 2) actualizezi eticheta deja existentă
             widgets = self.rankings_widgets.get(competitor, {})
             total_lbl = widgets.get('total')
@@ -544,13 +534,6 @@ class RankingManager:
 
     def export_rankings_to_pdf(self, competitor_data=None):
         """Export live rankings în PDF cu acelaşi stil FRAE: culori, font FreeSans şi logo."""
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import landscape, A4
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import cm
-        import os
-
         # 1) Titlu
         title = simpledialog.askstring("Titlu Clasament", "Introdu titlul pentru PDF:")
         if not title:
@@ -562,90 +545,63 @@ class RankingManager:
         if not filepath:
             return
 
-        # 3) Datele: principal sau secundar
-        if competitor_data is None:
-            competitor_data = self.app.cm.competitor_data
-        competitors = [c["name"] for c in competitor_data]
-        routes = self.app.dynamic_routes
+        # 3) Datele (principal sau secundar) se îngheață acum; PDF-ul se scrie pe firul de export
+        snapshot = self.ranking_snapshot(title, competitor_data)
+        self.run_export("PDF", self.export_cache.write, PdfExporter(), snapshot, filepath)
 
-        # 4) Calculează totaluri și ranguri cu egalități
-        totals = self._calculate_totals(competitors)
-        sorted_comps, rank_map = self._rank_with_ties(competitors, totals)
-
-        # 5) Construieşte matricea pentru tabel
-        data = [["Loc", "Concurent", "Club"] + [str(r) for r in routes] + ["Total"]]
-        for comp in sorted_comps:
-            club = next((c.get("club", "") for c in competitor_data if c["name"] == comp), "")
-            scores = [self.app.route_scores.get(comp, {}).get(r, 0) for r in routes]
-            total = totals[comp]
-            row = [str(rank_map[comp]), comp, club] + [f"{s:.1f}" for s in scores] + [f"{total:.1f}"]
-            data.append(row)
-
-        # 6) Iniţializează PDF-ul
-        doc = SimpleDocTemplate(
-            filepath,
-            pagesize=landscape(A4),
-            rightMargin=1*cm,
-            leftMargin=1*cm,
-            topMargin=2*cm,
-            bottomMargin=1*cm
-        )
-        elements = []
-
-        # 7) Stiluri FreeSans
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(name='DejaVuTitle', fontName='FreeSans', fontSize=24, leading=28))
-        styles.add(ParagraphStyle(name='DejaVuNormal', fontName='FreeSans', fontSize=10))
-
-        # 8) Logo FRAE
-        logo_path = os.path.join(os.getcwd(), "resources/images/frae-logo.png")
-        if os.path.exists(logo_path):
-            img = RLImage(logo_path, width=3.5*cm, height=3.5*cm)
-            elements.append(img)
-
-        # 9) Titlu şi spaţiu
-        elements.append(Paragraph(title, styles["DejaVuTitle"]))
-        elements.append(Spacer(1, 12))
-
-        # 10) Creează tabelul cu stilurile din varianta veche
-        table = Table(data, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'FreeSans'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
-            ('GRID', (0, 0), (-1, -1), 0.25, colors.black),
-        ]))
-        elements.append(table)
-
-        # 11) Generează PDF-ul
-        doc.build(elements)
+    def ranking_snapshot(self, title, competitor_data=None, routes=None):
+        """Clasamentul departajat de acum, ca RankingSnapshot (pe firul Tk, înainte de export)."""
+        index = self.competitor_index(competitor_data)
+        routes = list(self.app.dynamic_routes if routes is None else routes)
+        standings = self.standings(index.names(), routes)
+        values, _ = self.score_matrix().view(routes)
+        return RankingSnapshot.from_standings(title, routes, standings, values, index.club)
 
-        
+    def run_export(self, label, job, *args):
+        """Rulează `job(*args)` pe firul de export, cu o fereastră mică de progres."""
+        if self.export_worker is None:
+            self.export_worker = ExportWorker(self.app.master)
+
+        progress_window = tk.Toplevel(self.app.master)
+        progress_window.title(f"Export {label}")
+        status = tk.Label(progress_window, text=f"{label}: se pregătește…", font=self.fonts["button"], padx=20, pady=20)
+        status.pack()
+
+        def on_progress(done, total):
+            if progress_window.winfo_exists():
+                status.config(text=f"{label}: {done}/{total}")
 
-    def export_rankings_to_excel(self):
-        """Export live rankings la Excel cu acelaşi loc pentru punctaje egale."""
+        def on_done(path):
+            if progress_window.winfo_exists():
+                progress_window.destroy()
+
+        def on_error(error):
+            if progress_window.winfo_exists():
+                progress_window.destroy()
+            messagebox.showerror("Export", f"Exportul {label} a eșuat: {error}")
+
+        self.export_worker.submit(job, *args, on_progress=on_progress, on_done=on_done, on_error=on_error)
+
+    def write_rankings_pdf(self, filepath, title, competitor_data=None):
+        """
+        Scrie clasamentul în PDF la `filepath`, pe loc și fără dialoguri (folosit și de simulare).
+        `competitor_data` e o listă de înregistrări sau un CompetitorIndex; implicit concurenții aplicației.
+        """
+        return self.export_cache.write(PdfExporter(), self.ranking_snapshot(title, competitor_data), filepath)
+
+    def export_rankings_to_excel(self, competitor_data=None):
+        """Export live rankings la Excel cu departajarea din Config.RANKINGS, pe firul de export."""
         filepath = filedialog.asksaveasfilename(defaultextension='.xlsx',
                                                 filetypes=[('Excel files','*.xlsx')])
         if not filepath:
             return
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        # antet
-        headers = ['Loc', 'Concurent'] + [str(r) for r in self.app.dynamic_routes] + ['Total']
-        ws.append(headers)
-
-        competitors = self.app.cm.get_competitors()
-        totals = self._calculate_totals(competitors)
-        sorted_comps, rank_map = self._rank_with_ties(competitors, totals)
-
-        for comp in sorted_comps:
-            row = [rank_map[comp], comp] \
-                + [self.app.route_scores.get(comp, {}).get(route, 0)
-                    for route in self.app.dynamic_routes] \
-                + [totals[comp]]
-            ws.append(row)
-        wb.save(filepath)
\ No newline at end of file
+        snapshot = self.ranking_snapshot("Clasament", competitor_data)
+        self.run_export("Excel", self.export_cache.write, ExcelExporter(), snapshot, filepath)
+
+    def write_rankings_excel(self, filepath, competitors=None):
+        """Scrie clasamentul în Excel la `filepath`, pe loc și fără dialoguri (folosit și de simulare)."""
+        index = self.competitor_index()
+        competitor_data = None
+        if competitors is not None:
+            competitor_data = [index.get(name) or {"name": name} for name in competitors]
+        return self.export_cache.write(ExcelExporter(), self.ranking_snapshot("Clasament", competitor_data), filepath)
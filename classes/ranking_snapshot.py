@@ -0,0 +1,47 @@
+# ranking_snapshot.py
+
+import hashlib
+
+class RankingSnapshot:
+    """
+    Clasamentul înghețat pentru export: titlu, trasee și rândurile gata de scris,
+    ca (loc, concurent, club, [scor pe traseu], total). Are doar date simple, așa că
+    poate fi dat unui fir sau proces de export în timp ce concursul continuă.
+    """
+
+    def __init__(self, title, routes, rows, sheet_name=None):
+        self.title = title
+        self.routes = [str(route) for route in routes]
+        self.rows = rows
+        self.sheet_name = sheet_name or title
+
+    @classmethod
+    def from_standings(cls, title, routes, standings, values, clubs, sheet_name=None):
+        """Din RankingManager.standings(): `values` e view(routes), `clubs(nume)` dă clubul."""
+        rows = []
+        for rank, competitor, total, row_index in standings:
+            scores = values[row_index].tolist() if row_index is not None else [0.0] * len(routes)
+            rows.append((rank, competitor, clubs(competitor), scores, total))
+        return cls(title, routes, rows, sheet_name)
+
+    def header(self, loc="Loc", competitor="Concurent", club="Club", total="Total"):
+        return [loc, competitor, club] + self.routes + [total]
+
+    def to_dict(self):
+        """Forma JSON a clasamentului (pentru rezultatele live)."""
+        return {
+            "title": self.title,
+            "routes": self.routes,
+            "rows": [
+                {"rank": rank, "name": competitor, "club": club, "scores": list(scores), "total": total}
+                for rank, competitor, club, scores, total in self.rows
+            ],
+        }
+
+    def digest(self):
+        """Amprenta conținutului (titlu, trasee, rânduri): aceeași pentru același clasament."""
+        content = repr((self.title, self.sheet_name, self.routes, self.rows))
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def __len__(self):
+        return len(self.rows)
@@ -0,0 +1,146 @@
+# rankings_table.py
+
+import tkinter as tk
+
+CELL_WIDTH = 50
+CELL_HEIGHT = 40
+
+class RankingRow:
+    """Widget-urile unui concurent în tabel și ce s-a desenat ultima dată în ele."""
+
+    def __init__(self, table):
+        frame = table.frame
+        text_font = table.fonts["cell"]
+        self.rank = tk.Label(frame, font=text_font, bg="black", fg="white")
+        self.name = tk.Label(frame, font=text_font, bg="black", fg="white")
+        self.club = tk.Label(frame, font=text_font, bg="black", fg="white")
+        self.cells = []
+        for _ in table.routes:
+            canvas = tk.Canvas(frame, width=CELL_WIDTH, height=CELL_HEIGHT, highlightthickness=1, highlightbackground="gray")
+            # Dreptunghiul și textul se creează o dată și se modifică la schimbarea scorului
+            rect = canvas.create_rectangle(0, 0, 0, 0, outline="", state="hidden")
+            text = canvas.create_text(CELL_WIDTH // 2, CELL_HEIGHT // 2, text="", fill="black", font=text_font)
+            self.cells.append((canvas, rect, text))
+        self.total = tk.Label(frame, font=text_font, bg="black", fg="white")
+
+        self.position = None
+        self.painted = {}  # eticheta/coloana -> ultima valoare desenată
+
+    def widgets(self):
+        return [self.rank, self.name, self.club] + [canvas for canvas, _, _ in self.cells] + [self.total]
+
+    def place(self, position):
+        if self.position == position:
+            return
+        for column, widget in enumerate(self.widgets()):
+            if self.position is None:
+                widget.grid(row=position, column=column, padx=10, pady=5)
+            else:
+                widget.grid_configure(row=position)
+        self.position = position
+
+    def hide(self):
+        for widget in self.widgets():
+            widget.grid_remove()
+        self.position = None
+        self.painted = {}
+
+    def set_label(self, key, label, text):
+        if self.painted.get(key) != text:
+            label.config(text=text)
+            self.painted[key] = text
+
+    def set_score(self, column, score, blue_color):
+        if column in self.painted and self.painted[column] == score:
+            return
+        canvas, rect, text = self.cells[column]
+        if score is None:
+            # Casetă complet goală
+            canvas.itemconfig(rect, state="hidden")
+            canvas.itemconfig(text, text="")
+        elif score == 0:
+            # Fundal alb, text 0
+            canvas.coords(rect, 0, 0, CELL_WIDTH, CELL_HEIGHT)
+            canvas.itemconfig(rect, state="normal", fill="white")
+            canvas.itemconfig(text, text="0.0")
+        else:
+            # Top: fundal complet albastru; zonă: fundal pe jumătate albastru
+            width = CELL_WIDTH if score >= 24 else CELL_WIDTH // 2
+            canvas.coords(rect, 0, 0, width, CELL_HEIGHT)
+            canvas.itemconfig(rect, state="normal", fill=blue_color)
+            canvas.itemconfig(text, text=f"{score:.1f}")
+        self.painted[column] = score
+
+
+class RankingsTable:
+    """
+    Tabelul din fereastra de clasament live, cu widget-uri refolosite între actualizări:
+    fiecare concurent își păstrează rândul, care se mută când se schimbă locul, și se
+    redesenează doar celulele al căror conținut s-a schimbat de la actualizarea anterioară.
+    """
+
+    def __init__(self, frame, fonts, blue_color):
+        self.frame = frame
+        self.fonts = fonts
+        self.blue_color = blue_color
+        self.routes = None
+        self.rows = {}    # concurent -> RankingRow
+        self.spare = []   # rânduri ascunse, gata de refolosit
+
+    def render(self, routes, ranking, details):
+        """
+        Afișează `ranking` = [(loc, concurent, total)], deja în ordinea clasamentului.
+        `details(concurent)` dă (club, scoruri), cu câte o valoare (sau None) pentru fiecare traseu din `routes`.
+        """
+        routes = list(routes)
+        if routes != self.routes:
+            self._reset(routes)
+
+        # Rândurile celor care nu mai apar devin libere înainte să fie nevoie de rânduri noi
+        shown = {competitor for _, competitor, _ in ranking}
+        for competitor in [competitor for competitor in self.rows if competitor not in shown]:
+            row = self.rows.pop(competitor)
+            row.hide()
+            self.spare.append(row)
+
+        for position, (rank, competitor, total) in enumerate(ranking, start=1):
+            row = self.rows.get(competitor)
+            if row is None:
+                row = self.spare.pop() if self.spare else RankingRow(self)
+                self.rows[competitor] = row
+
+            row.place(position)
+            self._fill(row, rank, competitor, total, details)
+
+    def _fill(self, row, rank, competitor, total, details):
+        club, scores = details(competitor)
+        row.set_label("rank", row.rank, str(rank))
+        row.set_label("name", row.name, competitor)
+        row.set_label("club", row.club, club)
+        for column, score in enumerate(scores):
+            row.set_score(column, score, self.blue_color)
+        row.set_label("total", row.total, f"{total:.1f}")
+
+    def _reset(self, routes):
+        """Traseele s-au schimbat: coloanele diferă, deci se reconstruiește tot tabelul."""
+        for widget in self.frame.winfo_children():
+            widget.destroy()
+        self.routes = routes
+        self.rows = {}
+        self.spare = []
+
+        header_font = self.fonts["header"]
+        titles = ["Rank", "Competitor", "Club"]
+        for column, title in enumerate(titles):
+            tk.Label(self.frame, text=title, font=header_font, bg="black", fg="white").grid(row=0, column=column, padx=10, pady=5)
+        for j, route in enumerate(routes):
+            route_label = tk.Label(self.frame, text=route, bg="black", fg="white")
+            route_label.grid(row=0, column=len(titles)+j, sticky="nsew", padx=0, pady=0)
+            self.frame.grid_columnconfigure(len(titles)+j, weight=1)
+
+            def adjust_font(event, label=route_label, route=route):
+                font_size = min(int(event.height * 0.5), int(event.width / max(len(route), 1)))
+                label.config(font=("Helvetica", font_size, "bold"))
+
+            route_label.bind("<Configure>", adjust_font)
+        tk.Label(self.frame, text="Total Points", font=header_font, bg="black", fg="white").grid(row=0, column=len(titles)+len(routes), padx=10, pady=5)
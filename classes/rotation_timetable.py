@@ -0,0 +1,93 @@
+# rotation_timetable.py
+
+class RotationTimetable:
+    """
+    Orarul complet al rotațiilor, calculat o singură dată la începutul rundei.
+
+    Într-o grupă toți concurenții parcurg același șablon de stări, decalat cu poziția lor
+    (concurentul i pornește la rotația i), deci tabelul concurent × rotație → stare se reduce
+    la un șablon per grupă plus poziția fiecărui concurent.
+    """
+
+    def __init__(self, contest_type, groups):
+        """`groups`: {grupă: (trasee, concurenți)}; grupa e None în afara calificărilor."""
+        self.rounds_per_move = 4 if contest_type == "finals" else 2
+        self.izolare2_steps = range(1, 4) if contest_type == "finals" else range(1, 2)
+
+        self.groups = {}
+        self.patterns = {}
+        self.finish_rotations = {}
+        self.positions = {}  # nume -> (grupă, poziție)
+        for group, (routes, competitors) in groups.items():
+            pattern = self._build_pattern(routes)
+            self.groups[group] = competitors
+            self.patterns[group] = pattern
+            self.finish_rotations[group] = self._finish_rotation(pattern, routes, len(competitors))
+            for position, comp in enumerate(competitors):
+                self.positions.setdefault(comp["name"], (group, position))
+
+    def _build_pattern(self, routes):
+        """Starea după fiecare rotație de la start (delta), până la 'Concurs' inclusiv."""
+        pattern = []
+        state = 'Call_zone'
+        delta = 0
+        while state != "Concurs":
+            route_index = delta // self.rounds_per_move
+            step = delta % self.rounds_per_move
+
+            if route_index < len(routes):
+                state = routes[route_index]
+            if route_index >= len(routes) - 1 and step >= 1:
+                state = "Concurs"
+            elif step in self.izolare2_steps:
+                state = "izolare2"
+
+            pattern.append(state)
+            delta += 1
+        return pattern
+
+    def _finish_rotation(self, pattern, routes, count):
+        """Rotația după al cărei tranzit toată grupa e în 'Concurs' (None pentru grupă goală)."""
+        if count == 0:
+            return None
+        last_route = routes[-1] if routes else None
+        done = next(delta for delta, state in enumerate(pattern) if state in ("Concurs", last_route))
+        return count - 1 + done
+
+    def changes_at(self, rotation):
+        """Perechile (concurent, stare) pentru rotația `rotation`: doar concurenții activi."""
+        changes = []
+        for group, competitors in self.groups.items():
+            pattern = self.patterns[group]
+            first = max(0, rotation - len(pattern) + 1)
+            last = min(rotation, len(competitors) - 1)
+            for position in range(first, last + 1):
+                changes.append((competitors[position], pattern[rotation - position]))
+        return changes
+
+    def state_at(self, name, rotation):
+        """Starea concurentului `name` după rotația `rotation`."""
+        group, position = self.positions[name]
+        delta = rotation - position
+        if delta < 0:
+            return 'Call_zone'
+        pattern = self.patterns[group]
+        return pattern[delta] if delta < len(pattern) else "Concurs"
+
+    def rotation_for(self, name, route):
+        """Rotația la care concurentul `name` urcă pe traseul `route` (None dacă nu e traseul lui)."""
+        position = self.positions.get(name)
+        if position is None:
+            return None
+        group, position = position
+        pattern = self.patterns[group]
+        if route not in pattern:
+            return None
+        return position + pattern.index(route)
+
+    def finish_rotation(self, group=None):
+        """Rotația la care termină grupa `group`; fără grupă, ultima dintre toate."""
+        if group is not None:
+            return self.finish_rotations.get(group)
+        rotations = [rotation for rotation in self.finish_rotations.values() if rotation is not None]
+        return max(rotations) if rotations else None
@@ -0,0 +1,70 @@
+# score_events.py
+
+import logging
+from contextlib import contextmanager
+
+# Cheia din schimbări care cere redesenarea completă (scoruri golite, listă de concurenți nouă)
+REFRESH = (None, None)
+
+class ScoreEventBus:
+    """
+    Anunță scorurile noi ferestrelor abonate, în loc ca ele să se redeseneze periodic.
+    Schimbările publicate una după alta se adună și se livrează o singură dată, ca
+    {(concurent, traseu): scor}, prin `schedule` (ex. master.after_idle); fără `schedule`
+    livrarea e imediată. În `batch()` (import în masă) livrarea așteaptă finalul blocului.
+    `refresh()` adaugă cheia REFRESH: s-a schimbat mai mult decât niște scoruri.
+    """
+
+    def __init__(self, schedule=None):
+        self.schedule = schedule
+        self._subscribers = []
+        self._pending = {}          # (concurent, traseu) -> ultimul scor publicat
+        self._flush_scheduled = False
+        self._batch_depth = 0
+
+    def subscribe(self, callback):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def publish(self, competitor, route, score):
+        self._pending[(competitor, route)] = score
+        if self._batch_depth == 0:
+            self._request_flush()
+
+    def refresh(self):
+        """Reset, scoruri golite sau concurenți adăugați / șterși / redenumiți."""
+        self.publish(*REFRESH, None)
+
+    @contextmanager
+    def batch(self):
+        """Publicările din bloc ajung la abonați o singură dată, la ieșirea din bloc."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                self._request_flush()
+
+    def _request_flush(self):
+        if self.schedule is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.schedule(self.flush)
+
+    def flush(self):
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        changes, self._pending = self._pending, {}
+        for callback in list(self._subscribers):
+            try:
+                callback(changes)
+            except Exception:
+                logging.exception(f"Score subscriber {callback} failed")
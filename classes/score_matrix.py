@@ -0,0 +1,260 @@
+# score_matrix.py
+
+from collections.abc import MutableMapping
+import numpy as np
+
+class ScoreRow(MutableMapping):
+    """Scorurile unui concurent ca {traseu: scor}, citite și scrise direct în ScoreMatrix."""
+
+    __slots__ = ("matrix", "name")
+
+    def __init__(self, matrix, name):
+        self.matrix = matrix
+        self.name = name
+
+    def __getitem__(self, route):
+        row = self.matrix._rows[self.name]
+        col = self.matrix._cols.get(route)
+        if col is None or not self.matrix.present[row, col]:
+            raise KeyError(route)
+        return self.matrix.values[row, col].item()
+
+    def __setitem__(self, route, score):
+        self.matrix.set(self.name, route, score)
+
+    def __delitem__(self, route):
+        if route not in self:
+            raise KeyError(route)
+        self.matrix.set(self.name, route, None)
+
+    def __iter__(self):
+        row = self.matrix._rows[self.name]
+        present = self.matrix.present
+        return iter([route for route, col in self.matrix._cols.items() if present[row, col]])
+
+    def __len__(self):
+        row = self.matrix._rows[self.name]
+        return int(self.matrix.present[row, :len(self.matrix._routes)].sum())
+
+    def __repr__(self):
+        return f"ScoreRow({self.name!r}, {dict(self)!r})"
+
+
+class ScoreMatrix(MutableMapping):
+    """
+    Scorurile concursului pe coloane: o matrice float concurenți × trasee și o mască
+    pentru celulele notate, plus hărțile nume -> rând și traseu -> coloană.
+    Se comportă ca vechiul dict {concurent: {traseu: scor}}; totalurile și clasamentul
+    se calculează vectorizat, iar exporturile citesc direct din `view()`.
+    Un scor nenumeric (ex. textul traseului de pe buton) e tratat ca celulă nenotată.
+    """
+
+    def __init__(self, routes=(), capacity=64):
+        self._names = []    # rândurile, în ordinea adăugării (departajează egalitățile)
+        self._rows = {}     # nume -> rând
+        self._routes = []   # coloanele
+        self._cols = {}     # traseu -> coloană
+        self.values = np.zeros((capacity, max(len(routes), 8)))
+        self.present = np.zeros(self.values.shape, dtype=bool)
+        # Crește la orice schimbare care nu trece prin set() (clear, rând înlocuit sau șters),
+        # ca indexurile derivate (RankingIndex) să știe că trebuie reconstruite
+        self.generation = 0
+        self._columns_cache = (None, None)   # (trasee, indicii coloanelor lor) pentru view()
+        for route in routes:
+            self._add_route(route)
+
+    @classmethod
+    def from_dict(cls, route_scores, routes=()):
+        matrix = cls(routes, capacity=max(len(route_scores), 64))
+        for name, scores in route_scores.items():
+            matrix[name] = scores
+        return matrix
+
+    #------------------------------
+    # Fațada de dicționar
+
+    def __getitem__(self, name):
+        if name not in self._rows:
+            raise KeyError(name)
+        return ScoreRow(self, name)
+
+    def __setitem__(self, name, scores):
+        scores = dict(scores)  # poate fi chiar rândul acesta
+        self.generation += 1
+        row = self._rows.get(name)
+        if row is None:
+            row = self._add_name(name)
+        else:
+            self.values[row] = 0
+            self.present[row] = False
+        for route, score in scores.items():
+            self.set(name, route, score)
+
+    def __delitem__(self, name):
+        row = self._rows.pop(name)
+        self.generation += 1
+        n = len(self._names)
+        self.values[row:n - 1] = self.values[row + 1:n]
+        self.present[row:n - 1] = self.present[row + 1:n]
+        self.values[n - 1] = 0
+        self.present[n - 1] = False
+        del self._names[row]
+        for following in self._names[row:]:
+            self._rows[following] -= 1
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def setdefault(self, name, default=()):
+        # Întoarce rândul din matrice, nu `default`, ca scrierile ulterioare să ajungă în matrice
+        if name not in self._rows:
+            self[name] = default
+        return self[name]
+
+    def clear(self):
+        n = len(self._names)
+        self.values[:n] = 0
+        self.present[:n] = False
+        self._names = []
+        self._rows = {}
+        self.generation += 1
+
+    def __repr__(self):
+        return f"ScoreMatrix({len(self._names)} concurenți × {len(self._routes)} trasee)"
+
+    #------------------------------
+    # Scriere
+
+    def set(self, name, route, score):
+        row = self._rows.get(name)
+        if row is None:
+            row = self._add_name(name)
+        col = self._cols.get(route)
+        if col is None:
+            col = self._add_route(route)
+
+        if isinstance(score, (int, float)):
+            self.values[row, col] = score
+            self.present[row, col] = True
+        else:
+            self.values[row, col] = 0
+            self.present[row, col] = False
+
+    def row_of(self, name):
+        return self._rows.get(name)
+
+    def _add_name(self, name):
+        row = len(self._names)
+        self._reserve(row + 1, self.values.shape[1])
+        self._names.append(name)
+        self._rows[name] = row
+        return row
+
+    def _add_route(self, route):
+        col = len(self._routes)
+        self._reserve(self.values.shape[0], col + 1)
+        self._routes.append(route)
+        self._cols[route] = col
+        self._columns_cache = (None, None)
+        return col
+
+    def _reserve(self, rows, cols):
+        """Mărește matricea (capacitatea se dublează), păstrând datele."""
+        capacity_rows, capacity_cols = self.values.shape
+        if rows <= capacity_rows and cols <= capacity_cols:
+            return
+        shape = (max(rows, capacity_rows * 2 if rows > capacity_rows else capacity_rows),
+                 max(cols, capacity_cols * 2 if cols > capacity_cols else capacity_cols))
+        values = np.zeros(shape)
+        present = np.zeros(shape, dtype=bool)
+        values[:capacity_rows, :capacity_cols] = self.values
+        present[:capacity_rows, :capacity_cols] = self.present
+        self.values, self.present = values, present
+
+    #------------------------------
+    # Citire vectorizată
+
+    def set_routes(self, routes):
+        """
+        Așază `routes` pe primele coloane, în ordinea dată, ca `view(routes)` să fie o felie.
+        E o scriere: o face RankingManager.score_matrix() când se schimbă traseele concursului, nu view().
+        """
+        routes = list(routes)
+        if self._routes[:len(routes)] == routes:
+            return
+        for route in routes:
+            if route not in self._cols:
+                self._add_route(route)
+
+        wanted = set(routes)
+        order = routes + [route for route in self._routes if route not in wanted]
+        permutation = [self._cols[route] for route in order]
+        width = len(order)
+        self.values[:, :width] = self.values[:, permutation]
+        self.present[:, :width] = self.present[:, permutation]
+        self._routes = order
+        self._cols = {route: col for col, route in enumerate(order)}
+        self._columns_cache = (None, None)
+
+    def _columns(self, routes):
+        """Indicii coloanelor pentru `routes` (-1 pentru un traseu fără nicio coloană), refolosiți între apeluri."""
+        cached_routes, columns = self._columns_cache
+        if cached_routes != routes:
+            columns = np.array([self._cols.get(route, -1) for route in routes], dtype=int)
+            self._columns_cache = (list(routes), columns)
+        return columns
+
+    def view(self, routes=None):
+        """
+        (valori, mască) pentru toți concurenții pe `routes`, fără să schimbe matricea.
+        Când `routes` sunt primele coloane (vezi set_routes) rezultatul e o vedere, fără copii;
+        altfel e o copie luată prin permutarea de coloane din cache.
+        """
+        n = len(self._names)
+        if routes is None or self._routes[:len(routes)] == list(routes):
+            width = len(self._routes) if routes is None else len(routes)
+            return self.values[:n, :width], self.present[:n, :width]
+
+        columns = self._columns(list(routes))
+        known = columns >= 0
+        safe = np.maximum(columns, 0)
+        values = np.where(known, self.values[:n, safe], 0.0)
+        present = self.present[:n, safe] & known
+        return values, present
+
+    def totals(self, routes=None):
+        values, _ = self.view(routes)
+        # Celulele nenotate sunt 0; rotunjirea ține egale totalurile egale pe hârtie
+        return np.round(values.sum(axis=1), 6)
+
+    def ranking(self, names=None, routes=None):
+        """
+        Clasamentul cu locuri egale la punctaj egal, ca listă de (loc, nume, total, rând).
+        `rând` indexează `view(routes)`; e None pentru numele cerute care nu au scoruri.
+        La punctaj egal rămâne ordinea din `names` (sau ordinea adăugării).
+        """
+        totals = self.totals(routes)
+        if names is None:
+            labels = self._names
+            rows = np.arange(len(labels))
+        else:
+            labels = list(names)
+            rows = np.array([self._rows.get(name, -1) for name in labels], dtype=int)
+            totals = np.where(rows >= 0, totals[np.maximum(rows, 0)], 0) if len(totals) else np.zeros(len(labels))
+        if not labels:
+            return []
+
+        order = np.lexsort((np.arange(len(labels)), -totals))
+        sorted_totals = totals[order]
+        new_score = np.r_[True, sorted_totals[1:] != sorted_totals[:-1]]
+        ranks = np.maximum.accumulate(np.where(new_score, np.arange(1, len(order) + 1), 0))
+        return [
+            (int(rank), labels[k], float(total), int(rows[k]) if rows[k] >= 0 else None)
+            for rank, k, total in zip(ranks, order, sorted_totals)
+        ]
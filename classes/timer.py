@@ -3,19 +3,13 @@
 import time
 import logging
 import threading
-import numpy as np
-import sounddevice as sd
 import math
 from tkinter import messagebox
+from app.classes.audio import AudioEngine
+from app.classes.contest_engine import ContestEngine, BEEP_TIMINGS, END_BEEP_DURATION
+from app.classes.contest_scheduler import ContestScheduler
 from helpers.decorators import catch_exceptions, log_method_call
-
-# Dicționar pentru configurarea timpilor de beep
-BEEP_TIMINGS = {
-    60: 1.0,    # La 60 secunde rămase, beep de 1 sec
-    3: 0.5,     # La 3 secunde rămase, beep de 0.5 sec
-    2: 0.5,     # La 2 secunde rămase, beep de 0.5 sec
-    1: 0.5      # La 1 secundă rămasă, beep de 0.5 sec
-}
+from helpers.utils import delegate_to
 
 # Configurare logging: nivelul poate fi schimbat (ex. DEBUG, INFO, WARNING, etc.)
 logging.basicConfig(
@@ -24,6 +18,20 @@ logging.basicConfig(
 )
 
 class Timer:
+    """Afișajul Tk al cronometrului; fazele și timpul rămas sunt ținute de ContestEngine."""
+
+    # Starea cronometrului stă în motorul concursului
+    running = delegate_to("engine", "running")
+    transit = delegate_to("engine", "transit")
+    manual_adjustment = delegate_to("engine", "manual_adjustment")
+    initial_time = delegate_to("engine", "initial_time")
+    transit_time = delegate_to("engine", "transit_time")
+    preview_time = delegate_to("engine", "preview_time")
+    remaining_time = delegate_to("engine", "remaining_time")
+    paused_time = delegate_to("engine", "paused_time")
+    preview_completed = delegate_to("engine", "preview_completed")
+    countdown_type = delegate_to("engine", "countdown_type")
+    deadline = delegate_to("engine", "deadline")
 
     def __init__(self, parent, ui, button_manager, authentication):
         self.parent = parent
@@ -31,21 +39,19 @@ class Timer:
         self.ui = ui
         self.authentication = authentication
 
-        # Setări pentru cronometru
-        self.running = False
-        self.transit = False
-        self.manual_adjustment = False
-
-        # Setări temporale folosind constantele definite
-        self.initial_time = 4 * 60          # 4 minute = 240 secunde
-        self.transit_time = 15              # 15 secunde
-        self.remaining_time = self.initial_time
-        self.paused_time = 0  # Store paused time
-        self.preview_time = 8 * 60
-        self.preview_completed = False # if 
-        self.after_id = None
         self.external_timer_displays = []
 
+        # Beep-urile sunt sintetizate o singură dată; stream-ul se deschide din run_app
+        self.audio = AudioEngine(set(BEEP_TIMINGS.values()) | {END_BEEP_DURATION})
+
+        # Motorul concursului (al aplicației, dacă există) ne anunță fiecare tick și tranziție
+        self.engine = getattr(parent, "engine", None) or ContestEngine()
+        self.engine.listener = self
+        self.engine.audio = self.audio
+
+        # Bucla `after` comună tuturor concursurilor din aplicație
+        self.scheduler = getattr(parent, "scheduler", None) or ContestScheduler(parent.master)
+
     #------------------------------
 
 
@@ -55,66 +61,35 @@ class Timer:
         if self.parent.contest_type is None:
             return
 
-        # self.reset_timer()
-
         # change Start button text
         self.button_manager.alter_button('Start time', text="Pause", command=self.pause_timer)
 
         if not self.running:
-            self.running = True
-
             # Set the start time when starting the timer
             self.start_time = time.time()  # Capture the current time when the timer starts
 
-        if self.parent.contest_type == "crb":
-            self.manual_adjustment = True
-            self.remaining_time = self.remaining_time  # utilizează timpul deja setat manual
-        elif self.manual_adjustment:
-            self.remaining_time = self.paused_time
-        else:
-            if self.parent.contest_type == "qualifiers":
-                self.remaining_time = self.initial_time  # 4-minute countdown
-            else:
-                self.remaining_time = self.preview_time  # 8-minute preview
-
-        # If the contest is qualifiers, use 4min countdown directly
-        if self.parent.contest_type == "qualifiers":
-            self.countdown(countdown_type="4min")
-        elif self.parent.contest_type == "crb":
-            self.countdown(countdown_type="4min")
-        else:
-            self.countdown(countdown_type="8min")
-        
+        self.engine.start()
+        self._tick()
+
         self.parent.toggle_button("Start global time sync", False)
         self.parent.toggle_button("Start time", True)
 
     def start_pause_between_rounds(self):
-        if hasattr(self.parent, 'pause_duration'):
-            pause_seconds = self.parent.pause_duration * 60
-            self.remaining_time = pause_seconds
-            self.parent.canvas.itemconfig(self.parent.time_text, text="Pauză între trasee")
-            self.running = True
-            logging.debug(f"Start pauză între runde: {self.remaining_time} secunde.")
-            self.countdown(countdown_type="pause")
-        else:
-            logging.error("Durata pauzei nu este setată!")
-    
+        self.engine.start_pause_between_rounds()
+        self._tick()
+
     def stop_timer(self):
-        self.running = False
-        if self.after_id is not None:
-            self.parent.master.after_cancel(self.after_id)
-            self.after_id = None
-        self.parent.canvas.itemconfig(self.parent.time_text, text="STOP!")
-    
+        self._cancel_tick()
+        self.engine.stop()
+
     # Pauses the timer and stores the state
     def pause_timer(self):
         logging.debug("Paused timer")
 
-        if self.running:
-            self.running = False  # Stop the timer
+        if self.engine.pause():
+            self._cancel_tick()
 
-            # Save the remaining time and current position of the bar
-            self.paused_time = self.remaining_time
+            # Save the current position of the bar
             self.paused_position = self.parent.canvas.coords(self.parent.bar)[2]  # Save the current position on the bar
 
             # change Start button text
@@ -123,26 +98,10 @@ class Timer:
     # Resumes the timer and sets the time to the last modified position
     def resume_timer(self):
         logging.debug("Resume timer")
-        #time.time() - (self.initial_time - self.paused_time)
-
-        if not self.running:
-            self.running = True  # Start the timer again
-
-            # Update the remaining time when resuming
-            self.remaining_time = self.paused_time
 
+        if self.engine.resume():
             self.button_manager.alter_button('Start time', text="Pause", command=self.pause_timer)
-
-            # If the preview has been completed, start the 4-minute countdown
-            if self.remaining_time <= self.transit_time and self.transit:
-                logging.debug("Resuming in transit timer")
-                self.countdown(countdown_type="transit")
-            elif self.preview_completed:
-                logging.debug("Resuming in 4 minutes timer")
-                self.countdown(countdown_type="4min")  # Start 4-minute countdown
-            else:
-                logging.debug("Resuming in 8 minutes timer")
-                self.countdown(countdown_type="8min")  # Call countdown_8_minute method
+            self._tick()
 
     def reset_timer(self):
 
@@ -159,32 +118,9 @@ class Timer:
 
         logging.debug(f"Timer has been Reset!")
 
-
-        # ✅ Reset all competitors' states
-        for comp in self.parent.contest_competitors:
-            comp["state"] = 'Call_zone'  # Remove any assigned routes
-            comp["transit_status"] = False  # Reset transit status if needed
-            comp["start"] = None
-
-        # Set state flags to ensure it's reset to an idle state
-        self.running = False
-        self.transit = False
-        self.remaining_time = self.preview_time  # Set to 8 minutes for preview
-        self.preview_completed = True  # Reset preview completion flag
-        self.manual_adjustment = False
-        self.parent.rotation_count = 0
-        self.parent.rotation_semifinala = 0
-        self.parent.rotation_contest = 0
-        self.parent.contest_finished = []
-        self.dynamic_routes_number = 0
-        self.dynamic_routes = []
-        self.routes_A = []
-        self.routes_B = []
-        self.group_A = []
-        self.group_B = []
-        self.parent.isolation1_contest = self.parent.contest_competitors
-        self.parent.isolation2_contest = []
-        self.parent.contest_finished = []
+        # Reset all competitors' states and the timer flags to an idle state
+        self._cancel_tick()
+        self.engine.reset()
 
         # Clear the progress bar and reset to 100%
         self.parent.canvas.coords(self.parent.bar, 0, 0, self.parent.canvas.winfo_width(), int(self.parent.canvas.winfo_height()))
@@ -208,130 +144,101 @@ class Timer:
         # Redraw content
         self.parent.update_display_window_contest()
         
-        if hasattr(self.parent, 'route_scores'):
-            self.parent.route_scores.clear()
+        # Scorurile golite ajung în clasamente (fereastra live, rezultatele live) printr-un refresh
+        self.parent.ranking_manager.clear_scores()
 
         if hasattr(self.parent.ranking_manager, 'rankings_frame') and self.parent.ranking_manager.rankings_frame:
             self.parent.ranking_manager.rankings_frame.grid_forget()
 
     @catch_exceptions
     def countdown(self, countdown_type="4min"):
+        """Pornește faza `countdown_type` cu deadline-ul la `remaining_time` secunde de acum."""
+        self.engine.start_phase(countdown_type)
+        self._tick()
 
-        # Check if countdown is running
-        if not self.running:
-            return
+    def _cancel_tick(self):
+        self.scheduler.cancel(self.engine)
+
+    def seconds_left(self):
+        return self.engine.seconds_left()
+
+    def cancel_beeps(self):
+        """Anulează beep-urile programate (pauză, reset, ajustare manuală sau stop)."""
+        self.engine.cancel_beeps()
+
+    def _tick(self):
+        """Rulează un tick al motorului acum; următoarele vin din planificatorul comun."""
+        self.scheduler.tick_now(self.engine)
+
+    #------------------------------
+    # Evenimentele motorului
 
-        start_time = time.time()  # Measure execution time for delay adjustment
+    def on_tick(self, countdown_type, remaining, crossed):
 
         # Update timer display and progress bar
         self.update_timer()
         self.update_bar()
 
-        # Determine the countdown duration and beep timings
-        countdown_map = {
-            "8min": self.preview_time,
-            "4min": self.initial_time,
-            "transit": self.transit_time
-        }
-        total_time = countdown_map.get(countdown_type, self.remaining_time)
-
-        # Use the BEEP_TIMINGS dictionary to determine if a beep should occur
-        if self.remaining_time in BEEP_TIMINGS:
-            self.beep(BEEP_TIMINGS[self.remaining_time])
-
-        # time ends here
-        if self.remaining_time == 0:
-            beep_duration = 1.0
-
-            # CRB: fără tranzit, fără altă logică
-            if self.parent.contest_type == "crb":
-                self.beep(beep_duration)
-                self.stop_timer()
-                self.parent.canvas.itemconfig(self.parent.time_text, text="STOP!", fill=self.parent.red_color)
-                logging.debug("CRB timer finished — Concurs încheiat.")
-                return
-
-            if countdown_type == "pause":
-                logging.debug("Pauza între runde terminată. Timer calls parent logic for next round.")
-                self.beep(beep_duration)
-                self.parent.on_pause_finished()
- 
-            # the countdown type is 4 minutes means we already run this
-            elif countdown_type == "4min":
-                self.beep(beep_duration)
-                self.transit = True
-                self.remaining_time = self.transit_time
-                self.countdown("transit")
- 
-                # update in transit status
-                self.parent.update_transit_status()
- 
-                # Redraw content
-                self.parent.update_display_window_contest()
- 
-            else:
-                self.beep(beep_duration)
-                self.transit = False
-                self.remaining_time = self.initial_time
-                self.preview_completed = True
-                self.countdown("4min")
- 
-                # run finals logic before transit state is over
-                self.parent.run_competitor_logic_general()
- 
-                # Redraw content
-                self.parent.update_display_window_contest()
+        if remaining == 0:
+            return
 
-        else:
-            # When the remaining time reaches 3 seconds during the 4-minute countdown
-            if countdown_type == "4min":
-                self.parent.canvas.itemconfig(self.parent.bar, fill=self.parent.green_color)
+        # When the remaining time reaches 3 seconds during the 4-minute countdown
+        if countdown_type == "4min":
+            self.parent.canvas.itemconfig(self.parent.bar, fill=self.parent.green_color)
+
+            # Change the color of the time text to white
+            self.parent.canvas.itemconfig(self.parent.time_text, fill=self.parent.white_color)
+
+            # flassh the background
+            if 3 in crossed:
+                self.flash_bar_background_color(BEEP_TIMINGS[3])
+
+        if countdown_type == "transit":
 
-                # Change the color of the time text to white
-                self.parent.canvas.itemconfig(self.parent.time_text, fill=self.parent.white_color)
+            # Change the bar's background color
+            self.parent.canvas.itemconfig(self.parent.bar, fill=self.parent.blue_light_color)
 
-                # flassh the background
-                if self.remaining_time == 3:
-                    self.flash_bar_background_color(BEEP_TIMINGS[self.remaining_time])
+            # Change the color of the time text to white
+            self.parent.canvas.itemconfig(self.parent.time_text, fill=self.parent.black_color)
 
-            if countdown_type == "transit":
+    def on_beep(self, duration):
+        self.beep(duration)
 
-                # Change the bar's background color
-                self.parent.canvas.itemconfig(self.parent.bar, fill=self.parent.blue_light_color)
+    def on_transit(self):
+        # Redraw content
+        self.parent.update_display_window_contest()
 
-                # Change the color of the time text to white
-                self.parent.canvas.itemconfig(self.parent.time_text, fill=self.parent.black_color)
+    def on_rotation(self):
+        # Redraw content
+        self.parent.update_display_window_contest()
 
-            self.remaining_time -= 1
+    def on_pause_started(self):
+        self.parent.canvas.itemconfig(self.parent.time_text, text="Pauză între trasee")
+        self.parent.update_display_window_contest()
 
-            # Ensure remaining time doesn't go below 0
-            if self.remaining_time < 0:
-                self.remaining_time = 0
+    def on_round_started(self, number):
+        self.parent.canvas.itemconfig(self.parent.time_text, text=f"Runda {number}")
 
-            # Calculate elapsed time and adjust the delay to maintain a 1-second interval
-            elapsed_time = time.time() - start_time
-            delay = max(1000 - int(elapsed_time * 1000), 1)  # Adjust delay for 1-second interval
-            if self.after_id is not None:
-                self.parent.master.after_cancel(self.after_id)
-            self.after_id = self.parent.master.after(delay, self.countdown, countdown_type)  # Call countdown recursively with the same type
+    def on_stopped(self):
+        self._cancel_tick()
+        if self.engine.is_contest_finished():
+            self.parent.ranking_manager.close_round()
+        if self.parent.contest_type == "crb":
+            self.parent.canvas.itemconfig(self.parent.time_text, text="STOP!", fill=self.parent.red_color)
+        else:
+            self.parent.canvas.itemconfig(self.parent.time_text, text="STOP!")
 
     def beep(self, duration_sec):
-        # Redăm sunetul pe un thread separat pentru a nu bloca interfața
-        def play_sound():
-            fs = 44100
-            t = np.linspace(0, duration_sec, int(fs * duration_sec), endpoint=False)
-            data = np.sin(2 * np.pi * 440 * t)
-            sd.play(data, fs)
-        threading.Thread(target=play_sound, daemon=True).start()
+        # Buffer pre-sintetizat pus în stream-ul deja deschis: fără thread-uri sau alocări aici
+        self.audio.play(duration_sec)
 
     def adjust_time(self, new_time):
-        # During transition, ensure the time is not set to more than 15 seconds
-        if self.transit:
-            new_time = min(new_time, self.transit_time)  # Ensure it's within the transition period
+        # During transition the engine keeps the time within the 15-second transit
+        self.engine.adjust(new_time)
 
-        self.paused_time = new_time
-        self.remaining_time = new_time  # Update remaining_time based on the new time
-        self.manual_adjustment = True  # Set flag indicating manual adjustment
+        # A running countdown continues from the new time against a fresh deadline
+        if self.running:
+            self._tick()
 
         self.update_timer()  # Show updated time on screen
         self.update_bar()  # Show updated progress bar
@@ -384,14 +291,7 @@ class Timer:
 
     # Determine total time based on phase
     def get_total_time(self):
-        if self.transit:
-            total = self.transit_time
-        elif not self.preview_completed:
-            total = self.preview_time  # Use 8-minute preview total
-        else:
-            total = self.initial_time  # Use 4-minute total after preview
-
-        return total
+        return self.engine.get_total_time()
     
     #set manual time for crb
     def set_manual_timer(self, total_seconds):
@@ -19,6 +19,9 @@ class Ui:
         self.parent = parent
         self.master = self.parent.master
 
+        # Secțiunile create o dată și actualizate pe loc: (frame, row, column) -> {"details", "label", "options"}
+        self.sections = {}
+
     def create_frame(self, frame_name, window=None, row=0, column=0, padx=5, pady=5, sticky="nsew", **kwargs):
         """
         Creates a frame in the specified window (or self.master if not provided) and stores it in the app_frames dictionary.
@@ -222,11 +225,37 @@ class Ui:
 
     # Use a helper function to create labels and details for each section
     def create_section(self, frame, row, column, label_text, details_text, font, section_name="", bg_color="lightblue", sticky="nsew", columnspan=1):
-
-        self.render_text(details_text,frame,row, column,columnspan,sticky=sticky,padx=40,pady=40,font=font,bg=bg_color)
-
-        self.render_text(label_text,frame,row+1,column,columnspan,sticky=sticky,padx=40,pady=40,
-            font=(self.parent.font_face, 16, 'bold'),bg=bg_color)
+        """
+        Afișează o secțiune (text + titlu) în `frame`. Label-urile se creează la primul apel;
+        apelurile următoare pentru aceeași poziție modifică doar opțiunile care s-au schimbat.
+        """
+        key = (frame, row, column)
+        section = self.sections.get(key)
+
+        if section is None or not section["details"].winfo_exists():
+            # Secțiunile ferestrelor închise nu mai sunt folosite
+            self.sections = {k: v for k, v in self.sections.items() if v["details"].winfo_exists()}
+
+            details = self.render_text(details_text,frame,row, column,columnspan,sticky=sticky,padx=40,pady=40,font=font,bg=bg_color)
+
+            label = self.render_text(label_text,frame,row+1,column,columnspan,sticky=sticky,padx=40,pady=40,
+                font=(self.parent.font_face, 16, 'bold'),bg=bg_color)
+
+            self.sections[key] = {
+                "details": details,
+                "label": label,
+                "options": {"details": (details_text, font, bg_color), "label": (label_text, bg_color)}
+            }
+            return details
+
+        options = section["options"]
+        if options["details"] != (details_text, font, bg_color):
+            section["details"].config(text=details_text, font=font, bg=bg_color)
+            options["details"] = (details_text, font, bg_color)
+        if options["label"] != (label_text, bg_color):
+            section["label"].config(text=label_text, bg=bg_color)
+            options["label"] = (label_text, bg_color)
+        return section["details"]
 
     def configure_grid(self, widget, grid_type, positions=[], weights=[], uniform=False):
         """
@@ -0,0 +1,113 @@
+# virtual_rankings_table.py
+
+from app.classes.rankings_table import RankingsTable, RankingRow, CELL_HEIGHT
+
+class VirtualRankingsTable(RankingsTable):
+    """
+    Clasamentul live pentru liste lungi: există widget-uri doar pentru rândurile care încap în
+    fereastră (plus `overscan` de rezervă), legate de poziții, nu de concurenți.
+    Derularea se ține în rânduri de date (`top`), așa că o actualizare sau un pas de derulare
+    costă la fel indiferent de numărul concurenților.
+    Rândurile de aici sunt în grid și nu se pot muta cu câțiva pixeli: afișajul avansează rând
+    cu rând, iar `top` rămâne fracționar doar ca viteza medie a derulării să fie corectă.
+    CanvasRankingsTable mută rândurile și cu fracțiunea de rând (`_offset`), deci derulează lin.
+    """
+
+    def __init__(self, frame, fonts, blue_color, overscan=2, yscrollcommand=None):
+        super().__init__(frame, fonts, blue_color)
+        self.overscan = overscan
+        self.yscrollcommand = yscrollcommand
+        self.ranking = []
+        self.details = None
+        self.slots = []          # rândurile de widget-uri, slots[k] afișează ranking[first + k]
+        self.top = 0.0           # primul rând vizibil, în rânduri de date (poate fi fracționar)
+        self.first = None        # rândul de date afișat în slots[0]
+        self.visible_rows = 15   # până la prima măsurare a ferestrei
+        self.row_height = CELL_HEIGHT + 10  # pixeli pe rând, estimat până la prima măsurare
+        frame.bind("<Configure>", self._on_resize, add="+")
+
+    def render(self, routes, ranking, details):
+        """`ranking` e orice secvență de (loc, concurent, total) cu len() și felii (ex. RankingIndex)."""
+        routes = list(routes)
+        if routes != self.routes:
+            self._reset(routes)
+            self.slots = []
+        self.ranking = ranking
+        self.details = details
+        self.top = min(self.top, self.max_top)
+        self._paint()
+
+    @property
+    def max_top(self):
+        return max(0, len(self.ranking) - self.visible_rows)
+
+    @property
+    def at_top(self):
+        return self.top <= 0
+
+    @property
+    def at_bottom(self):
+        return self.top >= self.max_top
+
+    def scroll_to(self, top):
+        self.top = min(max(top, 0.0), self.max_top)
+        if int(self.top) != self.first:
+            self._paint()
+            return
+        self._offset(self.top - self.first)
+        if self.yscrollcommand:
+            self.yscrollcommand(*self._fractions())
+
+    def _offset(self, rows):
+        """Fracțiunea de rând (0 <= rows < 1) cu care se mută rândurile în sus; în grid, nimic."""
+
+    def scroll_by(self, rows):
+        self.scroll_to(self.top + rows)
+
+    def yview(self, *args):
+        """Comanda pentru tk.Scrollbar: ("moveto", fracție) sau ("scroll", n, "units"/"pages")."""
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self.ranking))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.scroll_by(int(args[1]) * step)
+
+    def _fractions(self):
+        total = max(len(self.ranking), 1)
+        return self.top / total, min((self.top + self.visible_rows) / total, 1.0)
+
+    def _paint(self):
+        self.first = first = int(self.top)
+        rows = self.ranking[first:first + self.visible_rows + self.overscan]
+        while len(self.slots) < len(rows):
+            self.slots.append(RankingRow(self))
+
+        for k, slot in enumerate(self.slots):
+            if k >= len(rows):
+                if slot.position is not None:
+                    slot.hide()
+                continue
+            rank, competitor, total = rows[k]
+            slot.place(k + 1)  # rândul 0 e antetul
+            self._fill(slot, rank, competitor, total, self.details)
+
+        self._offset(self.top - first)
+        if self.yscrollcommand:
+            self.yscrollcommand(*self._fractions())
+
+    def _on_resize(self, event):
+        """Recalculează câte rânduri încap, din înălțimea ferestrei și a primului rând afișat."""
+        if not self.slots or self.slots[0].position is None:
+            return
+        header_height = self.frame.grid_bbox(0, 0)[3]
+        row_height = self.frame.grid_bbox(0, 1)[3]
+        if row_height <= 0:
+            return
+        self.row_height = row_height
+        visible_rows = max(1, (event.height - header_height) // row_height)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.top = min(self.top, self.max_top)
+            self._paint()
@@ -44,9 +44,36 @@ class Config:
         "pause_between_rounds": 90
     }
 
+    QUALIFIERS = {
+        "groups": 2,    # grupe care urcă în paralel pe blocuri separate de trasee
+        "rounds": 2     # runde; între runde grupele trec pe blocul următor
+    }
+
+    RANKINGS = {
+        # "widgets": rânduri de Label/Canvas refolosite; "canvas": tot tabelul pe un singur
+        # Canvas, mai ieftin pe laptopurile slabe de la proiector
+        "renderer": "widgets",
+        # Departajarea la egalitate de puncte, în ordine; ["points"] = doar punctajul
+        "tie_break": ["points", "tops", "zones", "top_attempts", "zone_attempts", "previous_round"],
+        # Derularea automată a clasamentului: pixeli pe secundă și opririle sus/jos, în secunde
+        "scroll_speed": 80,
+        "scroll_dwell_top": 7,
+        "scroll_dwell_bottom": 3
+    }
+
     PATHS = {
         "csv_competitors": "db/competitors-list.csv",
-        "logo": "resources/images/logo.jpeg"
+        "logo": "resources/images/logo.jpeg",
+        # Exporturile deja randate, după amprenta clasamentului (vezi ExportCache)
+        "export_cache": "db/export-cache"
+    }
+
+    LIVE_RESULTS = {
+        # Server HTTP local cu clasamentul, starea concursului și cronometrul pentru telefoane;
+        # "0.0.0.0" îl face vizibil în rețeaua sălii, la http://<ip-laptop>:8080/
+        "enabled": False,
+        "host": "0.0.0.0",
+        "port": 8080
     }
 
     FLAGS = {
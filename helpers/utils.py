@@ -47,4 +47,11 @@ def load_competitors_from_csv(filepath):
             club = row.get("club") or row.get("Club") or ""
             competitors.append({"name": name.strip(), "club": club.strip()})
 
-    return competitors
\ No newline at end of file
+    return competitors
+
+def delegate_to(target, name):
+    """Property care citește/scrie atributul `name` al obiectului din `self.<target>`."""
+    return property(
+        lambda self: getattr(getattr(self, target), name),
+        lambda self, value: setattr(getattr(self, target), name, value)
+    )
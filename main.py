@@ -1,6 +1,5 @@
 import sys
 import os
-os.makedirs("logs", exist_ok=True)
 
 # Add the parent directory (one level up) to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
@@ -9,27 +8,30 @@ import math
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
+from tkinter import filedialog
 from tkinter import font
 from app.config import Config
 from datetime import datetime, timedelta
 import tkinter.simpledialog as simpledialog
 from tkinter import PhotoImage
 import sounddevice as sd
-import numpy as np
 import re
+import string
 import logging
 import threading
 from PIL import Image, ImageTk
 from app.classes.timer import Timer
+from app.classes.contest_engine import ContestEngine
+from app.classes.contest_scheduler import ContestScheduler
+from app.classes.category_contest import CategoryContest
+from app.classes.batch_exporter import BatchExporter
+from app.classes.live_results_server import LiveResultsServer
 from app.classes.button_manager import ButtonManager
 from app.classes.ui import Ui
 from app.classes.authentication import Authentication
 from app.classes.competitor_manager import CompetitorManager
 from helpers.utils import *
 from app.classes.ranking_manager import RankingManager
-# Setează dispozitivul de redare implicit al sistemului
-default_output_device = sd.query_devices(kind="output")["name"]
-sd.default.device = default_output_device
 
 DEBUG = True
 VERSION = 1
@@ -45,43 +47,58 @@ def catch_exceptions(func):
             logging.exception(f"Exception in {func.__name__}: {e}")
     return wrapper
 
-def warmup_audio():
-    """
-    Redă un sunet silențios scurt pentru a încălzi buffer-ul audio.
-    """
-    fs = 44100
-    silence = np.zeros(int(fs * 0.1))  # 0.1 secunde de silențiu
-    sd.play(silence, fs)
-    sd.wait()
-
 # Configurare logging: nivelul poate fi schimbat (ex. DEBUG, INFO, WARNING, etc.)
 
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
-os.makedirs(LOG_DIR, exist_ok=True)
 LOG_FILE = os.path.join(LOG_DIR, "app.log")
 
-# Configurare logging avansată
-logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
+def setup_logging():
+    """
+    Configurare logging avansată: fișier + terminal. Se apelează doar din run_app, nu la
+    import: procesele „spawn” ale BatchExporter reimportă modulul ca __mp_main__.
+    """
+    os.makedirs(LOG_DIR, exist_ok=True)
+    logger = logging.getLogger()
+    logger.setLevel(logging.DEBUG)
+
+    # Evită dublarea handlerelor dacă sunt deja setate
+    if logger.hasHandlers():
+        logger.handlers.clear()
 
-# Evită dublarea handlerelor dacă sunt deja setate
-if logger.hasHandlers():
-    logger.handlers.clear()
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
-formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    # Scriere în fișier
+    file_handler = logging.FileHandler(LOG_FILE, mode="a", encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
 
-# Scriere în fișier
-file_handler = logging.FileHandler(LOG_FILE, mode="a", encoding="utf-8")
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+    # Afișare și în terminal
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    logger.addHandler(stream_handler)
 
-# Afișare și în terminal
-stream_handler = logging.StreamHandler()
-stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
+def select_output_device():
+    """Setează dispozitivul de redare implicit al sistemului (tot doar din run_app)."""
+    sd.default.device = sd.query_devices(kind="output")["name"]
 
 class TimerApp:
 
+    # Starea concursului stă în ContestEngine; fereastra doar o afișează
+    contest_type = delegate_to("engine", "contest_type")
+    dynamic_routes_number = delegate_to("engine", "dynamic_routes_number")
+    dynamic_routes = delegate_to("engine", "dynamic_routes")
+    pause_duration = delegate_to("engine", "pause_duration")
+    contest_competitors = delegate_to("engine", "contest_competitors")
+    isolation1_contest = delegate_to("engine", "isolation1_contest")
+    isolation2_contest = delegate_to("engine", "isolation2_contest")
+    contest_finished = delegate_to("engine", "contest_finished")
+    all_routes = delegate_to("engine", "all_routes")
+    group_A = delegate_to("engine", "group_A")
+    group_B = delegate_to("engine", "group_B")
+    routes_A = delegate_to("engine", "routes_A")
+    routes_B = delegate_to("engine", "routes_B")
+    rotation_contest = delegate_to("engine", "rotation_contest")
+
     def __init__(self, master):
 
         self.master = master
@@ -130,22 +147,15 @@ class TimerApp:
         self.trasee_font = self.styles["fonts"]["trasee"]
         
         
-        # Init the contest boxes
-        self.isolation1_contest = []
-        self.isolation2_contest = []
-        self.contest_finished = []
-        self.all_routes = []
-        self.contest_competitors = []
-        self.dynamic_routes = []
+        # Motorul concursului: grupe, trasee, rotații și cronometrul, fără Tk
+        self.engine = ContestEngine()
         self.contest_finished_competitors = []
-        self.group_A = []
-        self.group_B = []
 
-        self.rotation_contest = 0
+        # Categoriile care concurează în paralel pe alte trasee, toate pe un singur planificator
+        self.scheduler = ContestScheduler(master)
+        self.categories = []
         self.old_rotation = 0
-        self.dynamic_routes_number = 0
 
-        self.contest_type = None
         self.competitors_loaded = False
         self.contest_type_label = None
         self.bar = None
@@ -168,6 +178,11 @@ class TimerApp:
         self.cm = CompetitorManager(self, self.ui, self.button_manager, self.authentication)
         self.ranking_manager = RankingManager(self)
 
+        # Rezultatele live pe telefoane, dacă serverul e activat în Config.LIVE_RESULTS
+        self.live_results = None
+        if Config.LIVE_RESULTS["enabled"]:
+            self.start_live_results()
+
         self.toggle_button = self.button_manager.toggle_button
         self.alter_button = self.button_manager.alter_button
         self.hide_button = self.button_manager.hide_button
@@ -373,7 +388,7 @@ class TimerApp:
             font=self.input_font
          )
 
-        csv_files = {
+        self.csv_files = csv_files = {
             "Seniori": "db/Seniori.csv",
             "Senioare": "db/Senioare.csv",
             "U21B": "db/U21B.csv",
@@ -461,6 +476,22 @@ class TimerApp:
             self.lock_app,
             sticky="ew",
         )
+        self.button_manager.render_button(
+            self.competitors_frame,
+            'Add category',
+            7,
+            0,
+            self.ask_category_contest,
+            sticky="ew",
+        )
+        self.button_manager.render_button(
+            self.competitors_frame,
+            'Export all',
+            7,
+            1,
+            self.export_all_categories,
+            sticky="ew",
+        )
  
         # Render "Initiate contest" button (row 4)
         self.button_manager.render_button(
@@ -742,6 +773,7 @@ class TimerApp:
             self.contest_type = selected_value
             if self.contest_type == "qualifiers":
                 self.ask_pause_duration()
+                self.ask_qualifier_groups()
             self.is_contest_ready()
 
             logging.debug(f"Selected contest type: {self.contest_type}")
@@ -791,6 +823,100 @@ class TimerApp:
         else:
             messagebox.showerror("Eroare", "Trebuie să introduceți durata pauzei!")
 
+    def ask_qualifier_groups(self):
+        groups = simpledialog.askinteger(
+            "Grupe calificări",
+            "Numărul de grupe care urcă în paralel (fiecare pe blocul ei de trasee):",
+            initialvalue=self.engine.qualifier_groups,
+            minvalue=1,
+            maxvalue=len(string.ascii_uppercase)
+        )
+
+        if groups is not None:
+            self.engine.qualifier_groups = groups
+            logging.debug(f"Calificări cu {groups} grupe.")
+
+    def ask_category_contest(self):
+        """Fereastră pentru o categorie care concurează în paralel (alt tip de concurs, alte trasee)."""
+        dialog = self.ui.create_window(title="Add category", is_toplevel=True, width=420, height=260, resizable=(False, False))
+        dialog.grid_columnconfigure(1, weight=1)
+
+        category_var = tk.StringVar(value="Select category")
+        type_var = tk.StringVar(value="Select contest type")
+        routes_var = tk.StringVar(value="Select routes")
+
+        for row, (text, variable, values) in enumerate([
+            ("Category", category_var, list(self.csv_files.keys())),
+            ("Contest type", type_var, list(self.contest_types.keys())),
+            ("Routes", routes_var, [str(v) for v in range(1, 31)]),
+        ]):
+            tk.Label(dialog, text=text, font=self.input_font).grid(row=row, column=0, padx=5, pady=5, sticky="w")
+            self.ui.create_dropdown(dialog, variable, values, row=row, column=1, font=self.input_font)
+
+        def confirm():
+            if category_var.get() not in self.csv_files or type_var.get() not in self.contest_types or not routes_var.get().isdigit():
+                messagebox.showerror("Eroare", "Alegeți categoria, tipul concursului și numărul de trasee!")
+                return
+            dialog.destroy()
+            self.add_category_contest(category_var.get(), self.contest_types[type_var.get()], int(routes_var.get()))
+
+        tk.Button(dialog, text="Start category", command=confirm, font=self.input_font).grid(
+            row=3, column=0, columnspan=2, padx=5, pady=10, sticky="ew")
+
+    def add_category_contest(self, category, contest_type, routes_number):
+        competitor_data = load_competitors_from_csv(self.csv_files[category])
+        if not competitor_data:
+            messagebox.showerror("Eroare", f"Nu există concurenți în categoria {category}!")
+            return None
+
+        pause_duration = None
+        if contest_type == "qualifiers":
+            pause_duration = simpledialog.askinteger(
+                "Pauză între trasee",
+                f"Durata pauzei între trasee pentru {category} (minute):",
+                initialvalue=self.pause_duration,
+                minvalue=1,
+                maxvalue=60
+            )
+
+        category_contest = CategoryContest(self, category, contest_type, routes_number, competitor_data, pause_duration)
+        self.categories.append(category_contest)
+        logging.debug(f"Categoria {category} ({contest_type}, {routes_number} trasee) a fost adăugată.")
+        return category_contest
+
+    def results_snapshots(self):
+        """
+        {nume de fișier: RankingSnapshot} pentru fiecare categorie cu rezultate: categoriile adăugate
+        își exportă concursul lor, iar celelalte din db/ se clasează din scorurile concursului principal.
+        """
+        contest_titles = {v: k for k, v in self.contest_types.items()}
+        contests = {contest.category: contest for contest in self.categories}
+        scores = self.ranking_manager.score_matrix()
+        snapshots = {}
+        for category, csv_file in self.csv_files.items():
+            contest = contests.get(category)
+            if contest is not None:
+                manager, contest_type, competitor_data = contest.ranking_manager, contest.engine.contest_type, None
+            else:
+                competitor_data = load_competitors_from_csv(csv_file)
+                if not any(comp["name"] in scores and len(scores[comp["name"]]) for comp in competitor_data):
+                    continue
+                manager, contest_type = self.ranking_manager, self.contest_type
+            title = f"{category} - {contest_titles.get(contest_type, contest_type)}"
+            snapshots[BatchExporter.file_name(category, contest_type)] = manager.ranking_snapshot(title, competitor_data)
+        return snapshots
+
+    def export_all_categories(self):
+        """PDF și Excel pentru toate categoriile cu rezultate, într-un singur dosar, în paralel."""
+        folder = filedialog.askdirectory(title="Dosarul pentru rezultate")
+        if not folder:
+            return
+        snapshots = self.results_snapshots()
+        if not snapshots:
+            messagebox.showinfo("Export", "Nu există rezultate de exportat.")
+            return
+        self.ranking_manager.run_export("Rezultate", BatchExporter().write, snapshots, folder)
+
     def start_global_time_sync(self):
         input_time = self.global_time_input_field.get()
         try:
@@ -835,19 +961,9 @@ class TimerApp:
             self.toggle_button("Start global time sync", True)
         
 
-        # Dezactivează etapa de preview (8 minute) exclusiv pentru calificări
-        if self.contest_type == 'qualifiers':
-            self.timer.preview_completed = True
-        self.contest_competitors = self.cm.get_competitors()
-
-        # prepare competitors
-        self.contest_competitors = [
-            {"name": name, "start": None, "state": 'Call_zone', "transit_status": False}
-            for name in self.contest_competitors
-        ]
+        # Pregătește concurenții, traseele și grupele (calificările nu au preview de 8 minute)
+        self.engine.setup(self.contest_type, self.cm.get_competitors(), self.dynamic_routes_number)
 
-        # set contest_competitors to isolation
-        self.isolation1_contest = [comp["name"] for comp in self.contest_competitors if comp.get("state") == 'Call_zone']
         # Activează butonul Rankings după începerea competiției
         self.toggle_button('Rankings', True)
 
@@ -861,15 +977,6 @@ class TimerApp:
             global_sync_cmd=self.start_global_time_sync
         )
 
-        # generate routes like T1, T2, ... etc
-        self.generate_dynamic_routes()
-
-        # Split competitors into Group A & Group B (before rendering) for qualifiers only
-        if self.contest_type == 'qualifiers':
-            self.generate_qualifiers_groups()
-        elif self.contest_type in ['semifinals', 'finals']:
-            self.generate_semifinals_finals_contest_competitors()
-
         if not getattr(self, 'is_crb_mode', False):
             # everything is set we open timer
             self.render_timer_window()
@@ -897,6 +1004,10 @@ class TimerApp:
         self.toggle_button("Start time", True)
         self.toggle_button("Start global time sync", True)
 
+        # Concurenții și traseele noului concurs ajung imediat și pe telefoane
+        self.publish_live_ranking()
+        self.publish_live_state()
+
     def open_duration_dialog(self, callback):
             """
             Deschide o fereastră Toplevel pentru a introduce timpul în format MM:SS.
@@ -1107,80 +1218,32 @@ class TimerApp:
             bg=Config.COLORS["gray"]
         )
 
+        # 🟡 Configure the grid (Applies to all contest types)
+        self.ui.configure_grid(self.state_frame, 'row', positions=[0], weights=[1])
+        self.ui.configure_grid(self.state_frame, 'col', positions=[0, 1, 2], weights=[1, 1, 1])
+        self.state_frame.columnconfigure(0, minsize=150)  # Minimum width for column 0
+        self.state_frame.columnconfigure(1, minsize=150)  # Minimum width for column 1
+        self.state_frame.columnconfigure(2, minsize=150)  # Minimum width for column 2
+
         # Update the content dynamically
         self.update_display_window_contest()
 
     def generate_dynamic_routes(self):
-        if self.dynamic_routes_number == 0:
-            return
-
-        self.dynamic_routes = [f"T{i+1}" for i in range(self.dynamic_routes_number)]
+        self.engine.generate_dynamic_routes()
 
     def generate_qualifiers_groups(self):
-        total_competitors = len(self.contest_competitors)
-        mid_index = total_competitors // 2
-
-        # If the total number of competitors is odd, the first group will have one extra competitor
-        self.group_A = self.contest_competitors[:mid_index + (total_competitors % 2)]  # First half
-        self.group_B = self.contest_competitors[mid_index + (total_competitors % 2):]  # Second half
-
-        # 🟡 Split routes for each group
-        total_routes = self.dynamic_routes_number
-        mid_routes = total_routes // 2
-
-        # Adjust to give the first group (A) one extra route if the total number of routes is odd
-        if total_routes % 2 == 1:
-            route_count = mid_routes + 1
-        else:
-            route_count = mid_routes
-
-        self.routes_A = self.dynamic_routes[:route_count]
-        self.routes_B = self.dynamic_routes[route_count:]
-
+        self.engine.generate_qualifiers_groups()
 
     def generate_semifinals_finals_contest_competitors(self):
-        self.all_routes = self.contest_competitors[:]
-
+        self.engine.generate_semifinals_finals_contest_competitors()
 
     # Updated method to update transit status for dynamic routes
     def update_transit_status(self):
-
-        logging.debug(f"Competitors status before transit {self.contest_competitors}")
-
-        # Update transit status based on the dynamic routes
-        for comp in self.contest_competitors:
-            if self.contest_type == "qualifiers":
-                if comp in self.group_A and comp["state"] == self.routes_A[-1] or comp["state"] == "Concurs":
-                    logging.debug(f"Transit if Group A: {comp['name']}")
-                    comp["state"] = "Concurs"
-                    comp["transit_status"] = False
-                    continue
-                elif comp in self.group_B and comp["state"] == self.routes_B[-1] or comp["state"] == "Concurs":
-                    logging.debug(f"Transit if Group B: {comp['name']}")
-                    comp["state"] = "Concurs"
-                    comp["transit_status"] = False
-                    continue
-            else:
-                if comp["state"] == self.dynamic_routes[-1] or comp["state"] == "Concurs":
-                    logging.debug(f"Transit if")
-                    comp["state"] = "Concurs"
-                    comp["transit_status"] = False
-                    continue
-
-            if comp.get("state") and comp["state"].startswith("T"):
-                logging.debug(f"Transit elif")
-                comp["state"] = 'izolare2'
-                comp["transit_status"] = True if self.timer.transit else False
-            else:
-                logging.debug(f"Transit else")
-                comp["transit_status"] = False
-
-        self.isolation2_contest = [comp["name"] for comp in self.contest_competitors if "izolare2" in (comp.get("state") or "")]
-
-        logging.debug(f"Competitors status after transit {self.contest_competitors}")
+        self.engine.update_transit_status()
 
     def update_display_window_contest(self):
 
+        self.publish_live_state()
         if getattr(self, 'is_crb_mode', False):
             logging.debug("CRB mode activ: nu se actualizează display window contest.")
             return
@@ -1188,201 +1251,61 @@ class TimerApp:
         if not hasattr(self, 'current_round'):
             self.current_round = 'Runda 1'
 
-        if self.run_contest_finish() and self.timer.preview_completed:
-            self.current_round = 'Runda 2'
-        elif self.timer.running and not self.timer.preview_completed:
-            self.current_round = 'Runda x'
+        self.current_round = self.engine.round_label()
 
         # Ensure we have dynamic routes generated
         if not hasattr(self, 'dynamic_routes') or not self.dynamic_routes:
             return  # Exit early if routes are not available
 
         # 🟡 UPDATE CLASS VARIABLES FOR DISPLAY
-        if self.contest_type == "qualifiers":
- 
-            # 🟡 Display Call Zone with Groups (show only next 3 competitors)
-            visible_A = [comp["name"] for comp in self.group_A if comp.get("state") == 'Call_zone'][:3]
-            visible_B = [comp["name"] for comp in self.group_B if comp.get("state") == 'Call_zone'][:3]
-            txt_iz1_A = "Grupa A:\n" + "\n".join(visible_A) if visible_A else "Grupa A:\n - "
-            txt_iz1_B = "Grupa B:\n" + "\n".join(visible_B) if visible_B else "Grupa B:\n - "
-            txt_iz1 = f"{txt_iz1_A}\n\n{txt_iz1_B}"
-
-            # 🟡 Display Routes (Trasee) split into Grupa A & Grupa B
-            trasee_text = "Grupa A:\n"
-            trasee_text = f"{self.current_round}\n\n" + trasee_text
-            for route in self.routes_A:
-                occupant = next((comp["name"] for comp in self.contest_competitors if comp["state"] == route), None)
-                transit_status = next((comp["transit_status"] for comp in self.contest_competitors if comp["state"] == route), False)
-                trasee_text += f"{route}: {occupant or 'Liber'}\n"
-
-            trasee_text += "\nGrupa B:\n"
-
-            for route in self.routes_B:
-                occupant = next((comp["name"] for comp in self.contest_competitors if comp["state"] == route), None)
-                transit_status = next((comp["transit_status"] for comp in self.contest_competitors if comp["state"] == route), False)
-
-                trasee_text += f"{route}: {occupant or 'Liber'}\n"
-
-            # 🟡 Display Isolation 2 (Izolare 2) with Groups
-            txt_iz2_A = "Grupa A:\n" + "\n".join([comp["name"] for comp in self.group_A if "izolare2" in (comp.get("state") or "")])
-            txt_iz2_B = "Grupa B:\n" + "\n".join([comp["name"] for comp in self.group_B if "izolare2" in (comp.get("state") or "")])
-            txt_iz2 = f"{txt_iz2_A}\n\n{txt_iz2_B}"
-
-        else:
- 
-            # 🟡 Display Call Zone for Semifinale (show only next 3 competitors)
-            visible_competitors = [comp["name"] for comp in self.all_routes if comp.get("state") == 'Call_zone'][:3]
-            txt_iz1 = "\n".join(visible_competitors) if visible_competitors else "-"
+        txt_iz1, trasee_text, txt_iz2 = self.engine.state_texts(self.current_round)
 
-            # 🟡 Display Routes (Trasee)
-            trasee_text = ""
-            for route in self.dynamic_routes:
-                occupant = next((comp["name"] for comp in self.contest_competitors if comp["state"] == route), None)
-                transit_status = next((comp["transit_status"] for comp in self.contest_competitors if comp["state"] == route), False)
-                trasee_text += f"{route}: {occupant or 'Liber'}\n"
-
-            # Informații pentru Izolare 2
-
-            logging.debug(f"Izolation 2 on window update: {self.isolation2_contest}")
-            txt_iz2 = "\n".join(self.isolation2_contest)
-
-        # Contest ended change text
-        if self.run_contest_finish():
-            trasee_text = f"Pauzǎ între traseee!"
-
-
-        # 🟡 Ensure empty sections still occupy space
-        txt_iz1 = txt_iz1 if txt_iz1.strip() else " "  # Single space to prevent collapse
-        trasee_text = trasee_text if trasee_text.strip() else " "
-        txt_iz2 = txt_iz2 if txt_iz2.strip() else " "  # Single space to hold width
-
-        # Render all cells at once
+        # Update all cells at once (labels are created on the first call, then changed in place)
         self.ui.create_section(self.state_frame, 0, 0, "Call Zone", txt_iz1, self.izolare_font)
         self.ui.create_section(self.state_frame, 0, 1, "Trasee", trasee_text, self.trasee_font, bg_color=Config.COLORS["blue_light"])
         self.ui.create_section(self.state_frame, 0, 2, "Izolare 2", txt_iz2, self.izolare_font)
 
-        # 🟡 Configure the grid (Applies to all contest types)
-        self.ui.configure_grid(self.state_frame, 'row', positions=[0], weights=[1])
-        self.ui.configure_grid(self.state_frame, 'col', positions=[0, 1, 2], weights=[1, 1, 1])
-        self.state_frame.columnconfigure(0, minsize=150)  # Minimum width for column 0
-        self.state_frame.columnconfigure(1, minsize=150)  # Minimum width for column 1
-        self.state_frame.columnconfigure(2, minsize=150)  # Minimum width for column 2
+    def start_live_results(self):
+        """Pornește serverul de rezultate live; clasamentul se republică la fiecare lot de scoruri."""
+        server = LiveResultsServer(Config.LIVE_RESULTS["host"], Config.LIVE_RESULTS["port"])
+        try:
+            server.start()
+        except OSError as e:
+            logging.error(f"Live results server could not start: {e}")
+            return
+        # Cronometrul se schimbă în fiecare secundă: se citește la cerere, pe firul HTTP
+        server.results.provide("/timer.json", self.engine.timer_state)
+        self.live_results = server
+        # Scorurile noi, dar și REFRESH (reset, concurenți adăugați / șterși / redenumiți)
+        self.ranking_manager.score_events.subscribe(lambda changes: self.publish_live_ranking())
+        self.publish_live_ranking()
+        self.publish_live_state()
+
+    def publish_live_ranking(self):
+        if self.live_results is not None:
+            snapshot = self.ranking_manager.ranking_snapshot(self.get_contest_title_by_contest_type())
+            self.live_results.results.publish("/ranking.json", snapshot.to_dict())
+
+    def publish_live_state(self):
+        """Call Zone / Trasee / Izolare 2 pentru telefoane, la fiecare schimbare afișată și în sală."""
+        if self.live_results is not None:
+            self.live_results.results.publish("/state.json", self.engine.state_snapshot())
 
     def run_contest_finish(self):
         """
-        This method checks if all competitors are in the 'Concurs' state, and if so, ends the contest.
+        This method checks if all competitors are in the 'Concurs' state, and if so, ends the round.
         """
-
-        # Extract the names of competitors who are in the "Concurs" state
-        contest_finished_competitors = [comp["name"] for comp in self.contest_competitors if comp.get("state") == "Concurs"]
-
-        # If the number of competitors in "Concurs" is equal to the total number of competitors, end the contest
-        if len(contest_finished_competitors) == len(self.contest_competitors):
-            logging.debug("All competitors are in 'Concurs' state. Ending the contest.")
-            if self.timer.preview_completed:
-                # Dacă runda a doua a început, oprim timer-ul.
-                self.timer.stop_timer()
-            else:
-                # Altfel, înseamnă că runda 1 s-a terminat și pornim pauza între runde.
-                self.timer.start_pause_between_rounds()
-            return True
-        return False# Contest is still ongoing
+        return self.engine.run_contest_finish()
 
     # pornesc pe trasee concurentii check
     def run_competitor_logic_general(self):
-
-        if self.run_contest_finish():
-            return
-
-        # 🟡 Ensure rotation counter exists
-        if not hasattr(self, 'rotation_contest'):
-            self.rotation_contest = 0
-
-        if self.contest_type == "finals":
-            self.run_competitor_logic(self.dynamic_routes, self.contest_competitors)
-        elif self.contest_type== "semifinals":
-            self.run_competitor_logic(self.dynamic_routes, self.contest_competitors)
-        elif self.contest_type == "qualifiers":
-            self.run_competitor_logic(self.routes_A, self.group_A)
-            self.run_competitor_logic(self.routes_B, self.group_B)
-
-        self.isolation1_contest = [comp["name"] for comp in self.contest_competitors if comp.get('state') == 'Call_zone']
-        self.isolation2_contest = [comp["name"] for comp in self.contest_competitors if comp.get('state') == 'izolare2']
-
-        self.rotation_contest += 1
+        self.engine.run_competitor_logic_general()
 
     def on_pause_finished(self):
-        logging.debug("[Contest Logic] Pauza între runde terminată. Începe Runda 2.")
-
-        # Inversează automat grupurile
-        self.group_A, self.group_B = self.group_B, self.group_A
-
-        # Resetăm stările concurenților pentru Runda 2
-        for comp in self.contest_competitors:
-            comp["state"] = 'Call_zone'
-            comp["transit_status"] = False
-            comp["start"] = None
-
-        # Setați timerul pentru Runda 2
-        self.timer.preview_completed = True
-        self.timer.remaining_time = self.timer.initial_time
-        self.timer.running = True
-
-        # Schimbă textul din canvas la „Runda 2”
-        self.canvas.itemconfig(self.time_text, text="Runda 2")
-
-        # Anulează orice apelare programată a timerului (after_id)
-        if self.timer.after_id is not None:
-            self.master.after_cancel(self.timer.after_id)
-            self.timer.after_id = None
-
-        # Reinițializare rotații
-        self.rotation_contest = 0
-
-        # Pornește cronometru Runda 2 (4min)
-        self.timer.countdown("4min")
-
-        # Rulează logica inițială pentru concurenți (Runda 2)
-        self.run_competitor_logic_general()
-
-        # Actualizează interfața
-        self.update_display_window_contest()
+        self.engine.on_pause_finished()
 
     def run_competitor_logic(self, routes = [], competitors = []):
-
-        # 🟡 Assign START to the next competitor (one per rotation)
-        for comp in competitors:
-            if comp.get("start") is None:
-                comp["start"] = self.rotation_contest
-                break  # Only one competitor per rotation
-
-        # 🟡 Update competitor states
-        for comp in competitors:
-            if comp.get("start") is None:
-                continue  # Skip competitors not started
-
-            delta = self.rotation_contest - comp["start"]  # Time since starting
-            # Use 4 for finals, 2 for semifinals (adjust based on contest type)
-            rounds_per_move = 4 if self.contest_type == "finals" else 2
-            route_index = delta // rounds_per_move  # Move to next route every 2 or 4 rounds
-
-            if route_index < len(routes):
-                comp["state"] = routes[route_index]  # Update state based on the route
-
-            # 🔹 Check if competitor should move to Concurs
-            if route_index >= len(routes) - 1 and (delta % rounds_per_move >= 1):
-                comp["state"] = "Concurs"
-                continue  # If they've reached the final route, they go to Concurs
-
-            # 🔹 Handle Izolare2 but don't override Concurs!
-            # For semifinals, competitors stay in Izolare2 for only the first round (round 1).
-            if self.contest_type in ["semifinals", "qualifiers"] and delta % rounds_per_move == 1 and comp["state"] not in ["Concurs"]:
-                comp["state"] = "izolare2"
-                continue  # Move on to the next competitor
-
-            # For finals, competitors stay in Izolare2 for rounds 1, 2, and 3
-            if self.contest_type == "finals" and 1 <= delta % rounds_per_move <= 3 and comp["state"] not in ["Concurs"]:
-                comp["state"] = "izolare2"
+        self.engine.run_competitor_logic(routes, competitors)
 
     def get_contest_title_by_contest_type(self):
         """Returns the label (Calificări, Semifinale, Finală) based on contest_type."""
@@ -1442,10 +1365,13 @@ class TimerApp:
         print(">>> Duplicate Contest State window called (to be implemented)")
 
 def run_app():
-    warmup_audio()  # Încălzește buffer-ul audio pentru a evita întârzierile la primul sunet
+    setup_logging()
+    select_output_device()
     root = tk.Tk()
     app = TimerApp(root)
+    app.timer.audio.start()  # Stream-ul audio rămâne deschis, primul beep nu mai întârzie
     root.mainloop()
+    app.timer.audio.stop()
 
 if __name__ == "__main__":
     run_app()
@@ -0,0 +1,212 @@
+# simulate.py
+"""
+Simulare și benchmark pentru logica concursului, fără interfață grafică.
+
+Generează liste sintetice de concurenți și scoruri aleatorii, rulează concursul pe un ceas
+virtual (rotații, tranzit, pauză, runde), recalculează clasamentul după fiecare rotație și
+raportează latența pe rotație, memoria maximă și timpul total.
+
+    python simulate.py --competitors 60 300 --routes 10 --type qualifiers semifinals
+"""
+import sys
+import os
+import argparse
+import logging
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+# Add the parent directory (one level up) to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.classes.contest_engine import ContestEngine, VirtualClock
+from app.classes.ranking_manager import RankingManager
+from app.classes.countback_ranking import route_score
+from app.classes.score_matrix import ScoreMatrix
+from app.classes.competitor_index import CompetitorIndex
+from app.classes.export_cache import ExportCache
+
+CONTEST_TYPES = ["qualifiers", "semifinals", "finals"]
+VISIBLE_ROWS = 30   # rândurile pe care tabelul virtualizat le citește la o randare
+
+
+class SimulatedApp:
+    """Atributele aplicației de care are nevoie RankingManager, fără Tk."""
+
+    def __init__(self, engine, competitor_data):
+        self.engine = engine
+        self.index = CompetitorIndex(competitor_data)
+        self.competitor_data = self.index.records
+        self.route_scores = ScoreMatrix.from_dict({comp["name"]: {} for comp in competitor_data})
+        self.cm = self  # RankingManager citește concurenții prin app.cm
+
+    @property
+    def dynamic_routes(self):
+        return self.engine.dynamic_routes
+
+    def get_competitors(self):
+        return self.index.names()
+
+
+class SimulationListener:
+    """Notează scoruri aleatorii la finalul fiecărui traseu și măsoară fiecare rotație."""
+
+    def __init__(self, app, ranking_manager, rng):
+        self.app = app
+        self.ranking_manager = ranking_manager
+        self.rng = rng
+        self.on_route = []
+        self.rotation_started = None
+        self.latencies = []
+        self.rotations = 0
+        self.rounds = 1
+
+    def on_tick(self, countdown_type, remaining, crossed):
+        if remaining == 0:
+            self.rotation_started = time.perf_counter()
+
+    def on_transit(self):
+        # Cine era pe trasee la finalul celor 4 minute primește un scor
+        for comp, route in self.on_route:
+            self.ranking_manager.record_score(comp.name, route, self.random_score())
+        self.on_route = []
+        self._rank()
+
+    def on_rotation(self):
+        self.on_route = [(comp, route) for route, comp in self.app.engine.route_occupants.items()]
+        self.rotations += 1
+        self._rank()
+
+    def on_round_started(self, number):
+        self.rounds = number
+
+    def random_score(self):
+        # Aceeași formulă ca popup-ul de scor: top, zonă sau nimic
+        attempts = self.rng.randint(1, 10)
+        roll = self.rng.random()
+        if roll < 0.4:
+            return route_score(top_attempts=attempts)[0]
+        if roll < 0.8:
+            return route_score(zone_attempts=attempts)[0]
+        return 0
+
+    def _rank(self):
+        # Ce face fereastra de clasament la un scor nou: live_ranking() și rândurile vizibile.
+        # `visible` nu se folosește: felia e aici doar ca să fie cronometrată munca unei randări.
+        ranking = self.ranking_manager.live_ranking()
+        visible = ranking[:VISIBLE_ROWS]
+
+        if self.rotation_started is not None:
+            self.latencies.append(time.perf_counter() - self.rotation_started)
+            self.rotation_started = None
+
+
+def generate_competitors(count, rng):
+    """Listă sintetică de concurenți, în formatul din load_competitors_from_csv."""
+    clubs = [f"Club {i + 1}" for i in range(max(1, count // 10))]
+    return [{"name": f"Concurent {i + 1:04d}", "club": rng.choice(clubs)} for i in range(count)]
+
+
+def simulate_contest(contest_type, competitors_count, routes_number, seed=0, pause_duration=1, export_dir=None,
+                     groups=None, rounds=None):
+    """Rulează un concurs complet și returnează un dict cu măsurătorile."""
+    rng = random.Random(seed)
+    competitor_data = generate_competitors(competitors_count, rng)
+
+    engine = ContestEngine(clock=VirtualClock())
+    app = SimulatedApp(engine, competitor_data)
+    ranking_manager = RankingManager(app)
+    listener = SimulationListener(app, ranking_manager, rng)
+    engine.listener = listener
+
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    engine.setup(contest_type, app.get_competitors(), routes_number, pause_duration, groups, rounds)
+    engine.start()
+    engine.run()
+
+    export_time = None
+    if export_dir:
+        export_started = time.perf_counter()
+        base = os.path.join(export_dir, f"{contest_type}-{competitors_count}x{routes_number}")
+        # Cache gol la fiecare rulare: timpul măsurat e al randării, nu al unei copii din cache
+        with tempfile.TemporaryDirectory() as cache_folder:
+            ranking_manager.export_cache = ExportCache(cache_folder)
+            ranking_manager.write_rankings_pdf(base + ".pdf", f"Simulare {contest_type}", app.index)
+            ranking_manager.write_rankings_excel(base + ".xlsx", app.get_competitors())
+        export_time = time.perf_counter() - export_started
+
+    total_time = time.perf_counter() - started
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = sorted(listener.latencies)
+    return {
+        "contest_type": contest_type,
+        "competitors": competitors_count,
+        "routes": routes_number,
+        "rounds": listener.rounds,
+        "rotations": listener.rotations,
+        "contest_minutes": engine.clock.now() / 60,
+        "latency_mean": statistics.mean(latencies) if latencies else 0.0,
+        "latency_p95": latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0,
+        "latency_max": latencies[-1] if latencies else 0.0,
+        "peak_memory": peak_memory,
+        "export_time": export_time,
+        "total_time": total_time,
+        "finished": engine.is_contest_finished(),
+    }
+
+
+def format_report(result):
+    line = (
+        f"{result['contest_type']:<11} {result['competitors']:>5} concurenți {result['routes']:>3} trasee | "
+        f"{result['rounds']} runde, {result['rotations']:>4} rotații ({result['contest_minutes']:.0f} min simulate) | "
+        f"rotație medie {result['latency_mean'] * 1000:.3f} ms, p95 {result['latency_p95'] * 1000:.3f} ms, "
+        f"max {result['latency_max'] * 1000:.3f} ms | "
+        f"memorie maximă {result['peak_memory'] / 1024:.0f} KiB | total {result['total_time']:.3f} s"
+    )
+    if result["export_time"] is not None:
+        line += f" | export {result['export_time']:.3f} s"
+    if not result["finished"]:
+        line += " | NETERMINAT"
+    return line
+
+
+def run_simulation(argv=None):
+    parser = argparse.ArgumentParser(description="Simulează concursuri fără interfață și măsoară performanța.")
+    parser.add_argument("--competitors", type=int, nargs="+", default=[300], help="numărul de concurenți (una sau mai multe valori)")
+    parser.add_argument("--routes", type=int, nargs="+", default=[10], help="numărul de trasee (una sau mai multe valori)")
+    parser.add_argument("--type", dest="contest_types", nargs="+", choices=CONTEST_TYPES, default=["qualifiers"], help="tipul concursului")
+    parser.add_argument("--pause", type=int, default=1, help="pauza dintre rundele calificărilor, în minute")
+    parser.add_argument("--groups", type=int, default=None, help="grupe paralele la calificări (implicit din Config)")
+    parser.add_argument("--rounds", type=int, default=None, help="runde la calificări (implicit din Config)")
+    parser.add_argument("--seed", type=int, default=0, help="seed pentru scorurile aleatorii")
+    parser.add_argument("--export-dir", default=None, help="scrie și clasamentele PDF/Excel în acest director")
+    args = parser.parse_args(argv)
+
+    # Logica concursului loghează fiecare mutare; în benchmark ar măsura doar logging-ul
+    logging.disable(logging.CRITICAL)
+    if args.export_dir:
+        os.makedirs(args.export_dir, exist_ok=True)
+
+    results = []
+    try:
+        for contest_type in args.contest_types:
+            for competitors_count in args.competitors:
+                for routes_number in args.routes:
+                    result = simulate_contest(contest_type, competitors_count, routes_number,
+                                              args.seed, args.pause, args.export_dir,
+                                              args.groups, args.rounds)
+                    print(format_report(result))
+                    results.append(result)
+    finally:
+        logging.disable(logging.NOTSET)
+    return results
+
+
+if __name__ == "__main__":
+    run_simulation()
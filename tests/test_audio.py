@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from unittest.mock import patch
+from app.classes.audio import AudioEngine
+
+class TestAudioEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.audio = AudioEngine([0.5, 1.0], sample_rate=1000)
+        self.audio.stream = object()  # stream "deschis": play doar pune în coadă
+
+    def test_buffers_synthesized_once_per_duration(self):
+        self.assertEqual(len(self.audio.buffers[0.5]), 500)
+        self.assertEqual(len(self.audio.buffers[1.0]), 1000)
+
+    def test_callback_mixes_queued_beep_without_new_buffers(self):
+        self.audio.play(0.5)
+        outdata = np.zeros((256, 1), dtype=np.float32)
+        self.audio._callback(outdata, 256, None, None)
+        np.testing.assert_allclose(outdata[:, 0], self.audio.buffers[0.5][:256])
+
+        self.audio._callback(outdata, 256, None, None)
+        self.assertEqual(self.audio._voices, [])
+        self.assertFalse(outdata[244:, 0].any())
+
+    def test_scheduled_beep_starts_at_sample_offset(self):
+        self.audio.stream = type("Stream", (), {"time": 10.0})()
+        with patch("app.classes.audio.time.monotonic", return_value=100.0):
+            self.assertTrue(self.audio.schedule(0.5, at=100.1))  # 100 ms după "acum"
+
+        outdata = np.zeros((256, 1), dtype=np.float32)
+        time_info = type("TimeInfo", (), {"outputBufferDacTime": 10.0})()
+        self.audio._callback(outdata, 256, time_info, None)
+        self.assertFalse(outdata[:100, 0].any())
+        np.testing.assert_allclose(outdata[100:, 0], self.audio.buffers[0.5][:156])
+
+    def test_cancel_scheduled_drops_pending_beeps(self):
+        self.audio.stream = type("Stream", (), {"time": 0.0})()
+        self.audio.schedule(1.0, at=0.0)
+        self.audio.cancel_scheduled()
+        self.assertEqual(self.audio._scheduled, [])
+
+    def test_cancel_scheduled_keeps_other_owners(self):
+        self.audio.stream = type("Stream", (), {"time": 0.0})()
+        self.audio.schedule(1.0, at=5.0, owner="main")
+        self.audio.schedule(0.5, at=1.0, owner="U13F")
+        self.audio.cancel_scheduled(owner="U13F")
+        self.assertEqual([entry[3] for entry in self.audio._scheduled], ["main"])
@@ -0,0 +1,81 @@
+import unittest
+from app.classes.auto_scroller import AutoScroller
+from app.classes.contest_engine import VirtualClock
+
+class DummyWidget:
+    def __init__(self):
+        self.pending = []
+    def after(self, ms, callback):
+        self.pending.append((ms, callback))
+        return len(self.pending)
+    def after_cancel(self, after_id):
+        self.pending = []
+
+class DummyTable:
+    def __init__(self, rows, visible_rows=10):
+        self.rows = rows
+        self.visible_rows = visible_rows
+        self.row_height = 50
+        self.top = 0.0
+    @property
+    def max_top(self):
+        return max(0, self.rows - self.visible_rows)
+    @property
+    def at_top(self):
+        return self.top <= 0
+    @property
+    def at_bottom(self):
+        return self.top >= self.max_top
+    def scroll_by(self, rows):
+        self.top = min(max(self.top + rows, 0.0), self.max_top)
+
+class TestAutoScroller(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.widget = DummyWidget()
+
+    def run_for(self, scroller, seconds, lag=0.0):
+        """Rulează pașii programați până trec `seconds`; fiecare pas întârzie cu `lag`."""
+        end = self.clock.now() + seconds
+        while self.widget.pending and self.clock.now() < end:
+            ms, callback = self.widget.pending.pop(0)
+            self.clock.sleep(ms / 1000 + lag)
+            callback()
+
+    def test_constant_speed_independent_of_length(self):
+        for rows in (30, 300):
+            table = DummyTable(rows)
+            scroller = AutoScroller(self.widget, table, speed=100, dwell_top=1, dwell_bottom=1, clock=self.clock)
+            scroller.start()
+            self.run_for(scroller, 1 + 5)   # oprirea de sus, apoi 5 secunde de derulare
+            self.assertAlmostEqual(table.top, 10, delta=0.5)  # 500 px / 50 px pe rând
+            scroller.stop()
+
+    def test_idles_when_content_fits_and_dwells_at_bottom(self):
+        table = DummyTable(5)
+        scroller = AutoScroller(self.widget, table, speed=100, dwell_top=0, dwell_bottom=2, clock=self.clock)
+        scroller.start()
+        self.run_for(scroller, 0.1)
+        self.assertEqual(self.widget.pending[0][0], 1000)  # doar verificarea rară
+
+        table.rows = 12
+        scroller.wake()
+        woken = self.clock.now()
+        while not table.at_bottom and self.clock.now() < woken + 5:
+            self.run_for(scroller, 0.01)
+        self.assertAlmostEqual(self.clock.now() - woken, 1.0, delta=0.1)  # 2 rânduri la 2 rânduri/s
+        self.assertEqual(scroller.direction, -1)
+        self.assertEqual(self.widget.pending[0][0], 2000)
+
+    def test_throttles_when_event_loop_lags(self):
+        table = DummyTable(1000)
+        scroller = AutoScroller(self.widget, table, speed=100, dwell_top=0, clock=self.clock)
+        scroller.start()
+        self.run_for(scroller, 3, lag=0.1)
+        self.assertGreater(scroller.frame_seconds, 0.1)
+        # viteza rămâne aceeași, doar pașii sunt mai rari
+        self.assertAlmostEqual(table.top, 6, delta=0.5)
+
+if __name__ == '__main__':
+    unittest.main()
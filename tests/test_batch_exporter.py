@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import openpyxl
+from app.classes.batch_exporter import BatchExporter
+from app.classes.ranking_snapshot import RankingSnapshot
+
+class TestBatchExporter(unittest.TestCase):
+
+    def snapshot(self, title, count):
+        rows = [(i + 1, f"{title} {i + 1}", "Club", [25.0 - i, 0.0], 25.0 - i) for i in range(count)]
+        return RankingSnapshot(title, ["T1", "T2"], rows)
+
+    def test_file_names_are_stable(self):
+        self.assertEqual(BatchExporter.file_name("U21B", "finals"), "U21B-finals")
+        self.assertEqual(BatchExporter.file_name("U11B Skay/2", "qualifiers"), "U11B_Skay_2-qualifiers")
+
+    def test_writes_every_category_in_the_pool(self):
+        snapshots = {
+            "Seniori-finals": self.snapshot("Seniori", 8),
+            "U13F-qualifiers": self.snapshot("U13F", 3),
+        }
+        progress = []
+        with tempfile.TemporaryDirectory() as folder:
+            written = BatchExporter(max_workers=2, cache_folder=os.path.join(folder, "cache"), serial_rows=0).write(snapshots, folder, progress=lambda done, total: progress.append(done))
+            self.assertEqual([os.path.basename(path) for path in written], [
+                "Rezultate.xlsx", "Seniori-finals.pdf", "Seniori-finals.xlsx", "U13F-qualifiers.pdf", "U13F-qualifiers.xlsx",
+            ])
+            self.assertTrue(all(os.path.getsize(path) > 0 for path in written))
+            sheet = openpyxl.load_workbook(os.path.join(folder, "U13F-qualifiers.xlsx")).active
+            self.assertEqual([cell.value for cell in sheet[2]], [1, "U13F 1", 25.0, 0.0, 25.0])
+            summary = openpyxl.load_workbook(os.path.join(folder, "Rezultate.xlsx"))
+            self.assertEqual(summary.sheetnames, ["Seniori", "U13F"])
+        self.assertEqual(progress, [1, 2, 3, 4, 5])
+
+    def test_small_batches_are_written_without_the_pool(self):
+        snapshots = {"U13F-qualifiers": self.snapshot("U13F", 3)}
+        with tempfile.TemporaryDirectory() as folder:
+            with patch("app.classes.batch_exporter.ProcessPoolExecutor") as pool:
+                written = BatchExporter(cache_folder=os.path.join(folder, "cache")).write(snapshots, folder)
+            pool.assert_not_called()
+            self.assertEqual([os.path.basename(path) for path in written], [
+                "Rezultate.xlsx", "U13F-qualifiers.pdf", "U13F-qualifiers.xlsx",
+            ])
+            self.assertTrue(all(os.path.getsize(path) > 0 for path in written))
+
+if __name__ == '__main__':
+    unittest.main()
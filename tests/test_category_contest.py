@@ -0,0 +1,87 @@
+import unittest
+from app.classes.category_contest import CategoryContest
+from app.classes.contest_engine import ContestEngine, VirtualClock
+
+class DummyButton:
+    def __init__(self):
+        self.text = None
+    def config(self, text=None):
+        self.text = text
+
+class DummyScheduler:
+    def __init__(self):
+        self.ticked = []
+        self.cancelled = []
+    def tick_now(self, engine):
+        self.ticked.append(engine)
+    def cancel(self, engine):
+        self.cancelled.append(engine)
+
+class DummyCanvas:
+    def itemconfig(self, item, **options):
+        pass
+
+class DummyTimer:
+    def beep(self, duration):
+        pass
+
+class DummyApp:
+    green_color = white_color = blue_light_color = black_color = "white"
+    timer = DummyTimer()
+
+class DummyRankingManager:
+    def __init__(self):
+        self.closed = 0
+    def close_round(self):
+        self.closed += 1
+
+class TestCategoryContest(unittest.TestCase):
+
+    def setUp(self):
+        # Fără fereastră: doar ce folosesc start() și pause()
+        self.contest = CategoryContest.__new__(CategoryContest)
+        self.contest.engine = ContestEngine(clock=VirtualClock())
+        self.contest.engine.setup("finals", ["Ana", "Bogdan"], 2)
+        self.contest.scheduler = DummyScheduler()
+        self.contest.start_button = DummyButton()
+
+    def test_paused_contest_resumes_where_it_stopped(self):
+        engine = self.contest.engine
+        self.contest.start()
+        engine.clock.sleep(100)
+        self.contest.start()  # pauză
+        self.assertTrue(engine.paused)
+        self.contest.start()
+        self.assertEqual(engine.remaining_time, 8 * 60 - 100)
+        self.assertEqual(self.contest.start_button.text, "Pause")
+
+    def test_finished_contest_starts_again_instead_of_resuming(self):
+        engine = self.contest.engine
+        self.contest.start()
+        engine.run()
+        self.assertFalse(engine.running)
+        self.assertIsNotNone(engine.deadline)
+
+        self.contest.start()
+        self.assertTrue(engine.running)
+        self.assertEqual(engine.countdown_type, "8min")
+        self.assertEqual(engine.seconds_left(), 8 * 60)
+
+    def test_qualifiers_without_pause_duration_finish_and_leave_the_scheduler(self):
+        # Dialogul de pauză anulat: categoria trece direct la runda a doua și se oprește
+        contest = self.contest
+        contest.app = DummyApp()
+        contest.canvas = DummyCanvas()
+        contest.bar = contest.time_text = None
+        contest.ranking_manager = DummyRankingManager()
+        contest.update_display = contest.update_timer = lambda: None
+        contest.engine = ContestEngine(clock=VirtualClock(), listener=contest)
+        contest.engine.setup("qualifiers", ["Ana", "Bogdan", "Carla", "Dan"], 4, pause_duration=None)
+
+        contest.start()
+        contest.engine.run()
+        self.assertFalse(contest.engine.running)
+        self.assertEqual(contest.engine.round, 2)
+        self.assertIn(contest.engine, contest.scheduler.cancelled)
+        self.assertEqual(contest.ranking_manager.closed, 1)
+        self.assertEqual(contest.start_button.text, "Start time")
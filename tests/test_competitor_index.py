@@ -0,0 +1,40 @@
+import unittest
+from app.classes.competitor_index import CompetitorIndex
+
+class TestCompetitorIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CompetitorIndex([
+            {"name": "Ana", "club": "CS Arad"},
+            {"name": "Dan", "club": ""},
+        ])
+
+    def test_lookup_by_name_and_id(self):
+        self.assertEqual(self.index.club("Ana"), "CS Arad")
+        self.assertEqual(self.index.club("Nimeni"), "")
+        ana_id = self.index.id_of("Ana")
+        self.assertEqual(self.index.by_id(ana_id)["name"], "Ana")
+        self.assertEqual(self.index.names(), ["Ana", "Dan"])
+
+    def test_ids_survive_reload_and_rename(self):
+        ana_id = self.index.id_of("Ana")
+        self.index.load([{"name": "Eva", "club": "X"}, {"name": "Ana", "club": "CS Arad"}])
+        self.assertEqual(self.index.id_of("Ana"), ana_id)
+        self.assertNotIn("Dan", self.index)
+        self.assertNotEqual(self.index.id_of("Eva"), ana_id)
+
+        self.index.rename("Ana", "Ana Pop")
+        self.assertEqual(self.index.id_of("Ana Pop"), ana_id)
+        self.assertEqual(self.index.club("Ana Pop"), "CS Arad")
+        self.assertNotIn("Ana", self.index)
+
+    def test_add_and_remove(self):
+        record = self.index.add("C3", "Club")
+        self.assertIs(self.index.add("C3"), record)
+        self.assertEqual(len(self.index), 3)
+        self.index.remove("C3")
+        self.assertIsNone(self.index.by_id(record["id"]))
+        self.assertIsNone(self.index.remove("C3"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,13 @@ class DummyApp:
     def __init__(self):
         self.master = None
         self.competitors_listbox = DummyListbox()
+        self.ranking_manager = DummyRankingManager()
+
+class DummyRankingManager:
+    def __init__(self):
+        self.refreshes = 0
+    def refresh_rankings(self):
+        self.refreshes += 1
 
 class DummyListbox:
     def __init__(self):
@@ -32,5 +39,34 @@ class TestCompetitorManager(unittest.TestCase):
         self.cm.add_competitor()
         self.assertIn("C1", self.cm.get_competitors())
 
+    def test_set_competitors_keeps_clubs_and_ids(self):
+        self.cm.set_competitors([{"name": "Ana", "club": "CS Arad"}, "Dan, Olimpia"])
+        ana_id = self.cm.index.id_of("Ana")
+        self.assertEqual(self.cm.index.club("Dan"), "Olimpia")
+
+        # Ordinea din listă (ex. după drag & drop), în formatul "nume | club"
+        self.cm.set_competitors(["Dan | Olimpia", "Ana | CS Arad"])
+        self.assertEqual(self.cm.get_competitors(), ["Dan", "Ana"])
+        self.assertEqual(self.cm.index.id_of("Ana"), ana_id)
+
+        self.cm.add_competitor()
+        self.assertEqual(self.cm.index.club("Ana"), "CS Arad")
+        self.assertIs(self.cm.competitor_data, self.cm.index.records)
+
+    def test_competitor_changes_refresh_rankings(self):
+        self.cm.set_competitors(["Ana", "Dan"])
+        refreshes = self.app.ranking_manager.refreshes
+        self.cm.add_competitor()
+        self.assertEqual(self.app.ranking_manager.refreshes, refreshes + 1)
+
+    def test_rename_to_existing_name_is_refused(self):
+        self.cm.set_competitors(["Ana | CS Arad", "Dan | Olimpia"])
+        self.assertFalse(self.cm.rename_competitor("Dan | Olimpia", "Ana | Olimpia"))
+        self.assertEqual(self.cm.get_competitors(), ["Ana", "Dan"])
+        self.assertEqual(self.cm.index.club("Ana"), "CS Arad")
+
+        self.assertTrue(self.cm.rename_competitor("Dan | Olimpia", "Dana | Olimpia"))
+        self.assertEqual(self.cm.get_competitors(), ["Ana", "Dana"])
+
 class DummyButtonManager:
     def toggle_button(self, *args, **kwargs): pass
\ No newline at end of file
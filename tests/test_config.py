@@ -19,4 +19,7 @@ class TestConfig(unittest.TestCase):
         self.assertIn("csv_competitors", Config.PATHS)
 
     def test_flags_structure(self):
-        self.assertIn("debug", Config.FLAGS)
\ No newline at end of file
+        self.assertIn("debug", Config.FLAGS)
+
+    def test_rankings_renderer(self):
+        self.assertIn(Config.RANKINGS["renderer"], ("widgets", "canvas"))
@@ -0,0 +1,28 @@
+import unittest
+from app.classes.contest_competitor import ContestCompetitor
+
+class TestContestCompetitor(unittest.TestCase):
+
+    def test_dict_style_access(self):
+        comp = ContestCompetitor(0, "Ana")
+        self.assertEqual(comp["state"], "Call_zone")
+        self.assertIsNone(comp.get("start"))
+
+        comp["state"] = "T1"
+        self.assertEqual(comp.state, "T1")
+        self.assertEqual(comp.get("club", "-"), "-")
+        with self.assertRaises(KeyError):
+            comp["club"]
+
+    def test_identity_keys(self):
+        # Doi concurenți cu același nume și aceeași stare rămân distincți
+        first = ContestCompetitor(0, "Ana")
+        second = ContestCompetitor(1, "Ana")
+        self.assertNotEqual(first, second)
+        self.assertEqual(len({first, second}), 2)
+        self.assertIn(first, {first: None})
+
+    def test_no_instance_dict(self):
+        comp = ContestCompetitor(0, "Ana")
+        with self.assertRaises(KeyError):
+            comp["extra"] = 1
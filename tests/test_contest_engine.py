@@ -0,0 +1,149 @@
+import unittest
+from app.classes.contest_engine import ContestEngine, VirtualClock
+from app.classes.audio import AudioEngine
+
+class RecordingListener:
+    def __init__(self):
+        self.events = []
+
+    def on_transit(self): self.events.append("transit")
+    def on_rotation(self): self.events.append("rotation")
+    def on_pause_started(self): self.events.append("pause")
+    def on_round_started(self, number): self.events.append(f"round{number}")
+    def on_stopped(self): self.events.append("stop")
+
+
+class TestContestEngine(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.listener = RecordingListener()
+        self.engine = ContestEngine(clock=self.clock, listener=self.listener)
+
+    def test_semifinals_run_until_everyone_finished(self):
+        self.engine.setup("semifinals", ["Ana", "Bogdan", "Carla"], 2)
+        self.engine.start()
+        self.engine.run()
+
+        self.assertFalse(self.engine.running)
+        self.assertTrue(self.engine.is_contest_finished())
+        self.assertEqual(self.listener.events[-1], "stop")
+        self.assertNotIn("pause", self.listener.events)
+
+    def test_qualifiers_pause_and_second_round(self):
+        self.engine.setup("qualifiers", ["Ana", "Bogdan", "Carla", "Dan"], 4, pause_duration=1)
+        first_group = list(self.engine.group_A)
+        self.engine.start()
+        self.engine.run()
+
+        events = self.listener.events
+        self.assertEqual(events.count("pause"), 1)
+        self.assertEqual(events.count("stop"), 1)
+        self.assertLess(events.index("pause"), events.index("round2"))
+        self.assertEqual(self.engine.round, 2)
+        self.assertEqual(self.engine.group_B, first_group)
+        self.assertTrue(self.engine.is_contest_finished())
+
+    def test_qualifiers_without_pause_duration_still_finish(self):
+        self.engine.setup("qualifiers", ["Ana", "Bogdan", "Carla", "Dan"], 4, pause_duration=None)
+        self.engine.start()
+        self.engine.run()
+
+        events = self.listener.events
+        self.assertNotIn("pause", events)
+        self.assertIn("round2", events)
+        self.assertEqual(events[-1], "stop")
+        self.assertEqual(self.engine.round, 2)
+        self.assertFalse(self.engine.running)
+        self.assertTrue(self.engine.is_contest_finished())
+
+    def test_run_is_instant_on_virtual_clock(self):
+        self.engine.setup("finals", ["Ana", "Bogdan"], 4)
+        self.engine.start()
+        self.engine.run(per_second=True)
+
+        # 8 min preview + rotații de 4 min + 15 s tranzit, toate pe ceasul simulat
+        self.assertGreater(self.clock.now(), 8 * 60 + 4 * 60)
+        self.assertFalse(self.engine.running)
+
+    def test_indexes_match_a_full_scan_after_every_rotation(self):
+        engine = self.engine
+        engine.setup("qualifiers", [f"C{i}" for i in range(9)], 5, pause_duration=1)
+
+        def check():
+            for route in engine.dynamic_routes:
+                expected = next((comp for comp in engine.contest_competitors if comp["state"] == route), None)
+                self.assertIs(engine.route_occupant(route), expected)
+            for group_name, group in (("A", engine.group_A), ("B", engine.group_B)):
+                for state in ("Call_zone", "izolare2", "Concurs"):
+                    expected = [comp["name"] for comp in group if comp["state"] == state]
+                    self.assertCountEqual([comp["name"] for comp in engine.members(state, group_name)], expected)
+
+        self.listener.on_rotation = check
+        self.listener.on_transit = check
+        engine.start()
+        engine.run()
+        self.assertTrue(engine.is_contest_finished())
+
+    def test_qualifiers_with_four_groups_rotate_route_blocks(self):
+        engine = self.engine
+        engine.setup("qualifiers", [f"C{i}" for i in range(30)], 10, pause_duration=1, groups=4, rounds=3)
+
+        self.assertEqual(list(engine.groups), ["A", "B", "C", "D"])
+        self.assertEqual([len(group) for group in engine.groups.values()], [8, 8, 7, 7])
+        self.assertEqual(engine.group_routes["A"], ["T1", "T2", "T3"])
+        self.assertEqual(engine.group_routes["D"], ["T9", "T10"])
+        first_round = {label: list(group) for label, group in engine.groups.items()}
+
+        engine.start()
+        engine.run()
+
+        # După două pauze fiecare grupă a trecut de două ori pe blocul următor
+        self.assertEqual(self.listener.events.count("pause"), 2)
+        self.assertEqual(engine.round, 3)
+        self.assertEqual(engine.groups["C"], first_round["A"])
+        self.assertEqual(engine.groups["A"], first_round["C"])
+        self.assertTrue(engine.is_contest_finished())
+
+    def test_state_snapshot_follows_rotation(self):
+        engine = self.engine
+        engine.setup("semifinals", ["Ana", "Bogdan", "Carla"], 2)
+        engine.start()
+        engine.tick()
+        self.clock.sleep(8 * 60)
+        engine.tick()
+
+        state = engine.state_snapshot()
+        group = state["groups"][0]
+        self.assertEqual(group["call_zone"], ["Bogdan", "Carla"])
+        self.assertEqual(group["routes"], [{"route": "T1", "competitor": "Ana"}, {"route": "T2", "competitor": None}])
+        self.assertFalse(state["finished"])
+        self.assertEqual(engine.timer_state(), {"phase": "4min", "running": True, "remaining": 240})
+
+    def test_timer_state_is_frozen_while_paused(self):
+        engine = self.engine
+        engine.setup("semifinals", ["Ana", "Bogdan"], 1)
+        engine.start()
+        self.clock.sleep(30)
+        engine.tick()
+        engine.pause()
+        self.clock.sleep(120)
+
+        self.assertEqual(engine.timer_state(), {"phase": "8min", "running": False, "remaining": 8 * 60 - 30})
+
+    def test_engines_sharing_audio_cancel_only_their_beeps(self):
+        audio = AudioEngine([0.5, 1.0], sample_rate=1000)
+        audio.stream = type("Stream", (), {"time": 0.0})()
+        main = ContestEngine(clock=self.clock, audio=audio)
+        category = ContestEngine(clock=self.clock, audio=audio)
+        for engine in (main, category):
+            engine.setup("finals", ["Ana", "Bogdan"], 2)
+            engine.start()
+
+        def owners():
+            return [entry[3] for entry in audio._scheduled]
+
+        self.assertEqual(owners().count(main), owners().count(category))
+        category.pause()
+        self.assertNotIn(category, owners())
+        self.assertEqual(owners().count(main), len(main._scheduled_seconds))
+        self.assertTrue(main._scheduled_seconds)
@@ -0,0 +1,66 @@
+import unittest
+from app.classes.contest_engine import ContestEngine, VirtualClock
+from app.classes.contest_scheduler import ContestScheduler
+
+class DummyMaster:
+    """Înlocuiește bucla Tk: păstrează callback-urile `after` și le rulează la cerere."""
+    def __init__(self, clock):
+        self.clock = clock
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, delay, func):
+        self.next_id += 1
+        self.pending[self.next_id] = (delay, func)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_next(self):
+        after_id, (delay, func) = next(iter(self.pending.items()))
+        del self.pending[after_id]
+        self.clock.sleep(delay / 1000)
+        func()
+
+
+class TestContestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.master = DummyMaster(self.clock)
+        self.scheduler = ContestScheduler(self.master, clock=self.clock)
+        self.engines = []
+        for names in (["Ana", "Bogdan"], ["Carla", "Dan", "Elena"]):
+            engine = ContestEngine(clock=self.clock)
+            engine.setup("semifinals", names, 2)
+            engine.start()
+            self.engines.append(engine)
+
+    def test_single_pending_after_for_all_contests(self):
+        for engine in self.engines:
+            self.scheduler.tick_now(engine)
+
+        self.assertEqual(len(self.master.pending), 1)
+        self.assertTrue(all(self.scheduler.is_scheduled(engine) for engine in self.engines))
+
+    def test_contests_advance_together(self):
+        for engine in self.engines:
+            self.scheduler.tick_now(engine)
+
+        for _ in range(10):
+            self.master.run_next()
+
+        self.assertEqual(self.engines[0].remaining_time, self.engines[1].remaining_time)
+        self.assertLess(self.engines[0].remaining_time, self.engines[0].get_total_time())
+
+    def test_cancel_removes_contest(self):
+        for engine in self.engines:
+            self.scheduler.tick_now(engine)
+        self.engines[0].pause()
+        self.scheduler.cancel(self.engines[0])
+
+        self.assertFalse(self.scheduler.is_scheduled(self.engines[0]))
+        self.assertEqual(len(self.master.pending), 1)
+
+        self.scheduler.cancel(self.engines[1])
+        self.assertEqual(self.master.pending, {})
@@ -0,0 +1,108 @@
+import random
+import unittest
+import numpy as np
+from app.classes.countback_ranking import CountbackRanking, route_score, MAX_TOP_ATTEMPTS, MAX_ZONE_ATTEMPTS
+from app.classes.score_matrix import ScoreMatrix
+from app.classes.ranking_index import RankingIndex
+
+def top(attempts):
+    return 25 - ((attempts - 1) / 10)
+
+def zone(attempts):
+    return 10 - ((attempts - 1) / 10)
+
+class TestCountbackRanking(unittest.TestCase):
+
+    def setUp(self):
+        # A și B au 34.9 puncte: A = top din 2 + zonă din 1, B = top din 1 + zonă din 2
+        self.matrix = ScoreMatrix.from_dict({
+            "A": {"T1": top(2), "T2": zone(1)},
+            "B": {"T1": top(1), "T2": zone(2)},
+            "C": {"T1": zone(1), "T2": zone(1)},
+            "D": {"T1": zone(1), "T2": zone(1)},
+            "E": {"T1": 0},
+        })
+
+    def test_decode_tops_zones_attempts(self):
+        values, present = self.matrix.view(["T1", "T2"])
+        tops, zones, top_attempts, zone_attempts = CountbackRanking.decode(values, present)
+        self.assertEqual(tops.tolist(), [1, 1, 0, 0, 0])
+        self.assertEqual(zones.tolist(), [2, 2, 2, 2, 0])
+        self.assertEqual(top_attempts.tolist(), [2, 1, 0, 0, 0])
+        self.assertEqual(zone_attempts.tolist(), [3, 3, 2, 2, 0])
+
+    def test_route_score_limits_attempts_to_what_decode_can_read(self):
+        self.assertEqual(route_score(top_attempts=2), (top(2), True))
+        self.assertEqual(route_score(top_attempts=3, zone_attempts=1), (top(3), True))
+        self.assertEqual(route_score(zone_attempts=1), (zone(1), False))
+        self.assertEqual(route_score(top_attempts=0, zone_attempts=1), (0, False))
+        self.assertEqual(route_score(), (0, False))
+        for top_attempts, zone_attempts in ((MAX_TOP_ATTEMPTS + 1, None), (None, MAX_ZONE_ATTEMPTS + 1), (2.5, None), (-1, None)):
+            with self.assertRaises(ValueError):
+                route_score(top_attempts, zone_attempts)
+
+        # La limită, topul și zona se citesc încă corect din punctaj
+        matrix = ScoreMatrix.from_dict({
+            "A": {"T1": route_score(top_attempts=MAX_TOP_ATTEMPTS)[0]},
+            "B": {"T1": route_score(zone_attempts=MAX_ZONE_ATTEMPTS)[0]},
+        })
+        values, present = matrix.view(["T1"])
+        tops, zones, top_attempts, zone_attempts = CountbackRanking.decode(values, present)
+        self.assertEqual(tops.tolist(), [1, 0])
+        self.assertEqual(zones.tolist(), [1, 1])
+        self.assertEqual(top_attempts.tolist(), [MAX_TOP_ATTEMPTS, 0])
+        self.assertEqual(zone_attempts.tolist(), [MAX_TOP_ATTEMPTS, MAX_ZONE_ATTEMPTS])
+
+    def test_attempts_break_points_ties(self):
+        ranking = CountbackRanking().ranking(self.matrix, routes=["T1", "T2"])
+        self.assertEqual([(rank, name) for rank, name, _, _ in ranking],
+                         [(1, "B"), (2, "A"), (3, "C"), (3, "D"), (5, "E")])
+
+        points_only = CountbackRanking(["points"]).ranking(self.matrix, routes=["T1", "T2"])
+        self.assertEqual([(rank, name) for rank, name, _, _ in points_only][:2], [(1, "A"), (1, "B")])
+
+    def test_previous_round_countback_and_missing_names(self):
+        engine = CountbackRanking(previous_round={"D": 1, "C": 4})
+        ranking = engine.ranking(self.matrix, ["C", "D", "X"], ["T1", "T2"])
+        self.assertEqual([(rank, name, row) for rank, name, _, row in ranking],
+                         [(1, "D", 3), (2, "C", 2), (3, "X", None)])
+        with self.assertRaises(ValueError):
+            CountbackRanking(["points", "luck"])
+
+    def test_lexsort_fallback_matches_packed_key(self):
+        rng = random.Random(3)
+        routes = [f"T{i}" for i in range(8)]
+        matrix = ScoreMatrix.from_dict({
+            f"C{i}": {route: rng.choice([0, top(rng.randint(1, 5)), zone(rng.randint(1, 5))]) for route in routes}
+            for i in range(300)
+        })
+        engine = CountbackRanking()
+        values, present = matrix.view(routes)
+        columns = engine.columns(list(matrix), values, present)
+        packed_order, packed_ranks = engine.order(columns)
+
+        # Aceeași ordine când cheia nu încape în 63 de biți
+        wide = columns + [np.full(len(columns[0]), 2 ** 40, dtype=np.int64)]
+        self.assertIsNone(engine.pack(wide))
+        lex_order, lex_ranks = engine.order(wide)
+        self.assertEqual(packed_order.tolist(), lex_order.tolist())
+        self.assertEqual(packed_ranks.tolist(), lex_ranks.tolist())
+    def test_ranking_index_with_sort_key_matches_vectorized_ranking(self):
+        rng = random.Random(5)
+        routes = [f"T{i}" for i in range(6)]
+        names = [f"C{i}" for i in range(200)]
+        engine = CountbackRanking(previous_round={name: rng.randint(1, 50) for name in names[::3]})
+        matrix = ScoreMatrix.from_dict({name: {} for name in names})
+        index = RankingIndex(routes, sort_key=engine.sort_key)
+        index.rebuild(matrix)
+        for _ in range(600):
+            name, route = rng.choice(names), rng.choice(routes)
+            score = rng.choice([0, top(rng.randint(1, 4)), zone(rng.randint(1, 4))])
+            matrix[name][route] = score
+            index.set_score(name, route, score)
+
+        expected = [(rank, name) for rank, name, _, _ in engine.ranking(matrix, routes=routes)]
+        self.assertEqual([(rank, name) for rank, name, _ in index.ranked()], expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+import openpyxl
+from app.classes.excel_exporter import ExcelExporter
+from app.classes.ranking_snapshot import RankingSnapshot
+
+class TestExcelExporter(unittest.TestCase):
+
+    def snapshot(self, name, count):
+        rows = [(i + 1, f"C{i + 1}", "Club", [25.0, 9.9], 34.9) for i in range(count)]
+        return RankingSnapshot(f"Clasament {name}", ["T1", "T2"], rows, sheet_name=name)
+
+    def test_one_sheet_per_snapshot(self):
+        progress = []
+        exporter = ExcelExporter()
+        exporter.PROGRESS_ROWS = 400
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "rezultate.xlsx")
+            exporter.write([self.snapshot("U21B", 1000), self.snapshot("U21F", 2)], path,
+                           progress=lambda done, total: progress.append(done))
+            wb = openpyxl.load_workbook(path, read_only=True)
+            self.assertEqual(wb.sheetnames, ["U21B", "U21F"])
+            rows = list(wb["U21B"].iter_rows(values_only=True))
+            self.assertEqual(rows[0], ("Loc", "Concurent", "T1", "T2", "Total"))
+            self.assertEqual(len(rows), 1001)
+            self.assertEqual(rows[-1], (1000, "C1000", 25.0, 9.9, 34.9))
+            wb.close()
+        self.assertEqual(progress, [400, 800, 1002])
+
+    def test_sheet_titles_are_valid_and_unique(self):
+        used = set()
+        self.assertEqual(ExcelExporter.sheet_title("Finala: U13/F", used), "Finala_ U13_F")
+        self.assertEqual(ExcelExporter.sheet_title("finala_ u13_f", used), "finala_ u13_f (2)")
+        self.assertEqual(len(ExcelExporter.sheet_title("x" * 40, used)), 31)
+
+if __name__ == '__main__':
+    unittest.main()
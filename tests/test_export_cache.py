@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from app.classes.export_cache import ExportCache
+from app.classes.ranking_snapshot import RankingSnapshot
+
+class DummyExporter:
+    def __init__(self, version=1):
+        self.version = version
+        self.calls = 0
+
+    def template_key(self):
+        return ("dummy", self.version)
+
+    def write(self, snapshots, filepath, progress=None):
+        self.calls += 1
+        with open(filepath, "w") as f:
+            f.write(f"{snapshots.title} {self.calls}")
+        return filepath
+
+class TestExportCache(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.cache = ExportCache(os.path.join(self.folder.name, "cache"), max_entries=2)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def snapshot(self, title="Clasament", total=25.0):
+        return RankingSnapshot(title, ["T1"], [(1, "Ana", "Club", [total], total)])
+
+    def export(self, exporter, snapshot, name="out.txt", progress=None):
+        path = os.path.join(self.folder.name, name)
+        self.cache.write(exporter, snapshot, path, progress)
+        with open(path) as f:
+            return f.read()
+
+    def test_unchanged_ranking_is_copied_from_cache(self):
+        exporter = DummyExporter()
+        progress = []
+        self.assertEqual(self.export(exporter, self.snapshot()), "Clasament 1")
+        self.assertEqual(self.export(exporter, self.snapshot(), "copy.txt", lambda done, total: progress.append(done)), "Clasament 1")
+        self.assertEqual(exporter.calls, 1)
+        self.assertEqual(progress, [1])
+
+    def test_scores_title_and_template_change_the_key(self):
+        exporter = DummyExporter()
+        self.export(exporter, self.snapshot())
+        self.export(exporter, self.snapshot(total=24.9))
+        self.export(exporter, self.snapshot(title="Finala"))
+        self.export(DummyExporter(version=2), self.snapshot())
+        self.assertEqual(exporter.calls, 3)
+
+    def test_prune_keeps_most_recent_entries(self):
+        exporter = DummyExporter()
+        for n in range(4):
+            self.export(exporter, self.snapshot(total=float(n)))
+        self.assertEqual(len(os.listdir(self.cache.folder)), 2)
+
+if __name__ == '__main__':
+    unittest.main()
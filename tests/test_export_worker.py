@@ -0,0 +1,52 @@
+import threading
+import unittest
+from app.classes.export_worker import ExportWorker
+
+class DummyMaster:
+    def __init__(self):
+        self.pending = []
+    def after(self, ms, callback):
+        self.pending.append(callback)
+        return len(self.pending)
+
+class TestExportWorker(unittest.TestCase):
+
+    def run_until_idle(self, master, worker):
+        while master.pending:
+            callback = master.pending.pop(0)
+            callback()
+            if worker.running:
+                threading.Event().wait(0.01)
+
+    def test_progress_and_result_arrive_on_poll(self):
+        master = DummyMaster()
+        worker = ExportWorker(master)
+        events = []
+
+        def job(name, progress):
+            progress(1, 2)
+            progress(2, 2)
+            return name.upper()
+
+        worker.submit(job, "pdf", on_progress=lambda done, total: events.append((done, total)),
+                      on_done=events.append)
+        self.assertEqual(events, [])  # nimic nu rulează în afara buclei Tk
+        self.run_until_idle(master, worker)
+        self.assertEqual(events, [(1, 2), (2, 2), "PDF"])
+        self.assertEqual(worker.running, 0)
+
+    def test_errors_are_reported(self):
+        master = DummyMaster()
+        worker = ExportWorker(master)
+        errors = []
+
+        def job(progress):
+            raise OSError("disc plin")
+
+        with self.assertLogs(level="ERROR"):
+            worker.submit(job, on_error=errors.append)
+            self.run_until_idle(master, worker)
+        self.assertIsInstance(errors[0], OSError)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from app.classes.live_results_server import LiveResultsServer
+
+class TestLiveResultsServer(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        page_path = os.path.join(self.folder.name, "live.html")
+        with open(page_path, "w", encoding="utf-8") as page:
+            page.write("<html>Rezultate live</html>")
+        self.server = LiveResultsServer("127.0.0.1", 0, page_path=page_path)
+        self.server.start()
+        self.remaining = 240
+        self.server.results.provide("/timer.json", lambda: {"remaining": self.remaining})
+
+    def tearDown(self):
+        self.server.stop()
+        self.folder.cleanup()
+
+    def get(self, path, **headers):
+        request = urllib.request.Request(self.server.url.rstrip("/") + path, headers=headers)
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as error:
+            return error.code, error.headers, b""
+
+    def test_serves_page_and_published_json(self):
+        status, _, body = self.get("/")
+        self.assertEqual((status, body), (200, "<html>Rezultate live</html>".encode()))
+
+        self.server.results.publish("/ranking.json", {"rows": [{"rank": 1, "name": "Ana"}]})
+        status, headers, body = self.get("/ranking.json")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-Type"], "application/json; charset=utf-8")
+        self.assertEqual(json.loads(body), {"rows": [{"rank": 1, "name": "Ana"}]})
+        self.assertEqual(self.get("/nimic.json")[0], 404)
+
+    def test_etag_answers_304_until_content_changes(self):
+        self.server.results.publish("/state.json", {"round": "Runda 1"})
+        etag = self.get("/state.json")[1]["ETag"]
+        self.assertEqual(self.get("/state.json", **{"If-None-Match": etag})[0], 304)
+
+        # aceeași stare republicată: tot 304; stare nouă: 200 cu alt ETag
+        self.server.results.publish("/state.json", {"round": "Runda 1"})
+        self.assertEqual(self.get("/state.json", **{"If-None-Match": etag})[0], 304)
+        self.server.results.publish("/state.json", {"round": "Runda 2"})
+        status, headers, _ = self.get("/state.json", **{"If-None-Match": etag})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers["ETag"], etag)
+
+    def test_timer_is_read_on_request(self):
+        etag = self.get("/timer.json")[1]["ETag"]
+        self.assertEqual(self.get("/timer.json", **{"If-None-Match": etag})[0], 304)
+        self.remaining = 239
+        status, _, body = self.get("/timer.json", **{"If-None-Match": etag})
+        self.assertEqual((status, json.loads(body)), (200, {"remaining": 239}))
+
+    def test_large_responses_are_gzipped(self):
+        rows = [{"rank": i, "name": f"Concurent {i}"} for i in range(200)]
+        self.server.results.publish("/ranking.json", {"rows": rows})
+        status, headers, body = self.get("/ranking.json", **{"Accept-Encoding": "gzip"})
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(body))["rows"], rows)
+
+if __name__ == '__main__':
+    unittest.main()
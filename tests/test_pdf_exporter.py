@@ -0,0 +1,60 @@
+import os
+import re
+import tempfile
+import unittest
+from reportlab.platypus import Flowable
+from app.classes.pdf_exporter import PdfExporter, StreamingDocTemplate
+from app.classes.ranking_snapshot import RankingSnapshot
+
+class TestPdfExporter(unittest.TestCase):
+
+    def snapshot(self, count):
+        rows = [(i + 1, f"C{i + 1}", "Club", [25.0, 9.9], 34.9) for i in range(count)]
+        return RankingSnapshot("Clasament", ["T1", "T2"], rows)
+
+    def test_one_table_per_page_with_progress(self):
+        progress = []
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "clasament.pdf")
+            PdfExporter().write(self.snapshot(200), path, progress=lambda done, total: progress.append((done, total)))
+            with open(path, "rb") as pdf:
+                pages = int(re.search(rb"/Count (\d+)", pdf.read()).group(1))
+        # fiecare tabel încape pe pagina lui, deci câte o pagină pentru fiecare raport de progres
+        self.assertEqual(pages, len(progress))
+        self.assertGreater(pages, 1)
+        self.assertEqual(progress[-1], (200, 200))
+
+    def test_empty_ranking_still_writes_header(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "gol.pdf")
+            PdfExporter().write(self.snapshot(0), path)
+            self.assertTrue(os.path.getsize(path) > 0)
+
+    def test_streaming_template_pulls_lazily(self):
+        pulled = []
+        drawn = []
+
+        class Mark(Flowable):
+            def __init__(self, index):
+                super().__init__()
+                self.index = index
+
+            def wrap(self, available_width, available_height):
+                return 10, 10
+
+            def draw(self):
+                drawn.append((self.index, len(pulled)))
+
+        def source():
+            for i in range(50):
+                pulled.append(i)
+                yield Mark(i)
+
+        with tempfile.TemporaryDirectory() as folder:
+            StreamingDocTemplate(os.path.join(folder, "lazy.pdf"), lookahead=2).build(source())
+        self.assertEqual([index for index, _ in drawn], list(range(50)))
+        # cel mult `lookahead` flowables scoase din generator înaintea celui desenat
+        self.assertTrue(all(count <= index + 2 for index, count in drawn))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import random
+import unittest
+from app.classes.ranking_index import RankingIndex
+
+class TestRankingIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = RankingIndex(["T1", "T2"])
+        self.index.rebuild({
+            "C1": {"T1": 10, "T2": 5},
+            "C2": {"T1": 20, "T2": "T2"},  # butonul fără scor are textul traseului
+            "C3": {},
+        })
+
+    def test_totals_ignore_non_numeric_scores(self):
+        self.assertEqual(self.index.total("C1"), 15)
+        self.assertEqual(self.index.total("C2"), 20)
+        self.assertEqual(self.index.total("C3"), 0)
+
+    def test_set_score_moves_competitor(self):
+        self.index.set_score("C3", "T1", 24.9)
+        self.assertEqual(self.index.rank("C3"), 1)
+        self.assertEqual([comp for _, comp, _ in self.index.ranked()], ["C3", "C2", "C1"])
+
+    def test_ties_share_rank(self):
+        self.index.set_score("C1", "T2", 10)
+        self.assertEqual(self.index.ranked(), [(1, "C1", 20), (1, "C2", 20), (3, "C3", 0)])
+        self.assertEqual(self.index.top(2), [(1, "C1", 20), (1, "C2", 20)])
+
+    def test_ranked_subset(self):
+        self.assertEqual(self.index.ranked(["C3", "C1", "C9"]), [(1, "C1", 15), (2, "C3", 0), (2, "C9", 0)])
+
+    def test_slices_match_full_ranking(self):
+        index = RankingIndex(["T1"])
+        index.rebuild({f"C{i}": {"T1": i % 4} for i in range(20)})
+        ranked = index.ranked()
+        self.assertEqual(index[5:12], ranked[5:12])
+        self.assertEqual(index[7], ranked[7])
+        self.assertEqual(len(index), 20)
+
+    def test_matches_full_sort_after_random_updates(self):
+        rng = random.Random(0)
+        routes = [f"T{i}" for i in range(1, 6)]
+        index = RankingIndex(routes)
+        scores = {f"C{i}": {} for i in range(50)}
+        index.rebuild(scores)
+
+        for _ in range(500):
+            comp, route = rng.choice(list(scores)), rng.choice(routes)
+            scores[comp][route] = rng.choice([0, 9.5, 10, 24.8, 25])
+            index.set_score(comp, route, scores[comp][route])
+
+        totals = {comp: sum(scores[comp].get(route, 0) for route in routes) for comp in scores}
+        expected = sorted(scores, key=lambda c: totals[c], reverse=True)
+        self.assertEqual([totals[c] for c in expected], [total for _, _, total in index.ranked()])
+        for comp in scores:
+            better = sum(1 for other in scores if totals[other] > totals[comp])
+            self.assertEqual(index.rank(comp), better + 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from app.classes.ranking_manager import RankingManager
+from app.classes.score_events import REFRESH
 
 class DummyLabel:
     def __init__(self):
@@ -38,4 +39,47 @@ class TestRankingManager(unittest.TestCase):
     def test_update_ranking_order(self):
         self.rm.update_ranking_order()
         self.assertEqual(self.rm.rankings_widgets["C2"]["rank"].text, "1")
-        self.assertEqual(self.rm.rankings_widgets["C1"]["rank"].text, "2")
\ No newline at end of file
+        self.assertEqual(self.rm.rankings_widgets["C1"]["rank"].text, "2")
+
+    def test_record_score_publishes_only_changes(self):
+        received = []
+        self.rm.score_events.subscribe(received.append)
+        self.rm.record_score("C1", "T1", 10)  # același scor, nimic nou
+        self.rm.record_score("C1", "T1", 24)
+        self.assertEqual(received, [{("C1", "T1"): 24}])
+
+        self.rm.record_scores([("C1", "T2", 1), ("C2", "T2", 2)])
+        self.assertEqual(received[-1], {("C1", "T2"): 1, ("C2", "T2"): 2})
+        self.assertEqual(self.rm.ranking_index().total("C1"), 25)
+
+    def test_ranking_index_rebuilt_after_scores_cleared(self):
+        self.assertEqual(self.rm.ranking_index().total("C2"), 30)
+        # reset-ul golește scorurile, apoi clasamentul re-adaugă concurenții fără scoruri
+        self.app.route_scores.clear()
+        for competitor in ("C1", "C2"):
+            self.app.route_scores[competitor] = {}
+        self.assertEqual(self.rm.ranking_index().total("C2"), 0)
+        self.assertEqual([total for _, _, total in self.rm.ranking_index().ranked()], [0, 0])
+
+        self.rm.record_score("C1", "T1", 25)
+        self.assertEqual(self.rm.ranking_index().total("C1"), 25)
+        self.assertEqual(self.rm.ranking_index().rank("C1"), 1)
+
+    def test_clear_scores_refreshes_subscribers(self):
+        received = []
+        self.rm.score_events.subscribe(received.append)
+        self.rm.clear_scores()
+        self.assertEqual(received, [{REFRESH: None}])
+        self.assertEqual([total for _, _, total in self.rm.live_ranking(["C1", "C2"])], [0, 0])
+
+    def test_previous_round_breaks_ties_in_live_ranking(self):
+        # Runda anterioară: C2 (30 p) înaintea lui C1 (15 p)
+        self.rm.close_round()
+        self.assertEqual(self.rm.previous_round_ranks, {"C2": 1, "C1": 2})
+
+        # Runda nouă: același top pentru amândoi, deci decide runda anterioară
+        self.rm.clear_scores()
+        self.rm.record_scores([("C1", "T1", 25), ("C2", "T1", 25)])
+        self.assertEqual(self.rm.live_ranking()[:], [(1, "C2", 25), (2, "C1", 25)])
+        self.assertEqual(self.rm.live_ranking(["C1", "C2"]), [(1, "C2", 25), (2, "C1", 25)])
+        self.assertEqual([(rank, name) for rank, name, _, _ in self.rm.standings()], [(1, "C2"), (2, "C1")])
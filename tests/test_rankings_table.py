@@ -0,0 +1,102 @@
+import unittest
+import tkinter as tk
+from app.classes.rankings_table import RankingsTable
+from app.classes.virtual_rankings_table import VirtualRankingsTable
+from app.classes.canvas_rankings_table import CanvasRankingsTable
+
+FONTS = {"header": ("Helvetica", 12), "cell": ("Helvetica", 10)}
+
+def details_from(scores):
+    return lambda competitor: ("CS", scores[competitor])
+
+class TestRankingsTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tk.Tk()
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+    def setUp(self):
+        self.frame = tk.Frame(self.root)
+        self.table = RankingsTable(self.frame, FONTS, "lightblue")
+
+    def test_refresh_reuses_widgets(self):
+        scores = {"Ana": [25, None], "Bogdan": [0, None]}
+        self.table.render(["T1", "T2"], [(1, "Ana", 25), (2, "Bogdan", 0)], details_from(scores))
+        children = self.frame.winfo_children()
+
+        scores["Bogdan"] = [0, 24.9]
+        self.table.render(["T1", "T2"], [(1, "Bogdan", 24.9), (2, "Ana", 25)], details_from(scores))
+        self.assertEqual(self.frame.winfo_children(), children)
+        self.assertEqual(self.table.rows["Bogdan"].position, 1)
+        self.assertEqual(self.table.rows["Ana"].position, 2)
+        self.assertEqual(self.table.rows["Bogdan"].total.cget("text"), "24.9")
+
+    def test_unchanged_cells_are_not_repainted(self):
+        details = details_from({"Ana": [25]})
+        self.table.render(["T1"], [(1, "Ana", 25)], details)
+        canvas, _, text = self.table.rows["Ana"].cells[0]
+        canvas.itemconfig(text, text="marker")
+
+        self.table.render(["T1"], [(1, "Ana", 25)], details)
+        self.assertEqual(canvas.itemcget(text, "text"), "marker")
+
+    def test_rows_of_removed_competitors_are_recycled(self):
+        details = details_from({"Ana": [25], "Carla": [10]})
+        self.table.render(["T1"], [(1, "Ana", 25)], details)
+        row = self.table.rows["Ana"]
+
+        self.table.render(["T1"], [(1, "Carla", 10)], details)
+        self.assertIs(self.table.rows["Carla"], row)
+        self.assertEqual(row.name.cget("text"), "Carla")
+
+    def test_virtual_table_materializes_only_visible_rows(self):
+        table = VirtualRankingsTable(self.frame, FONTS, "lightblue", overscan=2)
+        table.visible_rows = 10
+        ranking = [(i + 1, f"C{i}", 300 - i) for i in range(300)]
+        table.render(["T1"], ranking, lambda competitor: ("CS", [1]))
+        self.assertEqual(len(table.slots), 12)
+
+        table.scroll_to(100)
+        self.assertEqual(table.slots[0].name.cget("text"), "C100")
+        self.assertEqual(len(table.slots), 12)
+
+        table.scroll_to(10**6)
+        self.assertTrue(table.at_bottom)
+        self.assertEqual(table.top, 290)
+
+    def test_canvas_table_reuses_items(self):
+        table = CanvasRankingsTable(self.frame, FONTS, "lightblue", overscan=2)
+        table.visible_rows = 5
+        ranking = [(i + 1, f"C{i}", 100 - i) for i in range(100)]
+        table.render(["T1", "T2"], ranking, lambda competitor: ("CS", [25, None]))
+        items = table.canvas.find_all()
+
+        table.scroll_by(3)
+        table.render(["T1", "T2"], ranking, lambda competitor: ("CS", [9.5, 0]))
+        self.assertEqual(table.canvas.find_all(), items)
+        self.assertEqual(table.canvas.itemcget(table.slots[0].items["name"], "text"), "C3")
+        self.assertEqual(self.frame.winfo_children(), [table.canvas])
+
+    def test_canvas_table_scrolls_by_fractions_of_a_row(self):
+        table = CanvasRankingsTable(self.frame, FONTS, "lightblue", overscan=2)
+        table.visible_rows = 5
+        ranking = [(i + 1, f"C{i}", 100 - i) for i in range(100)]
+        table.render(["T1"], ranking, lambda competitor: ("CS", [25]))
+        name = table.slots[0].items["name"]
+        y = table.canvas.coords(name)[1]
+
+        table.scroll_by(0.5)
+        self.assertEqual(table.first, 0)
+        self.assertEqual(table.canvas.coords(name)[1], y - round(0.5 * table.row_height))
+
+        table.scroll_by(0.75)
+        self.assertEqual(table.first, 1)
+        self.assertEqual(table.canvas.itemcget(name, "text"), "C1")
+        self.assertEqual(table.canvas.coords(name)[1], y - round(0.25 * table.row_height))
+
+if __name__ == "__main__":
+    unittest.main()
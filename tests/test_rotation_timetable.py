@@ -0,0 +1,54 @@
+import unittest
+from app.classes.contest_engine import ContestEngine, VirtualClock
+from app.classes.rotation_timetable import RotationTimetable
+
+class TestRotationTimetable(unittest.TestCase):
+
+    def assert_matches_direct_logic(self, contest_type, competitors, routes):
+        names = [f"C{i}" for i in range(competitors)]
+        engine = ContestEngine()
+        engine.setup(contest_type, names, routes)
+        reference = ContestEngine()
+        reference.setup(contest_type, names, routes)
+
+        for rotation in range(competitors + 4 * routes + 2):
+            engine.rotation_contest = rotation
+            for comp, state in engine.timetable.changes_at(rotation):
+                engine._set_state(comp, state)
+
+            reference.rotation_contest = rotation
+            for routes_list, group in reference.contest_groups().values():
+                reference.run_competitor_logic(routes_list, group)
+
+            self.assertEqual([comp["state"] for comp in engine.contest_competitors],
+                             [comp["state"] for comp in reference.contest_competitors],
+                             f"{contest_type}: rotation {rotation}")
+            for name in names:
+                self.assertEqual(engine.timetable.state_at(name, rotation),
+                                 next(comp["state"] for comp in engine.contest_competitors if comp["name"] == name))
+
+    def test_matches_direct_logic_for_every_contest_type(self):
+        self.assert_matches_direct_logic("semifinals", 7, 4)
+        self.assert_matches_direct_logic("finals", 5, 3)
+        self.assert_matches_direct_logic("qualifiers", 9, 5)
+
+    def test_rotation_for_and_finish_rotation(self):
+        competitors = [{"name": f"C{i}"} for i in range(6)]
+        timetable = RotationTimetable("semifinals", {None: (["T1", "T2", "T3"], competitors)})
+
+        # C2 pornește la rotația 2 și schimbă traseul la fiecare 2 rotații
+        self.assertEqual(timetable.rotation_for("C2", "T1"), 2)
+        self.assertEqual(timetable.rotation_for("C2", "T3"), 6)
+        self.assertIsNone(timetable.rotation_for("C2", "T9"))
+
+        # Ultimul concurent e pe T3 la rotația 5 + 4
+        self.assertEqual(timetable.finish_rotation(), 9)
+
+    def test_finish_rotation_matches_engine_run(self):
+        engine = ContestEngine(clock=VirtualClock())
+        engine.setup("semifinals", [f"C{i}" for i in range(6)], 3)
+        expected = engine.timetable.finish_rotation()
+        engine.start()
+        engine.run()
+        # Rotația `expected` a fost ultima aplicată înainte de finalul concursului
+        self.assertEqual(engine.rotation_contest, expected + 1)
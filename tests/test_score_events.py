@@ -0,0 +1,49 @@
+import unittest
+from app.classes.score_events import ScoreEventBus, REFRESH
+
+class TestScoreEventBus(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduled = []
+        self.bus = ScoreEventBus(schedule=self.scheduled.append)
+        self.received = []
+        self.bus.subscribe(self.received.append)
+
+    def test_changes_are_coalesced_until_flush(self):
+        self.bus.publish("C1", "T1", 10)
+        self.bus.publish("C2", "T1", 5)
+        self.bus.publish("C1", "T1", 12)
+        self.assertEqual(len(self.scheduled), 1)
+        self.assertEqual(self.received, [])
+
+        self.scheduled.pop()()
+        self.assertEqual(self.received, [{("C1", "T1"): 12, ("C2", "T1"): 5}])
+
+    def test_batch_delivers_once_at_exit(self):
+        bus = ScoreEventBus()
+        received = []
+        bus.subscribe(received.append)
+        with bus.batch():
+            bus.publish("C1", "T1", 1)
+            bus.publish("C1", "T2", 2)
+            self.assertEqual(received, [])
+        self.assertEqual(received, [{("C1", "T1"): 1, ("C1", "T2"): 2}])
+
+    def test_unsubscribed_and_failing_callbacks(self):
+        def broken(changes):
+            raise RuntimeError("boom")
+        self.bus.subscribe(broken)
+        self.bus.unsubscribe(self.received.append)
+        self.bus.publish("C1", "T1", 1)
+        with self.assertLogs(level="ERROR"):
+            self.bus.flush()
+        self.assertEqual(self.received, [])
+
+    def test_refresh_is_delivered_with_scores(self):
+        self.bus.publish("Ana", "T1", 25)
+        self.bus.refresh()
+        self.bus.flush()
+        self.assertEqual(self.received, [{("Ana", "T1"): 25, REFRESH: None}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+from app.classes.score_matrix import ScoreMatrix
+
+class TestScoreMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.scores = ScoreMatrix.from_dict({
+            "C1": {"T1": 10, "T2": 5},
+            "C2": {"T1": 20},
+            "C3": {},
+        }, routes=["T1", "T2"])
+
+    def test_dict_facade(self):
+        self.assertEqual(list(self.scores), ["C1", "C2", "C3"])
+        self.assertEqual(dict(self.scores["C1"]), {"T1": 10, "T2": 5})
+        self.assertEqual(self.scores["C2"].get("T2", "T2"), "T2")
+        self.assertEqual(self.scores.get("C9", {}), {})
+
+        self.scores.setdefault("C4", {})["T2"] = 24.9
+        self.scores["C3"]["T1"] = "T1"  # textul butonului nu e scor
+        self.assertEqual(dict(self.scores["C4"]), {"T2": 24.9})
+        self.assertEqual(dict(self.scores["C3"]), {})
+
+        del self.scores["C1"]
+        self.assertEqual(list(self.scores), ["C2", "C3", "C4"])
+        self.assertEqual(dict(self.scores["C4"]), {"T2": 24.9})
+
+    def test_view_in_route_order_does_not_move_columns(self):
+        self.scores["C3"]["T3"] = 7
+        layout = list(self.scores._routes)
+        values, present = self.scores.view(["T3", "T1", "T9"])
+        self.assertEqual(values.tolist(), [[0, 10, 0], [0, 20, 0], [7, 0, 0]])
+        self.assertEqual(present.tolist(), [[False, True, False], [False, True, False], [True, False, False]])
+        self.assertEqual(self.scores._routes, layout)
+
+        # După set_routes, traseele concursului sunt primele coloane: vederea nu mai copiază
+        self.scores.set_routes(["T3", "T1"])
+        values, _ = self.scores.view(["T3", "T1"])
+        self.assertTrue(np.shares_memory(values, self.scores.values))
+        self.assertEqual(values.tolist(), [[0, 10], [0, 20], [7, 0]])
+        self.assertEqual(dict(self.scores["C1"]), {"T1": 10, "T2": 5})
+
+    def test_ranking_with_ties(self):
+        self.scores["C3"]["T2"] = 15
+        self.assertEqual(self.scores.totals(["T1", "T2"]).tolist(), [15, 20, 15])
+        self.assertEqual(self.scores.ranking(routes=["T1", "T2"]),
+                         [(1, "C2", 20.0, 1), (2, "C1", 15.0, 0), (2, "C3", 15.0, 2)])
+
+    def test_ranking_subset_with_unknown_names(self):
+        ranking = self.scores.ranking(["C9", "C1"], ["T1", "T2"])
+        self.assertEqual(ranking, [(1, "C1", 15.0, 0), (2, "C9", 0.0, None)])
+
+    def test_grows_past_capacity(self):
+        scores = ScoreMatrix(capacity=2)
+        for i in range(20):
+            scores[f"C{i}"] = {f"T{j}": i for j in range(12)}
+        self.assertEqual(scores.totals()[-1], 19 * 12)
+        self.assertEqual(len(scores["C5"]), 12)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,16 @@
+import unittest
+from app.simulate import simulate_contest, run_simulation
+
+class TestSimulate(unittest.TestCase):
+
+    def test_qualifiers_run_both_rounds(self):
+        result = simulate_contest("qualifiers", 8, 4, seed=1)
+        self.assertTrue(result["finished"])
+        self.assertEqual(result["rounds"], 2)
+        self.assertGreater(result["rotations"], 0)
+        self.assertGreater(result["peak_memory"], 0)
+
+    def test_cli_runs_every_combination(self):
+        results = run_simulation(["--competitors", "4", "6", "--routes", "2", "--type", "semifinals", "finals"])
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result["finished"] for result in results))
@@ -1,9 +1,11 @@
 import unittest
+from unittest.mock import patch
 from app.classes.timer import Timer
 
 class DummyApp:
     def __init__(self):
         self.canvas = DummyCanvas()
+        self.master = DummyMaster()
         self.bar = "bar"
         self.time_text = "text"
         self.control_timer_var = DummyVar()
@@ -11,8 +13,13 @@ class DummyApp:
         self.green_color = "green"
         self.black_color = "black"
         self.white_color = "white"
+        self.contest_type = "semifinals"
+        self.transits = 0
+        self.rotations = 0
 
     def update_display_window_contest(self): pass
+    def update_transit_status(self): self.transits += 1
+    def run_competitor_logic_general(self): self.rotations += 1
 
 class DummyCanvas:
     def itemconfig(self, *args, **kwargs): pass
@@ -21,6 +28,10 @@ class DummyCanvas:
     def winfo_height(self): return 20
     def update_idletasks(self): pass
 
+class DummyMaster:
+    def after(self, delay, func, *args): return "after-id"
+    def after_cancel(self, after_id): pass
+
 class DummyVar:
     def set(self, value): pass
 
@@ -29,7 +40,50 @@ class TestTimer(unittest.TestCase):
     def setUp(self):
         self.app = DummyApp()
         self.timer = Timer(self.app, None, None, None)
+        self.beeps = []
+        self.timer.beep = self.beeps.append
+        self.timer.flash_bar_background_color = lambda duration: None
+
+        # Rotația reală e testată în test_contest_engine; aici doar numărăm tranzițiile
+        engine = self.timer.engine
+        engine.update_transit_status = self.app.update_transit_status
+        engine.run_competitor_logic_general = self.app.run_competitor_logic_general
+        engine.run_contest_finish = lambda: False
 
     def test_adjust_time(self):
         self.timer.adjust_time(100)
-        self.assertEqual(self.timer.remaining_time, 100)
\ No newline at end of file
+        self.assertEqual(self.timer.remaining_time, 100)
+
+    @patch("app.classes.contest_engine.time.monotonic")
+    def test_late_tick_catches_up_without_drift(self, monotonic):
+        monotonic.return_value = 0.0
+        self.timer.running = True
+        self.timer.preview_completed = True
+        self.timer.remaining_time = 240
+        self.timer.countdown("4min")
+
+        # Tk blocat 10 s după finalul rutei: tranzitul a început la 240, nu la 250
+        monotonic.return_value = 250.0
+        self.timer._tick()
+        self.assertEqual(self.app.transits, 1)
+        self.assertEqual(self.app.rotations, 0)
+        self.assertEqual(self.timer.countdown_type, "transit")
+        self.assertEqual(self.timer.remaining_time, 5)
+
+        # 3/2/1 și beep-ul de final s-au auzit o singură dată
+        self.assertEqual(self.beeps, [1.0, 0.5, 0.5, 0.5, 1.0])
+
+    @patch("app.classes.contest_engine.time.monotonic")
+    def test_stall_across_phases_runs_each_transition_once(self, monotonic):
+        monotonic.return_value = 0.0
+        self.timer.running = True
+        self.timer.preview_completed = True
+        self.timer.remaining_time = 240
+        self.timer.countdown("4min")
+
+        monotonic.return_value = 256.0
+        self.timer._tick()
+        self.assertEqual(self.app.transits, 1)
+        self.assertEqual(self.app.rotations, 1)
+        self.assertEqual(self.timer.countdown_type, "4min")
+        self.assertEqual(self.timer.remaining_time, 239)
@@ -40,4 +40,13 @@ class TestUi(unittest.TestCase):
     def test_configure_grid(self):
         frame = self.ui.create_frame("grid", row=0, column=0)
         self.ui.configure_grid(frame, grid_type="row", positions=[0, 1], weights=[1, 2])
-        self.ui.configure_grid(frame, grid_type="col", positions=[0], weights=[1])
\ No newline at end of file
+        self.ui.configure_grid(frame, grid_type="col", positions=[0], weights=[1])
+
+    def test_create_section_reuses_labels(self):
+        frame = self.ui.create_frame("section", row=0, column=0)
+        self.ui.create_section(frame, 0, 0, "Trasee", "T1: Ana", ("Helvetica", 20))
+        widget_count = len(frame.winfo_children())
+
+        details = self.ui.create_section(frame, 0, 0, "Trasee", "T1: Bogdan", ("Helvetica", 30))
+        self.assertEqual(len(frame.winfo_children()), widget_count)
+        self.assertEqual(details.cget("text"), "T1: Bogdan")